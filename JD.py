@@ -6,9 +6,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import pandas as pd
+import sys
 import time
 import re
 import random
@@ -18,25 +17,55 @@ from urllib.parse import urljoin
 import json
 from collections import Counter
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('multi_job_crawler.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from log_setup import setup_logging, new_run_id, SAMPLED
+from driver_profile import get_profile, apply_to_options, enable_resource_blocking, page_transfer_stats
+from driver_pool import DriverPool, resolve_driver_path, is_dead_session_error
+from detail_archive import DetailArchive, DEFAULT_ARCHIVE
+from detail_extraction import DetailExtractor
+from field_extraction import card_fields, POSTING_ID_PATTERN
+from enrichment import (INFERRED, normalize_deadline, finalize_provenance,
+                        card_fingerprint, content_fingerprint, provenance_counts)
+
 logger = logging.getLogger(__name__)
 
-class MultiJobCategoryCrawler:
-    def __init__(self):
+class MultiJobCategoryCrawler(DetailExtractor):
+    def __init__(self, profile: str = "full", headless: bool = False,
+                 max_pages_per_driver: int = 150, max_driver_rss_mb: float = 1500, warm_spares: int = 0,
+                 archive_path: str = DEFAULT_ARCHIVE, parser_backend: str = "auto",
+                 incremental: bool = False, recheck_days: int = 7):
         self.base_url = "https://career.rememberapp.co.kr"
         self.job_data = []
         self.driver = None
         self.wait = None
+        self.pool = None
         self.excluded_count = 0
         
+        # 드라이버 프로필 (리소스 차단 / page load 전략 / 헤드리스) - 'full' 이면 기존 동작
+        self.profile = get_profile(profile, headless)
+        self.profile_root = f"browser_profiles/{self.profile.name}"
+        self.page_stats = {'pages': 0, 'bytes': 0, 'requests': 0, 'unmeasured': 0}
+        
+        # 드라이버 풀 설정 (N 페이지 / RSS 초과 시 재생성, 예비 인스턴스 수)
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_driver_rss_mb = max_driver_rss_mb
+        self.warm_spares = warm_spares
+        
+        # 상세 페이지 원본 보관소 (None 이면 보관 안 함, 첫 저장 시 열림)
+        self.archive_path = archive_path
+        self.archive = None
+        self.archive_stats = {'pages': 0, 'new': 0}
+        
+        # 증분 수집: 목록 카드가 이전과 같고 recheck_days 안에 확인한 공고는 상세 페이지 재방문 생략
+        self.incremental = incremental
+        self.recheck_days = recheck_days
+        self.change_stats = {'new': 0, 'changed': 0, 'unchanged': 0, 'reused': 0}
+        
+        # 병렬 모드에서 워커들이 공유하는 페이지 이동 간격 (category_parallel.PolitenessBudget)
+        self.politeness = None
+        
+        # 상세 페이지 HTML 파서 (selectolax > lxml > html.parser, 추출 결과는 동일)
+        super().__init__(parser_backend)
+        
         # 🎯 크롤링할 특정 직무 목록
         self.target_job_categories = {
             "서비스기획·운영": "https://career.rememberapp.co.kr/job/postings?search=%7B%22jobCategoryNames%22%3A%5B%7B%22level1%22%3A%22%EC%84%9C%EB%B9%84%EC%8A%A4%EA%B8%B0%ED%9A%8D%C2%B7%EC%9A%B4%EC%98%81%22%7D%5D%7D",
@@ -45,8 +74,8 @@ class MultiJobCategoryCrawler:
             "마케팅·광고": "https://career.rememberapp.co.kr/job/postings?search=%7B%22jobCategoryNames%22%3A%5B%7B%22level1%22%3A%22%EB%A7%88%EC%BC%80%ED%8C%85%C2%B7%EA%B4%91%EA%B3%A0%22%7D%5D%7D"
         }
         
-    def setup_stealth_driver(self):
-        """완전 스텔스 모드 드라이버"""
+    def build_chrome_options(self, profile_dir=None):
+        """스텔스 Chrome 옵션 (profile_dir: 재사용할 user-data-dir)"""
         chrome_options = Options()
         
         # 스텔스 설정
@@ -55,7 +84,13 @@ class MultiJobCategoryCrawler:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--window-size=1920,1080')
+        
+        # 프로필: 창 크기 / page load 전략 / 헤드리스 / 이미지 차단
+        apply_to_options(chrome_options, self.profile)
+        
+        # 재시작해도 디스크 캐시/쿠키 유지
+        if profile_dir:
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
         
         # SSL 및 네트워크 오류 해결
         chrome_options.add_argument('--ignore-ssl-errors=yes')
@@ -71,79 +106,196 @@ class MultiJobCategoryCrawler:
         user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         chrome_options.add_argument(f'user-agent={user_agent}')
         chrome_options.add_argument('--lang=ko-KR')
-        
+        return chrome_options
+
+    def create_driver(self, profile_dir=None):
+        """드라이버 풀 팩토리: 스텔스 드라이버 1개 생성"""
+        driver_path = resolve_driver_path()  # 최초 1회만 확인 후 캐시
+        service = Service(driver_path) if driver_path else Service()
+        driver = webdriver.Chrome(service=service, options=self.build_chrome_options(profile_dir))
+        
+        # 이미지/폰트/트래커 요청 차단 (CDP)
+        enable_resource_blocking(driver, self.profile)
+        
+        # JavaScript 스텔스 설정
+        driver.execute_script("""
+            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [
+                    {name: 'Chrome PDF Plugin'},
+                    {name: 'Chrome PDF Viewer'},
+                    {name: 'Native Client'}
+                ]
+            });
+            Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US']});
+        """)
+        return driver
+
+    def setup_stealth_driver(self):
+        """완전 스텔스 모드 드라이버 (드라이버 풀에서 관리)"""
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # JavaScript 스텔스 설정
-            self.driver.execute_script("""
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        {name: 'Chrome PDF Plugin'},
-                        {name: 'Chrome PDF Viewer'},
-                        {name: 'Native Client'}
-                    ]
-                });
-                Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US']});
-            """)
-            
-            self.wait = WebDriverWait(self.driver, 20)
-            logger.info("🥷 스텔스 모드 드라이버 설정 완료!")
+            self.pool = DriverPool(self.create_driver,
+                                   profile_root=self.profile_root,
+                                   max_pages=self.max_pages_per_driver,
+                                   max_rss_mb=self.max_driver_rss_mb,
+                                   warm_spares=self.warm_spares)
+            self.use_driver(self.pool.start())
+            logger.info(f"🥷 스텔스 모드 드라이버 설정 완료! (프로필 '{self.profile.name}', "
+                        f"{self.profile.page_load_strategy}, 헤드리스 {self.profile.headless})")
             return True
             
         except Exception as e:
             logger.error(f"드라이버 설정 실패: {e}")
             return False
 
-    def is_excluded_job(self, job_text, job_title, company_name):
-        """헤드헌터 공고 및 해외 근무 제외 필터"""
-        
-        # 헤드헌터 관련 키워드
-        headhunter_keywords = [
-            '헤드헌터', '헤드헌팅', 'headhunter', 'headhunting',
-            '인재개발', '인사컨설팅', '채용대행', '서치펌',
-            '스카우트', 'scout', '리크루터', 'recruiter',
-            '인력파견', '파견', '용역', '아웃소싱'
-        ]
-        
-        # 해외 근무 관련 키워드
-        overseas_keywords = [
-            '해외근무', '해외파견', '해외출장', '국외근무',
-            '중국', '일본', '미국', '유럽', '동남아', '베트남', '태국', '인도네시아',
-            '싱가포르', '말레이시아', '필리핀', '인도', '캐나다', '호주',
-            'china', 'japan', 'usa', 'vietnam', 'thailand', 'singapore',
-            '해외사업', '글로벌', '국제', 'overseas', 'global', 'international'
-        ]
-        
-        # 전체 텍스트를 소문자로 변환해서 체크
-        full_text = f"{job_title} {company_name} {job_text}".lower()
-        
-        # 헤드헌터 체크
-        for keyword in headhunter_keywords:
-            if keyword.lower() in full_text:
-                return True, "헤드헌터"
-        
-        # 해외 근무 체크
-        for keyword in overseas_keywords:
-            if keyword.lower() in full_text:
-                return True, "해외근무"
-        
-        return False, None
+    def use_driver(self, driver):
+        if driver is not self.driver:
+            self.driver = driver
+            self.wait = WebDriverWait(self.driver, 20)
+
+    def ensure_driver(self):
+        """페이지 이동 전 상태 점검 (죽었거나 오래 쓴 인스턴스는 교체)"""
+        if self.pool:
+            self.use_driver(self.pool.acquire())
+        return self.driver
+
+    def recover_driver(self, error):
+        """세션이 죽은 오류면 드라이버를 교체하고 True"""
+        if not self.pool or not is_dead_session_error(error):
+            return False
+        logger.warning(f"⚠️ 브라우저 세션 종료 감지 - 재생성: {error}")
+        self.pool.stats['crashes'] += 1
+        self.use_driver(self.pool.recycle("세션 종료"))
+        return True
+
+    def pace(self, scroll=False):
+        """공유 politeness 예산이 있으면 순서를 기다림 (병렬 모드, scroll=True 는 목록 스크롤 간격)"""
+        if self.politeness is not None:
+            self.politeness.wait(scroll=scroll)
+
+    def open_url(self, url):
+        """페이지 이동 (공유 politeness 예산 적용)"""
+        self.pace()
+        self.driver.get(url)
+
+    def spawn_worker(self, name):
+        """병렬 모드 워커: 같은 설정 + 전용 브라우저 프로필 폴더 + 공유 politeness 예산"""
+        worker = MultiJobCategoryCrawler(profile=self.profile.name, headless=self.profile.headless,
+                                         max_pages_per_driver=self.max_pages_per_driver,
+                                         max_driver_rss_mb=self.max_driver_rss_mb, warm_spares=self.warm_spares,
+                                         archive_path=self.archive_path, parser_backend=self.parser_backend,
+                                         incremental=self.incremental, recheck_days=self.recheck_days)
+        worker.profile = self.profile
+        worker.profile_root = f"{self.profile_root}/{name}"
+        worker.politeness = self.politeness
+        worker.target_job_categories = self.target_job_categories
+        return worker
+
+    def merge_worker_stats(self, worker):
+        """워커의 제외/전송량/보관/변경 감지 통계 합산"""
+        self.excluded_count += worker.excluded_count
+        for stats, worker_stats in ((self.page_stats, worker.page_stats), (self.archive_stats, worker.archive_stats),
+                                    (self.change_stats, worker.change_stats)):
+            for key, value in worker_stats.items():
+                stats[key] = stats.get(key, 0) + value
+
+    def record_page_load(self):
+        """현재 페이지 전송량 누적 (프로필 효과 확인용)"""
+        stats = page_transfer_stats(self.driver)
+        if self.pool:
+            self.pool.page_done()
+        self.page_stats['pages'] += 1
+        self.page_stats['bytes'] += stats['bytes']
+        self.page_stats['requests'] += stats['requests']
+        self.page_stats['unmeasured'] += stats['unmeasured']
+        return stats
+
+    # 목록 카드 증분 수집기: MutationObserver 가 새로 붙은 공고 링크만 대기열에 넣고,
+    # 스크롤마다 drain 으로 대기열의 카드 정보만 꺼낸다 (전체 XPath 재탐색 없음).
+    # 가상 리스트가 위쪽 카드를 DOM 에서 떼어내도 이미 꺼낸 카드는 Python 쪽에 남는다.
+    HARVESTER_INSTALL_SCRIPT = """
+        if (window.__jobHarvest) { return window.__jobHarvest.seen.size; }
+        const SELECTOR = "a[href*='/job/postings/']";
+        const harvest = window.__jobHarvest = {seen: new Set(), pending: []};
+        const enqueue = (a) => {
+            const m = (a.getAttribute('href') || '').match(/\\/job\\/postings\\/(\\d+)/);
+            if (m && !harvest.seen.has(m[1])) { harvest.seen.add(m[1]); harvest.pending.push([m[1], a]); }
+        };
+        document.querySelectorAll(SELECTOR).forEach(enqueue);
+        harvest.observer = new MutationObserver((mutations) => {
+            for (const mutation of mutations) {
+                for (const node of mutation.addedNodes) {
+                    if (node.nodeType !== 1) continue;
+                    if (node.matches(SELECTOR)) enqueue(node);
+                    node.querySelectorAll(SELECTOR).forEach(enqueue);
+                }
+            }
+        });
+        harvest.observer.observe(document.body, {childList: true, subtree: true});
+        return harvest.seen.size;
+    """
+
+    HARVESTER_DRAIN_SCRIPT = """
+        const harvest = window.__jobHarvest;
+        if (!harvest) { return null; }
+        // 셀렉터 순서대로 첫 요소의 텍스트 길이를 확인 (기존 find_element 규칙과 동일)
+        const firstText = (root, selectors, minLen, maxLen) => {
+            for (const selector of selectors) {
+                const el = root.querySelector(selector);
+                const text = el ? (el.innerText || el.textContent || '').trim() : '';
+                if (text.length >= minLen && text.length <= maxLen) return text;
+            }
+            return '';
+        };
+        const cards = harvest.pending.splice(0).map(([id, a]) => {
+            const card = a.closest("li, div[class*='job'], div[class*='card']") || a;
+            return {
+                id: id,
+                href: a.href,
+                title: firstText(card, ['h1', 'h2', 'h3', 'h4', "[class*='title']", 'strong'], 3, 99),
+                company: firstText(card, ["[class*='company']", "[class*='corp']"], 2, 1000),
+                text: (card.innerText || card.textContent || '').trim(),
+            };
+        });
+        return {cards: cards, seen: harvest.seen.size};
+    """
+
+    def install_card_harvester(self) -> bool:
+        """현재 목록 페이지에 증분 수집기 설치"""
+        try:
+            self.driver.execute_script(self.HARVESTER_INSTALL_SCRIPT)
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ 카드 수집기 설치 실패 - 스크롤 후 일괄 추출로 대체: {e}")
+            return False
+
+    def drain_card_harvester(self, harvested: dict) -> int:
+        """새로 보인 카드만 꺼내 harvested(공고ID → 카드)에 추가, 지금까지 본 카드 수 반환"""
+        result = self.driver.execute_script(self.HARVESTER_DRAIN_SCRIPT)
+        if not result:
+            return len(harvested)
+        for card in result['cards']:
+            harvested.setdefault(card['id'], card)
+        return result['seen']
 
     def scroll_page_naturally(self):
-        """자연스러운 스크롤링"""
+        """자연스러운 스크롤링 (스크롤마다 새 카드만 증분 수집, 공고ID → 카드 dict 반환)"""
         logger.info("🖱️ 자연스러운 스크롤링 시작...")
         
         time.sleep(random.uniform(3, 5))
         last_job_count = 0
         stable_count = 0
+        harvested = {}
+        use_harvester = self.install_card_harvester()
         
         for scroll_attempt in range(50):
-            current_jobs = len(self.driver.find_elements(By.XPATH, "//a[contains(@href, '/job/postings/')]"))
+            if use_harvester:
+                current_jobs = self.drain_card_harvester(harvested)
+            else:
+                current_jobs = len(self.driver.find_elements(By.XPATH, "//a[contains(@href, '/job/postings/')]"))
             
-            # 다양한 스크롤 패턴
+            # 다양한 스크롤 패턴 (스크롤이 목록 API 요청을 부르므로 병렬 모드에서는 예산 순서를 기다림)
+            self.pace(scroll=True)
             scroll_amount = random.randint(800, 1500)
             self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
             
@@ -151,7 +303,7 @@ class MultiJobCategoryCrawler:
             time.sleep(random.uniform(2, 4))
             
             if current_jobs > last_job_count:
-                logger.info(f"📊 {current_jobs}개 채용공고 발견 (스크롤 {scroll_attempt + 1}회)")
+                logger.info("📊 %d개 채용공고 발견 (스크롤 %d회)", current_jobs, scroll_attempt + 1, extra=SAMPLED)
                 last_job_count = current_jobs
                 stable_count = 0
             else:
@@ -160,6 +312,46 @@ class MultiJobCategoryCrawler:
             if stable_count >= 5:
                 logger.info(f"✅ 스크롤 완료 - 총 {current_jobs}개 채용공고")
                 break
+        
+        if use_harvester:
+            self.drain_card_harvester(harvested)
+            self.driver.execute_script("window.__jobHarvest && window.__jobHarvest.observer.disconnect();")
+            return harvested
+        return None
+
+    def fill_from_card_text(self, job_info, all_text):
+        """카드 혼합 텍스트에서 마감일/지역/경력 분리 (제외 대상이면 사유 반환)"""
+        # 🚫 제외 필터 적용
+        is_excluded, exclude_reason = self.is_excluded_job(all_text, job_info['공고명'], job_info['회사명'])
+        if is_excluded:
+            return exclude_reason
+        
+        # 패턴: "D-13﹒서울 영등포구﹒7년 이상" (없으면 마감일/지역/경력 개별 패턴)
+        job_info.update(card_fields(all_text))
+        return None
+
+    def extract_harvested_job_info(self, category_name, harvested):
+        """증분 수집된 카드(공고ID → 카드)에서 기본 정보 추출 (WebDriver 왕복 없음)"""
+        logger.info(f"📋 기본 정보 추출 및 필터링 중... (수집 카드 {len(harvested)}개)")
+        
+        category_jobs = []
+        category_excluded = 0
+        for job_id, card in harvested.items():
+            job_info = self.new_job_info(category_name)
+            job_info['공고ID'] = job_id
+            job_info['link'] = card.get('href', '')
+            job_info['공고명'] = card.get('title', '')
+            job_info['회사명'] = card.get('company', '')
+            exclude_reason = self.fill_from_card_text(job_info, card.get('text', ''))
+            if exclude_reason:
+                logger.debug(f"제외된 공고: {job_info['공고명']} - {exclude_reason}")
+                category_excluded += 1
+                continue
+            category_jobs.append(job_info)
+        
+        self.excluded_count += category_excluded
+        logger.info(f"✅ '{category_name}' 필터링 완료: {len(category_jobs)}개 수집, {category_excluded}개 제외")
+        return category_jobs
 
     def extract_basic_job_info(self, category_name):
         """기본 정보 추출"""
@@ -173,28 +365,7 @@ class MultiJobCategoryCrawler:
         
         for idx, link_element in enumerate(job_links):
             try:
-                # 완전한 정보 구조
-                job_info = {
-                    '공고ID': '',
-                    '공고명': '',
-                    '회사명': '', 
-                    '지역': '',
-                    '직무': '',
-                    '경력요건': '',
-                    '학력요건': '',
-                    '채용유형': '',
-                    '공고시작일': '',
-                    '마감일': '',
-                    '합격축하금': '',
-                    '직무카테고리': category_name,
-                    '공고소개': '',
-                    '주요업무': '',
-                    '자격요건': '',
-                    '우대사항': '',
-                    '채용절차': '',
-                    'link': '',
-                    'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
+                job_info = self.new_job_info(category_name)
                 
                 # 링크에서 공고ID 추출
                 try:
@@ -202,7 +373,7 @@ class MultiJobCategoryCrawler:
                     job_info['link'] = href
                     
                     # URL에서 공고ID 추출: /job/postings/123456
-                    id_match = re.search(r'/job/postings/(\d+)', href)
+                    id_match = POSTING_ID_PATTERN.search(href)
                     if id_match:
                         job_info['공고ID'] = id_match.group(1)
                 except:
@@ -240,34 +411,11 @@ class MultiJobCategoryCrawler:
                 
                 # 혼합 텍스트에서 정보 분리
                 try:
-                    all_text = parent.text
-                    
-                    # 🚫 제외 필터 적용
-                    is_excluded, exclude_reason = self.is_excluded_job(all_text, job_info['공고명'], job_info['회사명'])
-                    if is_excluded:
+                    exclude_reason = self.fill_from_card_text(job_info, parent.text)
+                    if exclude_reason:
                         logger.debug(f"제외된 공고: {job_info['공고명']} - {exclude_reason}")
                         category_excluded += 1
                         continue
-                    
-                    # 패턴: "D-13﹒서울 영등포구﹒7년 이상"
-                    mixed_pattern = re.search(r'(D-\d+)﹒([^﹒]+)﹒([^﹒]+)', all_text)
-                    if mixed_pattern:
-                        job_info['마감일'] = mixed_pattern.group(1)
-                        job_info['지역'] = mixed_pattern.group(2)
-                        job_info['경력요건'] = mixed_pattern.group(3)
-                    else:
-                        # 개별 패턴 찾기
-                        deadline_match = re.search(r'(D-\d+|상시채용|\d{4}-\d{2}-\d{2})', all_text)
-                        if deadline_match:
-                            job_info['마감일'] = deadline_match.group(1)
-                        
-                        location_match = re.search(r'(서울[^﹒]*|경기[^﹒]*|인천[^﹒]*|부산[^﹒]*|원격근무|재택)', all_text)
-                        if location_match:
-                            job_info['지역'] = location_match.group(1)
-                        
-                        career_match = re.search(r'(\d+년[^﹒]*|신입[^﹒]*|경력[^﹒]*|\d+~\d+년)', all_text)
-                        if career_match:
-                            job_info['경력요건'] = career_match.group(1)
                 except:
                     pass
                 
@@ -284,77 +432,108 @@ class MultiJobCategoryCrawler:
         logger.info(f"✅ '{category_name}' 필터링 완료: {len(category_jobs)}개 수집, {category_excluded}개 제외")
         return category_jobs
 
-    def extract_detailed_sections(self, soup, page_text):
-        """상세 섹션별 정보 추출"""
-        sections = {
-            '공고소개': '',
-            '주요업무': '',
-            '자격요건': '',
-            '우대사항': '',
-            '채용절차': ''
-        }
-        
+    def open_archive(self):
+        """보관소 (archive_path 가 None 이면 None, 처음 쓸 때 열림)"""
+        if self.archive is None and self.archive_path:
+            self.archive = DetailArchive(self.archive_path)
+        return self.archive
+
+    def archive_detail_page(self, job, html):
+        """상세 페이지 원본 HTML 보관 (같은 내용이면 본문은 다시 저장하지 않음)"""
+        if not self.archive_path or not html:
+            return
         try:
-            # 섹션 헤더를 찾아서 다음 내용 추출
-            section_headers = {
-                '공고소개': ['공고소개', '회사소개', '기업소개', '소개'],
-                '주요업무': ['주요업무', '업무내용', '담당업무', '주요 업무', '업무'],
-                '자격요건': ['자격요건', '지원자격', '필수자격', '자격 요건', '요구사항'],
-                '우대사항': ['우대사항', '우대조건', '우대 사항', '선호사항', '플러스'],
-                '채용절차': ['채용절차', '전형절차', '채용 절차', '전형과정', '선발과정']
-            }
-            
-            # HTML에서 구조화된 정보 찾기
-            for section_name, keywords in section_headers.items():
-                section_content = ''
-                
-                # 방법 1: 헤더 태그 다음의 내용 찾기
-                for keyword in keywords:
-                    # h1~h6, div, span 등에서 키워드 찾기
-                    header_elements = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span', 'p'], 
-                                                  string=re.compile(keyword, re.IGNORECASE))
-                    
-                    for header in header_elements:
-                        # 헤더 다음 형제 요소들에서 내용 수집
-                        content_parts = []
-                        current = header.next_sibling
-                        
-                        while current and len(content_parts) < 10:  # 최대 10개 요소
-                            if hasattr(current, 'get_text'):
-                                text = current.get_text().strip()
-                                if text and len(text) > 10:  # 의미있는 텍스트만
-                                    content_parts.append(text)
-                                    
-                                # 다음 섹션 헤더를 만나면 중단
-                                if any(kw in text for kw_list in section_headers.values() for kw in kw_list if kw != keyword):
-                                    break
-                            current = current.next_sibling
-                        
-                        if content_parts:
-                            section_content = ' '.join(content_parts)
-                            break
-                    
-                    if section_content:
-                        break
+            self.open_archive()
+            posting_id = job.get('공고ID') or job.get('link', '')
+            _, is_new = self.archive.put(posting_id, html, url=job.get('link', ''), job=job)
+            self.archive_stats['pages'] += 1
+            self.archive_stats['new'] += int(is_new)
+        except Exception as e:
+            logger.warning(f"⚠️ 상세 페이지 보관 실패: {e}")
+
+    def reuse_unchanged(self, job):
+        """증분 수집: 목록 카드가 이전 수집과 같고 최근에 확인한 공고면 이전 추출 결과, 아니면 None"""
+        if not self.incremental or not job.get('공고ID'):
+            return None
+        try:
+            archive = self.open_archive()
+            previous = archive.previous_record(job['공고ID']) if archive else None
+        except Exception as e:
+            logger.warning(f"⚠️ 이전 수집 결과 조회 실패: {e}")
+            return None
+        if not previous or previous['card_hash'] != card_fingerprint(job):
+            return None
+        checked_at = datetime.strptime(previous['checked_at'], '%Y-%m-%d %H:%M:%S')
+        if datetime.now() - checked_at > timedelta(days=self.recheck_days):
+            return None
+        self.change_stats['reused'] += 1
+        return previous['job']
+
+    def record_change(self, card_hash, job):
+        """추출 결과 지문을 이전 수집과 비교해 기록 (신규 / 변경 / 동일)"""
+        job['내용해시'] = content_fingerprint(job)
+        if not self.archive_path or not job.get('공고ID'):
+            return
+        try:
+            status = self.open_archive().put_record(job['공고ID'], card_hash, job['내용해시'], job)
+            self.change_stats[status] += 1
+        except Exception as e:
+            logger.warning(f"⚠️ 변경 기록 실패: {e}")
+
+    def load_detail_page(self, job):
+        """
+        상세 페이지 로드 (SSL 오류 재시도 / 크래시 복구) 후 원본 HTML 보관, HTML 반환.
+        모든 재시도가 실패하면 None (오류/빈 페이지를 공고 HTML 로 보관하지 않음)
+        """
+        # SSL 오류 대비 재시도 로직 + 더 긴 대기
+        max_retries = 3
+        loaded = False
+        for retry in range(max_retries):
+            try:
+                self.ensure_driver()
+                self.open_url(job['link'])
+                # 페이지 완전 로딩 대기 (더 긴 시간)
+                time.sleep(random.uniform(8, 12))
                 
-                # 방법 2: 정규식으로 텍스트에서 섹션 찾기
-                if not section_content:
-                    for keyword in keywords:
-                        pattern = rf'{keyword}[:\s]*([^가-힣]*(?:[가-힣][^가-힣]*)*?)(?=(?:{"│".join(sum(section_headers.values(), []))})|$)'
-                        matches = re.findall(pattern, page_text, re.DOTALL | re.IGNORECASE)
-                        if matches:
-                            section_content = matches[0].strip()
-                            # 너무 길면 앞부분만
-                            if len(section_content) > 1000:
-                                section_content = section_content[:1000] + "..."
-                            break
+                # JavaScript 실행 완료 대기
+                self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+                time.sleep(random.uniform(2, 4))  # 추가 대기
+                self.record_page_load()
                 
-                sections[section_name] = section_content
-            
-        except Exception as e:
-            logger.debug(f"섹션 추출 중 오류: {e}")
+                # 페이지 로드 성공하면 break
+                loaded = True
+                break
+            except Exception as e:
+                if self.recover_driver(e):
+                    # 브라우저 크래시 - 새 인스턴스로 같은 공고 재시도
+                    continue
+                if "net_error" in str(e) or "SSL" in str(e) or "handshake failed" in str(e):
+                    logger.warning(f"SSL 오류 발생, 재시도 {retry + 1}/{max_retries}: {e}")
+                    if retry < max_retries - 1:
+                        time.sleep(random.uniform(10, 15))  # 더 긴 대기
+                        continue
+                    else:
+                        logger.error(f"SSL 오류로 스킵: {job.get('공고명', 'Unknown')}")
+                        continue
+                else:
+                    raise e
+        
+        if not loaded:
+            logger.warning(f"⚠️ 상세 페이지 로드 실패 ({max_retries}회 시도): {job.get('공고명', 'Unknown')}")
+            return None
         
-        return sections
+        # 원본 HTML 보관 (추출기 개선 시 재크롤링 없이 재추출)
+        html = self.driver.page_source
+        self.archive_detail_page(job, html)
+        return html
+
+    def fallback_basic_job(self, job):
+        """상세 페이지 실패 시 목록 카드 정보만으로 저장할 공고 (상세 필드는 missing, 변경 기록 없음)"""
+        if self.is_excluded_job(job.get('공고명', ''), job.get('회사명', ''), '')[0]:
+            return None
+        job['마감일'], deadline_source = normalize_deadline(job['마감일'], job.get('crawled_at'))
+        finalize_provenance(job, {'마감일': deadline_source})
+        return job
 
     def enhance_with_detailed_info(self, jobs_list, max_detail=40):
         """개별 페이지에서 상세 정보 수집"""
@@ -365,175 +544,32 @@ class MultiJobCategoryCrawler:
         
         for idx, job in enumerate(jobs_list[:enhance_count]):
             try:
-                logger.info(f"📄 상세 페이지 방문: {idx + 1}/{enhance_count} - {job.get('공고명', 'Unknown')}")
-                
-                # SSL 오류 대비 재시도 로직 + 더 긴 대기
-                max_retries = 3
-                for retry in range(max_retries):
-                    try:
-                        self.driver.get(job['link'])
-                        # 페이지 완전 로딩 대기 (더 긴 시간)
-                        time.sleep(random.uniform(8, 12))
-                        
-                        # JavaScript 실행 완료 대기
-                        self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-                        time.sleep(random.uniform(2, 4))  # 추가 대기
-                        
-                        # 페이지 로드 성공하면 break
-                        break
-                    except Exception as e:
-                        if "net_error" in str(e) or "SSL" in str(e) or "handshake failed" in str(e):
-                            logger.warning(f"SSL 오류 발생, 재시도 {retry + 1}/{max_retries}: {e}")
-                            if retry < max_retries - 1:
-                                time.sleep(random.uniform(10, 15))  # 더 긴 대기
-                                continue
-                            else:
-                                logger.error(f"SSL 오류로 스킵: {job.get('공고명', 'Unknown')}")
-                                continue
-                        else:
-                            raise e
+                # 목록 카드가 그대로면 이전 결과 재사용 (증분 수집)
+                card_hash = card_fingerprint(job)
+                previous = self.reuse_unchanged(job)
+                if previous is not None:
+                    logger.debug(f"변경 없음 - 상세 페이지 생략: {job.get('공고명', 'Unknown')}")
+                    enhanced_jobs.append(previous)
+                    continue
                 
-                # 페이지 전체 텍스트 가져오기
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                page_text = soup.get_text()
+                logger.info("📄 상세 페이지 방문: %d/%d - %s", idx + 1, enhance_count, job.get('공고명', 'Unknown'), extra=SAMPLED)
+                html = self.load_detail_page(job)
+                if html is None:
+                    # 로드 실패 - 기본 정보만 저장
+                    basic_job = self.fallback_basic_job(job)
+                    if basic_job is not None:
+                        enhanced_jobs.append(basic_job)
+                    continue
                 
-                # 🚫 상세 페이지에서도 제외 필터 재적용
-                is_excluded, exclude_reason = self.is_excluded_job(page_text, job['공고명'], job['회사명'])
-                if is_excluded:
+                # 🚫 상세 페이지 제외 필터 + 필드 추출
+                result, exclude_reason = self.extract_from_html(job, html)
+                if result is None:
                     logger.debug(f"상세 페이지에서 제외: {job['공고명']} - {exclude_reason}")
                     self.excluded_count += 1
                     continue
                 
-                # 1. 공고명 보완 (다양한 방법 시도)
-                if not job['공고명']:
-                    title_strategies = [
-                        ("h1", "메인 제목"),
-                        ("h2", "부제목"),
-                        (".job-title", "job-title 클래스"),
-                        ("[class*='title']", "title 포함 클래스"),
-                        ("[data-testid*='title']", "title 테스트 ID"),
-                        ("strong", "강조 텍스트"),
-                        (".posting-title", "posting-title 클래스"),
-                        ("h3", "h3 제목")
-                    ]
-                    
-                    for selector, desc in title_strategies:
-                        try:
-                            title_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            title_text = title_elem.text.strip()
-                            if title_text and len(title_text) > 3 and len(title_text) < 200:
-                                job['공고명'] = title_text
-                                logger.debug(f"제목 추출 성공 ({desc}): {title_text}")
-                                break
-                        except:
-                            continue
-                    
-                    # 여전히 제목이 없으면 페이지 제목에서 추출
-                    if not job['공고명']:
-                        try:
-                            page_title = self.driver.title
-                            if page_title and "리멤버" not in page_title:
-                                # 페이지 제목에서 불필요한 부분 제거
-                                clean_title = re.sub(r'\s*-\s*리멤버.*', '', page_title)
-                                clean_title = re.sub(r'\s*\|\s*.*', '', clean_title)
-                                if clean_title and len(clean_title) > 3:
-                                    job['공고명'] = clean_title.strip()
-                                    logger.debug(f"페이지 제목에서 추출: {clean_title}")
-                        except:
-                            pass
-                
-                # 2. 회사명 보완 (강화된 방법)
-                if not job['회사명']:
-                    company_strategies = [
-                        ("[class*='company']", "company 클래스"),
-                        ("[class*='corp']", "corp 클래스"),
-                        ("[class*='brand']", "brand 클래스"),
-                        ("[data-testid*='company']", "company 테스트 ID"),
-                        (".company-name", "company-name 클래스"),
-                        (".employer", "employer 클래스")
-                    ]
-                    
-                    for selector, desc in company_strategies:
-                        try:
-                            company_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            company_text = company_elem.text.strip()
-                            if company_text and len(company_text) > 1 and len(company_text) < 100:
-                                job['회사명'] = company_text
-                                logger.debug(f"회사명 추출 성공 ({desc}): {company_text}")
-                                break
-                        except:
-                            continue
-                    
-                    # 여전히 회사명이 없으면 텍스트 패턴으로 찾기
-                    if not job['회사명']:
-                        company_patterns = [
-                            r'([가-힣]+\s*주식회사)',
-                            r'(\([주]\)\s*[가-힣]+)',
-                            r'(㈜\s*[가-힣]+)',
-                            r'([A-Za-z]+\s*Inc\.?)',
-                            r'([A-Za-z]+\s*Corp\.?)',
-                            r'([A-Za-z]+\s*Ltd\.?)',
-                            r'([A-Za-z]+\s*Co\.?,?\s*Ltd\.?)'
-                        ]
-                        
-                        for pattern in company_patterns:
-                            matches = re.findall(pattern, page_text)
-                            if matches:
-                                # 가장 자주 나오는 회사명 선택
-                                company_counter = Counter(matches)
-                                most_common = company_counter.most_common(1)[0][0]
-                                job['회사명'] = most_common.strip()
-                                logger.debug(f"패턴으로 회사명 추출: {most_common}")
-                                break
-                
-                # 3. 직무 분야 추출
-                job_category_patterns = [
-                    r'(프론트엔드|백엔드|풀스택|데이터|AI|머신러닝|DevOps|모바일|iOS|안드로이드|서비스기획|상품기획|마케팅|디자인|HR|영업|경영지원)',
-                    r'(개발자|엔지니어|기획자|디자이너|매니저|팀장|대리|과장|차장|부장)'
-                ]
-                for pattern in job_category_patterns:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    if matches:
-                        job['직무'] = ', '.join(list(set(matches[:3])))  # 최대 3개
-                        break
-                
-                # 4. 학력 요건
-                education_pattern = r'(고졸|전문학사|학사|석사|박사|대졸|대학교|학력무관)'
-                education_matches = re.findall(education_pattern, page_text)
-                if education_matches:
-                    job['학력요건'] = education_matches[0]
-                
-                # 5. 채용 유형
-                employment_pattern = r'(정규직|계약직|인턴|파트타임|프리랜서|임시직)'
-                employment_matches = re.findall(employment_pattern, page_text)
-                if employment_matches:
-                    job['채용유형'] = employment_matches[0]
-                else:
-                    job['채용유형'] = '정규직'  # 기본값
-                
-                # 6. 공고 시작일 (현재 날짜로 추정)
-                if not job['공고시작일']:
-                    job['공고시작일'] = datetime.now().strftime('%Y-%m-%d')
-                
-                # 7. 마감일 정규화
-                if job['마감일'] and job['마감일'].startswith('D-'):
-                    try:
-                        days_left = int(job['마감일'][2:])
-                        deadline_date = datetime.now() + timedelta(days=days_left)
-                        job['마감일'] = deadline_date.strftime('%Y-%m-%d')
-                    except:
-                        pass
-                
-                # 8. 합격축하금 (랜덤하게 일부 회사에만)
-                if random.random() < 0.3:  # 30% 확률
-                    job['합격축하금'] = random.choice([100000, 200000, 300000, 500000])
-                
-                # ⭐ 9. 상세 섹션 정보 추출 (새로 추가!)
-                detailed_sections = self.extract_detailed_sections(soup, page_text)
-                for section_name, content in detailed_sections.items():
-                    job[section_name] = content
-                
-                enhanced_jobs.append(job)
+                self.record_change(card_hash, result)
+                enhanced_jobs.append(result)
                 
                 # 매 5번째마다 중간 휴식 (더 자주)
                 if (idx + 1) % 5 == 0:
@@ -546,8 +582,9 @@ class MultiJobCategoryCrawler:
                 else:
                     logger.debug(f"상세 페이지 처리 오류: {e}")
                 # 오류가 있어도 기본 정보는 저장
-                if not self.is_excluded_job(job.get('공고명', ''), job.get('회사명', ''), '')[0]:
-                    enhanced_jobs.append(job)
+                basic_job = self.fallback_basic_job(job)
+                if basic_job is not None:
+                    enhanced_jobs.append(basic_job)
                 continue
         
         logger.info(f"✅ 상세 정보 수집 완료: {len(enhanced_jobs)}개")
@@ -559,15 +596,26 @@ class MultiJobCategoryCrawler:
             logger.info(f"🎯 '{category_name}' 직무 크롤링 시작...")
             logger.info(f"📍 URL: {category_url}")
             
-            # 페이지 이동
-            self.driver.get(category_url)
-            time.sleep(random.uniform(5, 8))
-            
-            # 스크롤링으로 모든 채용공고 로드
-            self.scroll_page_naturally()
+            # 페이지 이동 + 스크롤링으로 모든 채용공고 로드 (스크롤마다 새 카드 증분 수집)
+            for attempt in range(2):
+                try:
+                    self.ensure_driver()
+                    self.open_url(category_url)
+                    time.sleep(random.uniform(5, 8))
+                    harvested = self.scroll_page_naturally()
+                    self.record_page_load()
+                    break
+                except Exception as e:
+                    # 브라우저 크래시면 새 인스턴스로 한 번 더
+                    if attempt == 0 and self.recover_driver(e):
+                        continue
+                    raise
             
-            # 기본 정보 추출
-            category_jobs = self.extract_basic_job_info(category_name)
+            # 기본 정보 추출 (수집기 설치 실패 시 DOM 일괄 추출)
+            if harvested is not None:
+                category_jobs = self.extract_harvested_job_info(category_name, harvested)
+            else:
+                category_jobs = self.extract_basic_job_info(category_name)
             
             logger.info(f"✅ '{category_name}' 기본 정보 수집 완료: {len(category_jobs)}개")
             return category_jobs
@@ -576,6 +624,23 @@ class MultiJobCategoryCrawler:
             logger.error(f"❌ '{category_name}' 크롤링 중 오류: {e}")
             return []
 
+    @staticmethod
+    def clean_job_row(job):
+        """CSV 저장용 행 (내부 필드 제외, 공백 정리, 긴 텍스트 자름)"""
+        cleaned_job = {}
+        for key, value in job.items():
+            if key in ['link', 'crawled_at']:  # 내부 필드 제외
+                continue
+            if isinstance(value, str):
+                cleaned_value = value.strip()
+                # 너무 긴 텍스트는 줄임
+                if len(cleaned_value) > 2000:
+                    cleaned_value = cleaned_value[:2000] + "..."
+                cleaned_job[key] = cleaned_value if cleaned_value else ''
+            else:
+                cleaned_job[key] = value if value is not None else ''
+        return cleaned_job
+
     def save_complete_results(self):
         """완전한 결과 저장"""
         if not self.job_data:
@@ -586,21 +651,7 @@ class MultiJobCategoryCrawler:
         filename = f"multi_job_category_{timestamp}.csv"
         
         # 데이터 정제
-        cleaned_data = []
-        for job in self.job_data:
-            cleaned_job = {}
-            for key, value in job.items():
-                if key in ['link', 'crawled_at']:  # 내부 필드 제외
-                    continue
-                if isinstance(value, str):
-                    cleaned_value = value.strip()
-                    # 너무 긴 텍스트는 줄임
-                    if len(cleaned_value) > 2000:
-                        cleaned_value = cleaned_value[:2000] + "..."
-                    cleaned_job[key] = cleaned_value if cleaned_value else ''
-                else:
-                    cleaned_job[key] = value if value is not None else ''
-            cleaned_data.append(cleaned_job)
+        cleaned_data = [self.clean_job_row(job) for job in self.job_data]
         
         # CSV 저장 (UTF-8 BOM으로 한글 호환)
         df = pd.DataFrame(cleaned_data)
@@ -612,6 +663,12 @@ class MultiJobCategoryCrawler:
         logger.info(f"📊 총 채용공고: {len(df)}개")
         logger.info(f"🚫 제외된 공고: {self.excluded_count}개 (헤드헌터/해외근무)")
         
+        # 필드 출처 (추론 / 누락 값 개수)
+        provenance = provenance_counts(self.job_data)
+        inferred = {field: c[INFERRED] for field, c in provenance.items() if c[INFERRED]}
+        if inferred:
+            logger.info(f"🧾 추론한 값: {', '.join(f'{k} {v}개' for k, v in inferred.items())}")
+        
         # 각 컬럼 완성도
         core_columns = ['공고ID', '공고명', '회사명', '지역', '직무', '경력요건', '학력요건', '채용유형', '마감일', '직무카테고리']
         detail_columns = ['공고소개', '주요업무', '자격요건', '우대사항', '채용절차']
@@ -645,20 +702,50 @@ class MultiJobCategoryCrawler:
         
         logger.info(f"🚫 전체 제외된 공고: {self.excluded_count}개")
         logger.info(f"✅ 최종 수집된 공고: {len(self.job_data)}개")
+        if self.page_stats['pages']:
+            logger.info(f"📦 페이지 {self.page_stats['pages']}개, 전송량 {self.page_stats['bytes'] / 1024 / 1024:.1f} MB 이상 "
+                        f"(페이지당 {self.page_stats['bytes'] / self.page_stats['pages'] / 1024:.0f} KB, "
+                        f"크기 미확인 교차 출처 요청 {self.page_stats['unmeasured']}개, 프로필 '{self.profile.name}')")
+        if self.archive_stats['pages']:
+            logger.info(f"🗄️ 상세 페이지 보관: {self.archive_stats['pages']}개 "
+                        f"(새 내용 {self.archive_stats['new']}개, 나머지는 기존 내용과 동일)")
+        if any(self.change_stats.values()):
+            logger.info(f"🔁 변경 감지: 신규 {self.change_stats['new']}개, 변경 {self.change_stats['changed']}개, "
+                        f"동일 {self.change_stats['unchanged']}개, 상세 생략(재사용) {self.change_stats['reused']}개")
+        if self.pool:
+            report = self.pool.report()
+            logger.info(f"🚗 드라이버 풀: 생성 {report['created']}회, 재생성 {report['recycled']}회, "
+                        f"크래시 복구 {report['crashes']}회, 현재 RSS {report['rss_mb']} MB")
 
     def cleanup(self):
         """리소스 정리"""
-        if self.driver:
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+            self.driver = None
+            logger.info("🔒 다중 직무 크롤러 종료")
+        elif self.driver:
             self.driver.quit()
             logger.info("🔒 다중 직무 크롤러 종료")
 
-    def run(self):
-        """다중 직무 카테고리 크롤링 실행"""
+    def run(self, parallel=False, detail_workers=2, streaming=False, fetch_workers=1):
+        """다중 직무 카테고리 크롤링 실행
+        parallel=True 면 카테고리 목록을 동시에 수집하고 상세 정보는 공유 큐로 바로 수집 (category_parallel)
+        streaming=True 면 단계 파이프라인으로 공고 단위로 흘려보내며 바로 저장 (stage_pipeline, 상세 브라우저 fetch_workers 개)"""
         try:
+            if parallel:
+                return self.run_parallel(detail_workers)
+            if streaming:
+                return self.run_streaming(fetch_workers=fetch_workers)
+            
             if not self.setup_stealth_driver():
                 return False
             
-            logger.info("🌐 다중 직무 카테고리 크롤링 시작...")
+            run_id = new_run_id()
+            logger.info(f"🌐 다중 직무 카테고리 크롤링 시작... (run_id={run_id})")
             logger.info(f"🎯 대상 직무: {', '.join(self.target_job_categories.keys())}")
             
             # 1단계: 모든 직무 카테고리에서 기본 정보 수집
@@ -710,8 +797,45 @@ class MultiJobCategoryCrawler:
         finally:
             self.cleanup()
 
+    def run_parallel(self, detail_workers=2):
+        """카테고리 병렬 모드: 목록 워커(카테고리별 브라우저) + 상세 워커가 공유 예산으로 동시에 진행"""
+        from category_parallel import crawl_categories_parallel
+        
+        run_id = new_run_id()
+        logger.info(f"🌐 다중 직무 카테고리 병렬 크롤링 시작... (run_id={run_id}, 상세 워커 {detail_workers}개)")
+        logger.info(f"🎯 대상 직무: {', '.join(self.target_job_categories.keys())}")
+        
+        self.job_data = crawl_categories_parallel(self, jobs_per_category=40, detail_workers=detail_workers)
+        if not self.job_data:
+            logger.warning("수집된 데이터가 없습니다.")
+            return False
+        
+        self.save_complete_results()
+        self.print_category_statistics()
+        return True
+
+    def run_streaming(self, fetch_workers=1, parse_mode="thread", parse_workers=1, warehouse_db=None):
+        """스트리밍 모드: 목록 → 상세 로드 → 추출 → 제외 → 변경 감지 → 저장을 크기 제한 큐로 연결
+        (전체 결과를 메모리에 모으지 않고, 처리된 공고는 바로 CSV/웨어하우스에 기록)"""
+        from stage_pipeline import run_remember_pipeline
+        
+        if not self.setup_stealth_driver():
+            return False
+        
+        run_id = new_run_id()
+        logger.info(f"🌐 다중 직무 카테고리 스트리밍 크롤링 시작... (run_id={run_id})")
+        logger.info(f"🎯 대상 직무: {', '.join(self.target_job_categories.keys())}")
+        
+        result = run_remember_pipeline(self, jobs_per_category=40, fetch_workers=fetch_workers,
+                                       parse_mode=parse_mode, parse_workers=parse_workers,
+                                       warehouse_db=warehouse_db)
+        logger.info(f"🚫 전체 제외된 공고: {self.excluded_count}개")
+        return result['saved'] > 0
+
 def main():
-    """메인 실행"""
+    """메인 실행 (--parallel: 카테고리 병렬 모드, --stream: 스트리밍 파이프라인 모드)"""
+    # 로깅 설정 (큐 기반 비동기, JSON Lines 파일 + 콘솔, 페이지 단위 로그 샘플링)
+    setup_logging('multi_job_crawler.jsonl')
     print("🎯 리멤버 특정 직무 크롤러 v4.0")
     print("📋 대상 직무: 서비스기획/운영, HR/총무, SW개발, 마케팅/광고")
     print("📊 수집 정보: 공고소개, 주요업무, 자격요건, 우대사항, 채용절차")
@@ -720,7 +844,7 @@ def main():
     print("-" * 70)
     
     crawler = MultiJobCategoryCrawler()
-    success = crawler.run()
+    success = crawler.run(parallel='--parallel' in sys.argv, streaming='--stream' in sys.argv)
     
     if success:
         print("\n🎉 특정 직무 크롤링 대성공!")
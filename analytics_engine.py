@@ -0,0 +1,553 @@
+"""
+채용공고 분석 엔진 (DuckDB, 인프로세스 컬럼형 벡터 실행)
+
+점핏 DB(jumpit_jobs.db)와 컬럼형 스냅샷(posting_snapshot.py)을 하나의 DuckDB 연결에 붙이고,
+소스별 컬럼 이름을 맞춘 postings 뷰 위에서 파라미터화된 리포트를 실행한다.
+집계는 DuckDB 가 모든 코어로 벡터 단위 실행하므로 수백만 행도 대화형으로 응답한다.
+
+- jumpit_live     : jumpit_jobs.db 의 job_postings (sqlite 확장으로 ATTACH, 확장을 못 받으면 필요한 컬럼만 읽어 등록)
+- snapshot_<소스> : 스냅샷 파티션 (parquet 는 read_parquet 으로 직접 스캔, arrow 는 memory map 한 Table 을 복사 없이 등록)
+- postings       : 위 관계들을 공통 컬럼으로 합친 뷰
+                   (source, title, company_name, company_key, location, career_level, tech_stacks,
+                    job_category, salary, salary_manwon, view_count, crawl_date, posting_key, first_seen)
+                   점핏은 DB 가 있으면 DB(최신), 없으면 스냅샷을 사용
+                   first_seen: 점핏 DB 는 posting_history 의 최초 관측일 (crawled_at 은 재수집마다 갱신됨),
+                               스냅샷은 파티션 날짜 (공고 키별 최소값은 리포트에서)
+
+리포트 (모두 pandas DataFrame 반환, 문자열 분해/정규화는 먼저 묶은 고유값에만 적용)
+재수집/스냅샷마다 반복되는 공고는 (source, posting_key) 별 최신 수집분 한 행으로 집계 (load_postings 와 같은 기준)
+- top_techs             : 기술 키워드 상위 N개
+- tech_trend            : 기간(day/week/month)별 기술 스택 공고 수 (공고별 최초 관측 기간에 한 번만 집계)
+- company_league        : 회사별 공고 수 순위 (점유율, 소스/지역 수, 평균 조회수)
+- salary_career_crosstab: 경력 구간 × 연봉 구간 교차표 (점핏 salary 는 합격축하금 금액)
+
+duckdb 미설치 시 AnalyticsEngine 생성에서 RuntimeError.
+
+사용법:
+    python analytics_engine.py techs [--top 15] [--source jumpit]
+    python analytics_engine.py trend [--period week] [--top 10] [--tech Python --tech Java]
+    python analytics_engine.py league [--top 20] [--tech Python] [--location 서울]
+    python analytics_engine.py crosstab [--source jumpit]
+    python analytics_engine.py sql "SELECT source, count(*) FROM postings GROUP BY 1"
+    공통 옵션: [--db jumpit_jobs.db] [--root snapshots] [--threads N] [--start 2025-01-01] [--end 2025-12-31]
+"""
+import os
+import time
+import sqlite3
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from posting_snapshot import (DEFAULT_ROOT, FORMAT_ARROW, FORMAT_PARQUET, POSTING_KEYS, SOURCE_JUMPIT,
+                              partition_values, read_snapshot, snapshot_files)
+
+try:
+    import duckdb
+except ImportError:  # 선택 의존성
+    duckdb = None
+
+logger = logging.getLogger(__name__)
+
+JUMPIT_RELATION = "jumpit_live"
+POSTINGS_VIEW = "postings"
+
+# 공통 컬럼 ← 소스별 후보 컬럼 (점핏 / 랠릿 / 리멤버 크롤러 CSV / 리멤버 분석 CSV 순, 처음 있는 것을 사용)
+COLUMN_CANDIDATES = {
+    'title': ('title', '공고명'),
+    'company_name': ('company_name', 'companyName', '회사명'),
+    'location': ('location', 'addressRegion', '지역'),
+    'career_level': ('career_level', 'jobLevels', '경력요건', 'job_rank_category'),
+    'tech_stacks': ('tech_stacks', 'jobSkillKeywords', '직무'),
+    'job_category': ('job_category', 'jobCategory', '직무카테고리', 'job_role'),
+    'salary': ('salary', '합격축하금'),
+    'view_count': ('view_count',),
+}
+CRAWLED_AT_CANDIDATES = ('crawled_at', 'crawledAt', 'updatedAt', 'createdAt')
+# 같은 공고를 여러 수집분에서 하나로 묶는 키 (점핏 / 리멤버)
+POSTING_KEY_CANDIDATES = ('position_id',) + tuple(POSTING_KEYS.values())
+
+# sqlite 확장을 쓸 수 없을 때 job_postings 에서 읽을 컬럼 (리포트에 필요한 것만)
+JUMPIT_COLUMNS = ('position_id', 'title', 'company_name', 'location', 'career_level', 'tech_stacks',
+                  'job_category', 'salary', 'view_count', 'bookmark_count', 'crawled_at', 'api_url')
+
+# 공고별 최초 관측 시각 (posting_history 는 신규 공고의 추적 필드 전체를 첫 수집 시각으로 기록)
+FIRST_SEEN_SQL = "SELECT position_id, min(observed_at) AS first_seen FROM {history} GROUP BY position_id"
+
+# 기술 스택 구분자 (점핏 ", ", 리멤버 직무 ", ", 랠릿 키워드 목록)
+TECH_SEPARATOR = r'\s*[,/|;·\n]+\s*'
+
+# 회사명 비교 키: 법인 표기/공백 제거 + 소문자 (job_matcher.normalize_company 의 SQL 근사)
+COMPANY_KEY_SQL = r"lower(regexp_replace(company_name, '\(주\)|㈜|주식회사|\(유\)|유한회사|\s', '', 'g'))"
+
+# salary → 만원 (점핏 "50만원" 형식, 리멤버 합격축하금은 원 단위 정수)
+SALARY_MANWON_SQL = r"""CASE WHEN salary LIKE '%만%'
+    THEN TRY_CAST(replace(regexp_extract(salary, '([0-9][0-9,]*)\s*만', 1), ',', '') AS DOUBLE)
+    ELSE TRY_CAST(replace(salary, ',', '') AS DOUBLE) / 10000 END"""
+
+# 연봉 구간 경계 (만원), 경력 구간 경계 (최소 연차)
+DEFAULT_SALARY_BANDS = (50, 100, 200)
+DEFAULT_CAREER_BANDS = (3, 6)
+PERIODS = ('day', 'week', 'month', 'quarter', 'year')
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+class AnalyticsEngine:
+    """점핏 DB + 컬럼형 스냅샷 위의 DuckDB 분석 엔진"""
+
+    def __init__(self, jumpit_db: Optional[str] = "jumpit_jobs.db", snapshot_root: str = DEFAULT_ROOT,
+                 threads: Optional[int] = None, memory_limit: Optional[str] = None):
+        if duckdb is None:
+            raise RuntimeError("분석 엔진에는 duckdb 패키지가 필요합니다 (pip install duckdb)")
+        self.conn = duckdb.connect(database=':memory:')
+        self.threads = int(threads or os.cpu_count() or 1)
+        self.conn.execute(f"SET threads = {self.threads}")
+        if memory_limit:
+            self.conn.execute(f"SET memory_limit = {_literal(memory_limit)}")
+        self.relations: Dict[str, str] = {}  # 소스 → postings 뷰에 들어가는 관계 이름
+        self._arrow_tables: Dict[str, object] = {}  # 등록한 Arrow Table 참조 유지
+
+        snapshot_sources = self.attach_snapshots(snapshot_root)
+        if self.attach_jumpit_db(jumpit_db):
+            self.relations[SOURCE_JUMPIT] = JUMPIT_RELATION
+        for source in snapshot_sources:
+            self.relations.setdefault(source, f"snapshot_{source}")
+        self.create_postings_view()
+        logger.info(f"🦆 분석 엔진 준비: {', '.join(f'{s}={r}' for s, r in self.relations.items()) or '데이터 없음'} "
+                    f"(스레드 {self.threads})")
+
+    # ------------------------------------------------------------------ 연결
+
+    def attach_jumpit_db(self, db_path: Optional[str]) -> bool:
+        """jumpit_jobs.db 의 job_postings → jumpit_live 뷰"""
+        if not db_path or not os.path.exists(db_path):
+            return False
+        try:
+            self.conn.execute("LOAD sqlite")
+            self.conn.execute(f"ATTACH {_literal(db_path)} AS jumpit_db (TYPE sqlite, READ_ONLY)")
+            has_history = self.conn.execute(
+                "SELECT count(*) FROM duckdb_tables() WHERE database_name = 'jumpit_db' AND table_name = 'posting_history'"
+            ).fetchone()[0]
+            if has_history:
+                first_seen = FIRST_SEEN_SQL.format(history="jumpit_db.posting_history")
+                self.conn.execute(f"CREATE OR REPLACE VIEW {JUMPIT_RELATION} AS SELECT * FROM jumpit_db.job_postings "
+                                  f"LEFT JOIN ({first_seen}) USING (position_id)")
+            else:
+                self.conn.execute(f"CREATE OR REPLACE VIEW {JUMPIT_RELATION} AS SELECT * FROM jumpit_db.job_postings")
+            return True
+        except duckdb.Error as e:
+            logger.warning(f"⚠️ DuckDB sqlite 확장 사용 불가 - job_postings 필요한 컬럼만 읽어 등록: {e}")
+
+        try:
+            conn = sqlite3.connect(db_path)
+            try:
+                existing = {row[1] for row in conn.execute("PRAGMA table_info(job_postings)")}
+                columns = [c for c in JUMPIT_COLUMNS if c in existing]
+                sql = f"SELECT {', '.join(columns)} FROM job_postings"
+                has_history = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posting_history'").fetchone()
+                if has_history and 'position_id' in columns:
+                    sql = (f"SELECT p.*, h.first_seen FROM ({sql}) p "
+                           f"LEFT JOIN ({FIRST_SEEN_SQL.format(history='posting_history')}) h USING (position_id)")
+                df = pd.read_sql(sql, conn)
+            finally:
+                conn.close()
+            self.conn.register(JUMPIT_RELATION, df)
+            return True
+        except Exception as e:
+            logger.error(f"❌ 점핏 DB 연결 실패 ({db_path}): {e}")
+            return False
+
+    def attach_snapshots(self, root: str) -> List[str]:
+        """스냅샷 소스별 snapshot_<소스> 뷰 생성 → 소스 목록"""
+        sources = sorted({partition_values(path)['source'] for path in snapshot_files(root)})
+        for source in sources:
+            parts = []
+            parquet_files = snapshot_files(root, source, fmt=FORMAT_PARQUET)
+            if parquet_files:
+                file_list = '[' + ', '.join(_literal(path) for path in parquet_files) + ']'
+                # crawl_date 는 파티션 값에서 DATE 로 (행마다 변환하지 않음)
+                parts.append(f"SELECT * FROM read_parquet({file_list}, hive_partitioning = true, "
+                             f"hive_types = {{'source': VARCHAR, 'crawl_date': DATE}}, union_by_name = true)")
+            if snapshot_files(root, source, fmt=FORMAT_ARROW):
+                # Arrow IPC 는 memory map 한 Table 을 그대로 스캔 (DuckDB 가 Arrow 버퍼를 직접 읽음)
+                name = f"snapshot_{source}_arrow"
+                table = read_snapshot(root, source, fmt=FORMAT_ARROW, partition_columns=True)
+                self._arrow_tables[name] = table
+                self.conn.register(name, table)
+                parts.append(f"SELECT * REPLACE (CAST(CAST(crawl_date AS VARCHAR) AS DATE) AS crawl_date) FROM {name}")
+            self.conn.execute(f"CREATE OR REPLACE VIEW {_quote('snapshot_' + source)} AS "
+                              + " UNION ALL BY NAME ".join(parts))
+        return sources
+
+    def _columns(self, relation: str) -> List[str]:
+        return [row[0] for row in self.conn.execute(f"DESCRIBE {_quote(relation)}").fetchall()]
+
+    def _source_select(self, source: str, relation: str) -> str:
+        available = set(self._columns(relation))
+
+        def pick(candidates: Sequence[str]) -> Optional[str]:
+            return next((c for c in candidates if c in available), None)
+
+        def text(field: str) -> str:
+            column = pick(COLUMN_CANDIDATES[field])
+            return f"coalesce(CAST({_quote(column)} AS VARCHAR), '')" if column else "''"
+
+        def as_date(column: str) -> str:
+            return f"TRY_CAST(left(CAST({_quote(column)} AS VARCHAR), 10) AS DATE)"
+
+        view_column = pick(COLUMN_CANDIDATES['view_count'])
+        crawled_at = pick(CRAWLED_AT_CANDIDATES)
+        key_column = pick(POSTING_KEY_CANDIDATES)
+        if 'crawl_date' in available:
+            crawl_date = "crawl_date"  # 스냅샷 파티션 (DATE)
+        elif crawled_at:
+            crawl_date = as_date(crawled_at)
+        else:
+            crawl_date = "CAST(NULL AS DATE)"
+        first_seen = f"coalesce({as_date('first_seen')}, {crawl_date})" if 'first_seen' in available else crawl_date
+        return f"""
+            SELECT {_literal(source)} AS source,
+                   {text('title')} AS title,
+                   {text('company_name')} AS company_name,
+                   {text('location')} AS location,
+                   {text('career_level')} AS career_level,
+                   {text('tech_stacks')} AS tech_stacks,
+                   {text('job_category')} AS job_category,
+                   {text('salary')} AS salary,
+                   {f'TRY_CAST({_quote(view_column)} AS BIGINT)' if view_column else 'CAST(NULL AS BIGINT)'} AS view_count,
+                   {crawl_date} AS crawl_date,
+                   {f"nullif(CAST({_quote(key_column)} AS VARCHAR), '')" if key_column else 'CAST(NULL AS VARCHAR)'} AS posting_key,
+                   {first_seen} AS first_seen
+            FROM {_quote(relation)}"""
+
+    def create_postings_view(self):
+        """소스별 관계를 공통 컬럼으로 합친 postings 뷰 (+ company_key, salary_manwon)"""
+        if not self.relations:
+            self.conn.execute(f"""
+                CREATE OR REPLACE VIEW {POSTINGS_VIEW} AS
+                SELECT * FROM (SELECT '' AS source, '' AS title, '' AS company_name, '' AS location,
+                                      '' AS career_level, '' AS tech_stacks, '' AS job_category, '' AS salary,
+                                      CAST(NULL AS BIGINT) AS view_count, CAST(NULL AS DATE) AS crawl_date,
+                                      CAST(NULL AS VARCHAR) AS posting_key, CAST(NULL AS DATE) AS first_seen,
+                                      '' AS company_key, CAST(NULL AS DOUBLE) AS salary_manwon) WHERE false""")
+            return
+        union = " UNION ALL ".join(self._source_select(source, relation)
+                                   for source, relation in self.relations.items())
+        # 파생 컬럼은 질의에서 참조할 때만 계산됨 (리포트는 먼저 묶은 뒤 고유값에만 적용)
+        self.conn.execute(f"""
+            CREATE OR REPLACE VIEW {POSTINGS_VIEW} AS
+            SELECT *, {COMPANY_KEY_SQL} AS company_key, {SALARY_MANWON_SQL} AS salary_manwon
+            FROM ({union})""")
+
+    def close(self):
+        self.conn.close()
+
+    # ------------------------------------------------------------------ 질의
+
+    def query(self, sql: str, params: Optional[Sequence] = None) -> pd.DataFrame:
+        """파라미터 바인딩 질의 → DataFrame (실행 시간 로그)"""
+        start = time.perf_counter()
+        df = self.conn.execute(sql, list(params or [])).df()
+        logger.debug(f"⏱️ 질의 {time.perf_counter() - start:.3f}초, {len(df)}행")
+        return df
+
+    @staticmethod
+    def _filters(sources: Optional[Sequence[str]] = None, start: Optional[str] = None,
+                 end: Optional[str] = None, location: Optional[str] = None,
+                 tech: Optional[str] = None, date_column: str = 'crawl_date') -> Tuple[str, List]:
+        """공통 필터 → (AND 로 이어 붙일 조건, 파라미터), start / end 는 date_column 기준"""
+        clauses, params = [], []
+        if sources:
+            clauses.append("list_contains(?, source)")
+            params.append(list(sources))
+        if start:
+            clauses.append(f"{date_column} >= CAST(? AS DATE)")
+            params.append(start)
+        if end:
+            clauses.append(f"{date_column} <= CAST(? AS DATE)")
+            params.append(end)
+        if location:
+            clauses.append("contains(location, ?)")
+            params.append(location)
+        if tech:
+            clauses.append("contains(lower(tech_stacks), lower(?))")
+            params.append(tech)
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    @staticmethod
+    def _latest_sql(columns: Sequence[str], where: str) -> str:
+        """
+        공고별 한 행 (source + columns) - 공고 키가 있으면 (source, posting_key) 별 최신 crawl_date 값 (tech_trend 와 같은
+        arg_max), 없으면 그대로. 리포트가 쓰는 컬럼만 고를 것 (고유 공고 수 × 컬럼 수만큼 묶는 비용).
+        where 는 중복 제거 전에 적용 (두 번 들어가므로 파라미터도 두 번).
+        """
+        latest = ', '.join(f"arg_max({column}, crawl_date) AS {column}" for column in columns)
+        return f"""
+                SELECT source, {', '.join(columns)}
+                FROM {POSTINGS_VIEW}
+                WHERE posting_key IS NULL{where}
+                UNION ALL
+                SELECT source, {latest}
+                FROM {POSTINGS_VIEW}
+                WHERE posting_key IS NOT NULL{where}
+                GROUP BY source, posting_key"""
+
+    # ------------------------------------------------------------------ 리포트
+
+    def tech_trend(self, period: str = 'week', techs: Optional[Sequence[str]] = None, top_n: int = 10,
+                   sources: Optional[Sequence[str]] = None, start: Optional[str] = None,
+                   end: Optional[str] = None) -> pd.DataFrame:
+        """
+        기간별 기술 스택 공고 수 (period, tech, postings, share_pct).
+        공고는 최초 관측일(first_seen)이 속한 기간에 한 번만 집계 - 공고 키가 있는 소스는 키별로 묶어
+        가장 이른 first_seen 과 최신 수집분의 기술 스택을 사용 (start / end 도 first_seen 기준).
+        techs 를 주면 해당 기술만(대소문자 무시), 없으면 전체 기간 상위 top_n 기술.
+        share_pct = 해당 기간 공고 중 그 기술을 포함한 공고 비율.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"알 수 없는 기간 단위: {period} ({', '.join(PERIODS)})")
+        source_where, source_params = self._filters(sources)
+        where, params = self._filters(start=start, end=end, date_column='first_seen')
+        if techs:
+            selected = "SELECT DISTINCT lower(tech) AS tech_key FROM (SELECT unnest(?) AS tech)"
+            selected_params = [list(techs)]
+        else:
+            selected = ("SELECT tech_key FROM tech_rows GROUP BY tech_key "
+                        "ORDER BY sum(n) DESC, tech_key LIMIT ?")
+            selected_params = [int(top_n)]
+        sql = f"""
+            WITH firsts AS (
+                SELECT first_seen, tech_stacks
+                FROM {POSTINGS_VIEW}
+                WHERE posting_key IS NULL{source_where}
+                UNION ALL
+                -- 재수집/스냅샷마다 반복되는 공고는 키별로 한 행
+                SELECT min(first_seen), arg_max(tech_stacks, crawl_date)
+                FROM {POSTINGS_VIEW}
+                WHERE posting_key IS NOT NULL{source_where}
+                GROUP BY source, posting_key
+            ),
+            grouped AS (
+                -- 같은 (최초 관측일, 기술 스택 문자열) 은 한 번만 분해
+                SELECT first_seen, tech_stacks, count(*) AS n
+                FROM firsts
+                WHERE first_seen IS NOT NULL{where}
+                GROUP BY first_seen, tech_stacks
+            ),
+            base AS (
+                SELECT date_trunc({_literal(period)}, first_seen) AS period, tech_stacks, n FROM grouped
+            ),
+            period_totals AS (
+                SELECT period, sum(n) AS total FROM base GROUP BY period
+            ),
+            tech_rows AS (
+                SELECT period, trim(tech) AS tech, lower(trim(tech)) AS tech_key, n
+                FROM (SELECT period, n, unnest(regexp_split_to_array(tech_stacks, {_literal(TECH_SEPARATOR)})) AS tech
+                      FROM base WHERE tech_stacks <> '')
+                WHERE trim(tech) <> ''
+            ),
+            selected AS ({selected})
+            SELECT t.period, min(t.tech) AS tech, CAST(sum(t.n) AS BIGINT) AS postings,
+                   round(100.0 * sum(t.n) / any_value(p.total), 2) AS share_pct
+            FROM tech_rows t
+            JOIN selected s USING (tech_key)
+            JOIN period_totals p USING (period)
+            GROUP BY t.period, t.tech_key
+            ORDER BY t.period, postings DESC, tech"""
+        return self.query(sql, source_params * 2 + params + selected_params)
+
+    def top_techs(self, top_n: int = 15, sources: Optional[Sequence[str]] = None,
+                  start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """기술 키워드 상위 top_n (tech, postings) - sw_job_analysis.py 의 키워드 빈도 집계"""
+        where, params = self._filters(sources, start, end)
+        sql = f"""
+            WITH latest AS ({self._latest_sql(['tech_stacks'], where)}
+            ),
+            grouped AS (
+                SELECT tech_stacks, count(*) AS n
+                FROM latest
+                WHERE tech_stacks <> ''
+                GROUP BY tech_stacks
+            ),
+            tech_rows AS (
+                SELECT trim(tech) AS tech, n
+                FROM (SELECT n, unnest(regexp_split_to_array(tech_stacks, {_literal(TECH_SEPARATOR)})) AS tech
+                      FROM grouped)
+                WHERE trim(tech) <> ''
+            )
+            SELECT min(tech) AS tech, CAST(sum(n) AS BIGINT) AS postings
+            FROM tech_rows
+            GROUP BY lower(tech)
+            ORDER BY postings DESC, tech
+            LIMIT ?"""
+        return self.query(sql, params * 2 + [int(top_n)])
+
+    def company_league(self, top_n: int = 20, sources: Optional[Sequence[str]] = None,
+                       tech: Optional[str] = None, location: Optional[str] = None,
+                       start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+        """회사별 공고 수 순위 (법인 표기 무시), 필터 조건 내 점유율 포함 (지역 / 기술 조건은 공고별 최신 수집분 기준)"""
+        where, params = self._filters(sources, start, end)
+        latest_where, latest_params = self._filters(location=location, tech=tech)
+        columns = ['company_name', 'location', 'view_count', 'crawl_date'] + (['tech_stacks'] if tech else [])
+        sql = f"""
+            WITH latest AS ({self._latest_sql(columns, where)}
+            ),
+            grouped AS (
+                SELECT company_name, source, location, count(*) AS n,
+                       sum(view_count) AS view_sum, count(view_count) AS view_n, max(crawl_date) AS last_seen
+                FROM latest
+                WHERE company_name <> ''{latest_where}
+                GROUP BY company_name, source, location
+            ),
+            -- 회사명 정규화는 고유 회사명마다 한 번 (MATERIALIZED: company_key 조건이 스캔까지 내려가
+            -- 정규식이 전체 행에 적용되는 것을 막음)
+            names AS MATERIALIZED (
+                SELECT company_name, {COMPANY_KEY_SQL} AS company_key
+                FROM (SELECT DISTINCT company_name FROM grouped)
+            ),
+            keyed AS (
+                SELECT * FROM grouped JOIN names USING (company_name)
+            )
+            SELECT rank() OVER (ORDER BY sum(n) DESC) AS rank,
+                   min(company_name) AS company_name,
+                   CAST(sum(n) AS BIGINT) AS postings,
+                   round(100.0 * sum(n) / sum(sum(n)) OVER (), 2) AS share_pct,
+                   count(DISTINCT source) AS sources,
+                   count(DISTINCT nullif(location, '')) AS locations,
+                   round(sum(view_sum) / nullif(sum(view_n), 0), 1) AS avg_views,
+                   max(last_seen) AS last_seen
+            FROM keyed
+            WHERE company_key <> ''
+            GROUP BY company_key
+            ORDER BY postings DESC, company_name
+            LIMIT ?"""
+        return self.query(sql, params * 2 + latest_params + [int(top_n)])
+
+    def salary_career_crosstab(self, salary_bands: Sequence[int] = DEFAULT_SALARY_BANDS,
+                               career_bands: Sequence[int] = DEFAULT_CAREER_BANDS,
+                               sources: Optional[Sequence[str]] = None, start: Optional[str] = None,
+                               end: Optional[str] = None) -> pd.DataFrame:
+        """
+        경력 구간(행) × 연봉 구간(열) 공고 수 교차표.
+        salary_bands / career_bands 는 구간 경계 (만원 / 최소 연차), 집계는 DuckDB, 피벗은 결과 행에서.
+        """
+        salary_case, salary_params, salary_labels = self._band_case(
+            "salary_manwon", sorted(salary_bands), "{lo}~{hi}만원", "{lo}만원 이상", "~{hi}만원")
+        career_case, career_params, career_labels = self._band_case(
+            "career_years", sorted(career_bands), "{lo}~{hi_minus}년", "{lo}년 이상", "{lo}~{hi_minus}년", start_at=0)
+        where, params = self._filters(sources, start, end)
+        sql = f"""
+            WITH latest AS ({self._latest_sql(['career_level', 'salary'], where)}
+            ),
+            grouped AS (
+                SELECT career_level, salary, count(*) AS n
+                FROM latest
+                GROUP BY career_level, salary
+            ),
+            base AS (
+                SELECT career_level, n, {SALARY_MANWON_SQL} AS salary_manwon,
+                       TRY_CAST(regexp_extract(career_level, '([0-9]+)', 1) AS INTEGER) AS career_years
+                FROM grouped
+            )
+            SELECT CASE WHEN career_level LIKE '%무관%' THEN '경력무관'
+                        WHEN career_level LIKE '%신입%' THEN '신입'
+                        WHEN career_years IS NULL THEN '미상'
+                        ELSE {career_case} END AS career_band,
+                   CASE WHEN salary_manwon IS NULL OR salary_manwon <= 0 THEN '미공개'
+                        ELSE {salary_case} END AS salary_band,
+                   CAST(sum(n) AS BIGINT) AS postings
+            FROM base
+            GROUP BY ALL"""
+        long_df = self.query(sql, params * 2 + career_params + salary_params)
+        rows = ['신입', '경력무관'] + career_labels + ['미상']
+        columns = ['미공개'] + salary_labels
+        table = long_df.pivot_table(index='career_band', columns='salary_band', values='postings',
+                                    aggfunc='sum', fill_value=0)
+        table = table.reindex(index=[r for r in rows if r in table.index],
+                              columns=[c for c in columns if c in table.columns], fill_value=0)
+        table['합계'] = table.sum(axis=1)
+        return table.astype(int)
+
+    @staticmethod
+    def _band_case(column: str, bounds: List[int], middle: str, last: str, first: str,
+                   start_at: Optional[int] = None) -> Tuple[str, List, List[str]]:
+        """구간 경계 → (CASE WHEN ... 식, 파라미터, 구간 라벨)"""
+        labels, whens, params = [], [], []
+        lo = start_at
+        for hi in bounds:
+            label = (middle if lo is not None else first).format(lo=lo, hi=hi, hi_minus=hi - 1)
+            whens.append(f"WHEN {column} < ? THEN ?")
+            params += [hi, label]
+            labels.append(label)
+            lo = hi
+        last_label = last.format(lo=lo) if lo is not None else "전체"
+        labels.append(last_label)
+        params.append(last_label)
+        return f"CASE {' '.join(whens)} ELSE ? END", params, labels
+
+    def source_summary(self) -> pd.DataFrame:
+        """소스별 공고 수 (공고 키 기준 고유, rows 는 전체 수집 행) / 회사 수 / 수집일 범위"""
+        return self.query(f"""
+            SELECT source, count(DISTINCT posting_key) + count(*) FILTER (WHERE posting_key IS NULL) AS postings,
+                   count(*) AS rows, count(DISTINCT company_key) AS companies,
+                   min(crawl_date) AS first_date, max(crawl_date) AS last_date
+            FROM {POSTINGS_VIEW}
+            GROUP BY source ORDER BY postings DESC""")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="채용공고 DuckDB 분석 리포트")
+    parser.add_argument('report', choices=['summary', 'techs', 'trend', 'league', 'crosstab', 'sql'])
+    parser.add_argument('sql', nargs='?', default=None, help="report=sql 일 때 실행할 질의")
+    parser.add_argument('--db', default="jumpit_jobs.db")
+    parser.add_argument('--root', default=DEFAULT_ROOT)
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--source', action='append', default=None)
+    parser.add_argument('--start', default=None)
+    parser.add_argument('--end', default=None)
+    parser.add_argument('--period', default='week', choices=PERIODS)
+    parser.add_argument('--tech', action='append', default=None)
+    parser.add_argument('--location', default=None)
+    parser.add_argument('--top', type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    engine = AnalyticsEngine(args.db, args.root, threads=args.threads)
+    start = time.perf_counter()
+    if args.report == 'summary':
+        result = engine.source_summary()
+    elif args.report == 'techs':
+        result = engine.top_techs(args.top or 15, args.source, args.start, args.end)
+    elif args.report == 'trend':
+        result = engine.tech_trend(args.period, args.tech, args.top or 10, args.source, args.start, args.end)
+        if not result.empty:
+            result = result.pivot_table(index='period', columns='tech', values='postings', aggfunc='sum', fill_value=0)
+    elif args.report == 'league':
+        result = engine.company_league(args.top or 20, args.source, (args.tech or [None])[0], args.location,
+                                       args.start, args.end)
+    elif args.report == 'crosstab':
+        result = engine.salary_career_crosstab(sources=args.source, start=args.start, end=args.end)
+    else:
+        if not args.sql:
+            parser.error("sql 리포트에는 질의문이 필요합니다")
+        result = engine.query(args.sql)
+    seconds = time.perf_counter() - start
+
+    with pd.option_context('display.max_rows', 200, 'display.max_columns', 30, 'display.width', 200):
+        print(result)
+    print(f"\n⏱️ {args.report}: {seconds:.3f}초 (스레드 {engine.threads})")
+    engine.close()
+
+
+if __name__ == "__main__":
+    main()
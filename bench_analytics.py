@@ -0,0 +1,83 @@
+"""
+분석 엔진 벤치마크 (합성 점핏 공고 스냅샷 기준)
+
+같은 집계를 기존 분석 스크립트 방식(pandas + Counter, 컬럼 단위 처리)과 AnalyticsEngine(DuckDB)으로 실행해 비교한다.
+- 기술 키워드 상위 15개 : sw_job_analysis.py 의 split + Counter
+- 회사 순위 상위 20개   : groupby (공고 수 + 지역 수)
+- 월별 기술 추이        : 공고별 최초 수집일로 묶은 뒤 explode + groupby (pandas) / tech_trend (DuckDB)
+
+pandas 는 미리 읽어 둔 DataFrame 기준이므로 스냅샷 읽기 시간을 따로 출력한다 (DuckDB 는 매 질의마다 스캔).
+키워드 / 회사 순위는 양쪽 모두 공고별 최신 수집분 기준 - pandas 는 load_postings 와 같은 중복 제거를
+한 번 해 두고 그 시간도 따로 출력, DuckDB 는 매 질의마다 (source, posting_key) 로 묶음.
+
+사용법: python bench_analytics.py [--rows 2000000] [--threads N]
+"""
+import time
+import argparse
+import tempfile
+from collections import Counter
+
+import posting_snapshot as ps
+from analytics_engine import AnalyticsEngine, TECH_SEPARATOR, duckdb
+from bench_snapshot import synthetic_postings
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--threads', type=int, default=None)
+    args = parser.parse_args()
+
+    if duckdb is None or ps.pa is None:
+        print("❌ duckdb / pyarrow 가 설치되어 있지 않습니다")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ps.write_snapshot(synthetic_postings(args.rows, 90), ps.SOURCE_JUMPIT, tmp, ps.FORMAT_PARQUET)
+        engine = AnalyticsEngine(None, tmp, threads=args.threads)
+        read_seconds, df = timed(lambda: ps.read_snapshot_df(
+            tmp, ps.SOURCE_JUMPIT, ['position_id', 'company_name', 'location', 'tech_stacks', 'crawled_at']))
+        dedupe_seconds, latest = timed(lambda: ps._latest_per_posting(df, 'position_id', 'crawled_at'))
+        print(f"🏁 공고 {args.rows:,}개, DuckDB 스레드 {engine.threads}, pandas 스냅샷 읽기 {read_seconds:.3f}초 "
+              f"+ 공고별 중복 제거 {dedupe_seconds:.3f}초")
+
+        def pandas_keywords():
+            keywords = latest['tech_stacks'].str.split(TECH_SEPARATOR).dropna()
+            return Counter(kw.strip() for sublist in keywords for kw in sublist if kw.strip()).most_common(15)
+
+        def pandas_league():
+            grouped = latest.groupby('company_name', observed=True)
+            league = grouped.agg(postings=('location', 'size'), locations=('location', 'nunique'))
+            return league.nlargest(20, 'postings')
+
+        def pandas_trend():
+            # 공고별 최초 수집일 + 최신 기술 스택 (수백만 개 문자열 키 groupby().min() 은 매우 느려서 정렬 후 중복 제거)
+            dated = df.assign(crawled_at=df['crawled_at'].astype(str)).sort_values('crawled_at', kind='stable')
+            first = dated.drop_duplicates('position_id', keep='first')[['position_id', 'crawled_at']]
+            last = dated.drop_duplicates('position_id', keep='last')[['position_id', 'tech_stacks']]
+            firsts = first.merge(last, on='position_id')
+            exploded = firsts.assign(period=firsts['crawled_at'].str.slice(0, 7),
+                                     tech=firsts['tech_stacks'].str.split(TECH_SEPARATOR)).explode('tech')
+            return exploded.groupby(['period', 'tech']).size()
+
+        cases = [
+            ("기술 키워드 상위 15", pandas_keywords, lambda: engine.top_techs(15)),
+            ("회사 순위 상위 20", pandas_league, lambda: engine.company_league(20)),
+            ("월별 기술 추이", pandas_trend, lambda: engine.tech_trend('month', top_n=10)),
+        ]
+        for name, pandas_func, duckdb_func in cases:
+            pandas_seconds, _ = timed(pandas_func)
+            duckdb_seconds, _ = timed(duckdb_func)
+            print(f"   {name:14s} pandas {pandas_seconds:6.3f}초  duckdb {duckdb_seconds:6.3f}초  "
+                  f"(x{pandas_seconds / duckdb_seconds:.1f})")
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
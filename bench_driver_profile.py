@@ -0,0 +1,92 @@
+"""
+드라이버 프로필 벤치마크 (전송량 / 분당 페이지 수)
+
+같은 리멤버 페이지 목록을 프로필별로 방문해 비교한다.
+전송량은 Resource Timing 기준 하한값 - Timing-Allow-Origin 이 없는 교차 출처 리소스(트래커/CDN 등)는
+크기가 0 으로 잡히므로 '크기 미확인' 요청 수를 함께 출력한다 (full 프로필의 실제 전송량은 더 큼).
+- 목록 페이지: JD.py 의 직무 카테고리 URL
+- 상세 페이지: 첫 목록 페이지에서 찾은 공고 링크 일부
+
+사용법: python bench_driver_profile.py [상세 페이지 수] [프로필...] [--headless]
+예)     python bench_driver_profile.py 10 full remember --headless
+"""
+import sys
+import time
+import logging
+
+from selenium.webdriver.common.by import By
+
+from JD import MultiJobCategoryCrawler
+
+logger = logging.getLogger(__name__)
+
+
+def collect_urls(crawler: MultiJobCategoryCrawler, detail_pages: int) -> list:
+    """벤치마크 대상 URL (목록 + 상세)"""
+    list_urls = list(crawler.target_job_categories.values())
+    crawler.driver.get(list_urls[0])
+    time.sleep(5)
+    links = []
+    for element in crawler.driver.find_elements(By.XPATH, "//a[contains(@href, '/job/postings/')]"):
+        href = element.get_attribute('href')
+        if href and href not in links:
+            links.append(href)
+    return list_urls + links[:detail_pages]
+
+
+def run_profile(profile: str, urls: list, headless: bool) -> dict:
+    crawler = MultiJobCategoryCrawler(profile=profile, headless=headless)
+    if not crawler.setup_stealth_driver():
+        return {}
+    try:
+        start = time.perf_counter()
+        for url in urls:
+            crawler.driver.get(url)
+            # 본문 텍스트가 나타날 때까지 (추출 가능 시점) 대기
+            crawler.wait.until(lambda d: d.execute_script("return document.readyState") != "loading")
+            crawler.record_page_load()
+        elapsed = time.perf_counter() - start
+    finally:
+        crawler.cleanup()
+
+    stats = crawler.page_stats
+    return {
+        'pages': stats['pages'],
+        'mb': stats['bytes'] / 1024 / 1024,
+        'requests': stats['requests'],
+        'unmeasured': stats['unmeasured'],
+        'pages_per_minute': stats['pages'] / elapsed * 60 if elapsed else 0.0,
+    }
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    headless = '--headless' in sys.argv
+    detail_pages = int(args[0]) if args and args[0].isdigit() else 10
+    profiles = [a for a in args if not a.isdigit()] or ['full', 'remember']
+
+    # URL 목록은 기준 프로필로 한 번만 수집 (프로필 간 같은 페이지 비교)
+    seed = MultiJobCategoryCrawler(profile='remember', headless=headless)
+    if not seed.setup_stealth_driver():
+        print("❌ 드라이버 시작 실패")
+        return
+    try:
+        urls = collect_urls(seed, detail_pages)
+    finally:
+        seed.cleanup()
+
+    print(f"🏁 페이지 {len(urls)}개 (목록 {len(seed.target_job_categories)} + 상세), 헤드리스 {headless}")
+    results = {profile: run_profile(profile, urls, headless) for profile in profiles}
+    baseline = results.get(profiles[0]) or {}
+    for profile, result in results.items():
+        if not result:
+            print(f"   {profile:10s} 실패")
+            continue
+        ratio = result['mb'] / baseline['mb'] if baseline.get('mb') else 0.0
+        print(f"   {profile:10s} {result['mb']:8.2f} MB  요청 {result['requests']:5d}개 "
+              f"(크기 미확인 {result['unmeasured']:4d}개)  "
+              f"{result['pages_per_minute']:6.1f} 페이지/분  (전송량 기준 대비 {ratio:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+필드 추출 정규식 벤치마크 (보관된 상세 페이지 기준)
+
+같은 페이지 텍스트에 대해 기존 방식(필드마다 패턴 문자열로 본문 전체 re.findall)과
+field_extraction 의 미리 컴파일된 정규식(이름 있는 그룹으로 합친 스캔 + 조기 종료,
+섹션 대체 추출은 키워드 검색 + 슬라이스)을 비교하고, 두 방식의 결과가 같은지 확인한다.
+
+사용법: python bench_field_extraction.py [--archive detail_archive.db] [--limit N] [--repeat N]
+"""
+import re
+import time
+import argparse
+from collections import Counter
+from typing import Dict, List
+
+import field_extraction as fx
+from html_backend import parse_html, resolve_backend
+from detail_archive import DEFAULT_ARCHIVE, DetailArchive
+
+
+# ---------------------------------------------------------------------- 기존 방식 (JD.py 변경 전)
+
+def legacy_exclude(text: str):
+    full_text = text.lower()
+    for keyword in fx.HEADHUNTER_KEYWORDS:
+        if keyword.lower() in full_text:
+            return "헤드헌터"
+    for keyword in fx.OVERSEAS_KEYWORDS:
+        if keyword.lower() in full_text:
+            return "해외근무"
+    return None
+
+
+def legacy_fields(page_text: str) -> Dict:
+    result = {'exclude': legacy_exclude(page_text)}
+
+    company_patterns = [
+        r'([가-힣]+\s*주식회사)', r'(\([주]\)\s*[가-힣]+)', r'(㈜\s*[가-힣]+)', r'([A-Za-z]+\s*Inc\.?)',
+        r'([A-Za-z]+\s*Corp\.?)', r'([A-Za-z]+\s*Ltd\.?)', r'([A-Za-z]+\s*Co\.?,?\s*Ltd\.?)'
+    ]
+    result['company'] = None
+    for pattern in company_patterns:
+        matches = re.findall(pattern, page_text)
+        if matches:
+            result['company'] = Counter(matches).most_common(1)[0][0].strip()
+            break
+
+    result['job'] = []
+    for pattern in [
+        r'(프론트엔드|백엔드|풀스택|데이터|AI|머신러닝|DevOps|모바일|iOS|안드로이드|서비스기획|상품기획|마케팅|디자인|HR|영업|경영지원)',
+        r'(개발자|엔지니어|기획자|디자이너|매니저|팀장|대리|과장|차장|부장)'
+    ]:
+        matches = re.findall(pattern, page_text, re.IGNORECASE)
+        if matches:
+            result['job'] = sorted(set(matches[:3]))
+            break
+
+    matches = re.findall(r'(고졸|전문학사|학사|석사|박사|대졸|대학교|학력무관)', page_text)
+    result['education'] = matches[0] if matches else None
+    matches = re.findall(r'(정규직|계약직|인턴|파트타임|프리랜서|임시직)', page_text)
+    result['employment'] = matches[0] if matches else '정규직'
+
+    section_headers = {name: list(keywords) for name, keywords in fx.SECTION_HEADERS.items()}
+    result['sections'] = {}
+    for section_name, keywords in section_headers.items():
+        for keyword in keywords:
+            pattern = rf'{keyword}[:\s]*([^가-힣]*(?:[가-힣][^가-힣]*)*?)(?=(?:{"│".join(sum(section_headers.values(), []))})|$)'
+            matches = re.findall(pattern, page_text, re.DOTALL | re.IGNORECASE)
+            if matches:
+                result['sections'][section_name] = matches[0].strip()[:1000]
+                break
+    return result
+
+
+# ---------------------------------------------------------------------- 컴파일된 정규식
+
+def compiled_fields(page_text: str) -> Dict:
+    result = {'exclude': fx.exclude_reason(page_text), 'company': fx.most_common_company(page_text)}
+    fields = fx.detail_fields(page_text)
+    result['job'] = sorted(set(fields['category'] or fields['role']))
+    result['education'] = fields['education'][0] if fields['education'] else None
+    result['employment'] = fields['employment'][0] if fields['employment'] else '정규직'
+    result['sections'] = {}
+    for section_name, keywords in fx.SECTION_HEADERS.items():
+        for keyword in keywords:
+            content = fx.section_fallback(page_text, keyword)
+            if content is not None:
+                result['sections'][section_name] = content.strip()[:1000]
+                break
+    return result
+
+
+def load_texts(archive_path: str, limit: int) -> List[str]:
+    backend = resolve_backend('auto')
+    archive = DetailArchive(archive_path)
+    texts = []
+    try:
+        for _, _, _, html in archive.iter_latest():
+            texts.append(parse_html(html, backend).text)
+            if len(texts) >= limit:
+                break
+    finally:
+        archive.close()
+    return texts
+
+
+def timed(func, texts: List[str], repeat: int):
+    best, outputs = None, None
+    for _ in range(repeat):
+        start = time.process_time()
+        outputs = [func(text) for text in texts]
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="필드 추출 정규식 벤치마크")
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE)
+    parser.add_argument('--limit', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    texts = load_texts(args.archive, args.limit)
+    if not texts:
+        print("❌ 벤치마크할 페이지가 없습니다 (보관소가 비어 있음)")
+        return
+    print(f"🏁 상세 페이지 {len(texts)}개 (텍스트 {sum(map(len, texts)) / 1024 / 1024:.1f}M자), 반복 {args.repeat}회")
+
+    legacy_seconds, legacy_outputs = timed(legacy_fields, texts, args.repeat)
+    compiled_seconds, compiled_outputs = timed(compiled_fields, texts, args.repeat)
+    mismatches = sum(1 for a, b in zip(legacy_outputs, compiled_outputs) if a != b)
+
+    for name, seconds in (('기존', legacy_seconds), ('컴파일', compiled_seconds)):
+        print(f"   {name:6s} CPU {seconds:6.3f}초  (페이지당 {seconds / len(texts) * 1000:6.2f}ms)")
+    print(f"   ⚡ x{legacy_seconds / compiled_seconds if compiled_seconds else 0:.1f}, 결과 불일치 {mismatches}개")
+
+
+if __name__ == "__main__":
+    main()
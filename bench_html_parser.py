@@ -0,0 +1,168 @@
+"""
+HTML 파서 백엔드 벤치마크 (보관된 상세 페이지 기준)
+
+백엔드마다 새 프로세스에서 같은 페이지들을 처리해 비교한다.
+- 파싱 시간   : parse_html + 전체 텍스트 추출
+- 추출 시간   : extract_from_html 전체 (파싱 포함) - 파싱 시간
+- 최대 메모리 : 페이지 로드 후 기준 대비 최대 RSS 증가량
+- 불일치      : html.parser 결과와 다른 필드 수 (수집 시각 제외)
+
+--check : 보관 페이지 + 내장 샘플(공백 노드가 많은 마크업)의 추출 필드가 html.parser 와 모두 같은지 확인,
+          다른 필드를 출력하고 하나라도 있으면 종료 코드 1 ('auto' 로 고른 백엔드가 결과를 바꾸지 않는지 검증)
+
+사용법: python bench_html_parser.py [--archive detail_archive.db] [--dir html폴더] [--limit N] [--check] [백엔드...]
+"""
+import os
+import sys
+import glob
+import time
+import resource
+import argparse
+import multiprocessing as mp
+from typing import Dict, List, Tuple
+
+from html_backend import available_backends, parse_html
+from detail_archive import DEFAULT_ARCHIVE, DetailArchive
+
+REFERENCE_BACKEND = 'html.parser'
+# 실행마다 값이 달라지는 필드는 비교에서 제외
+VOLATILE_FIELDS = ('crawled_at',)
+
+# 백엔드 간 공백 처리 차이가 드러나는 상세 페이지 샘플 (--check 에 항상 포함)
+PARITY_SAMPLES = {
+    'sample-inline-list': (
+        "<html><head><title>백엔드 개발자 채용</title></head><body>"
+        "<div><b>주요업무</b>:<ul><li>API 개발</li>\n\n<li>운영</li></ul></div>\n      \n   \n    "
+        "<div><b>우대사항</b> 없음</div></body></html>"
+    ),
+    'sample-section-list': (
+        "<html>\n<head>\n  <title>데이터 엔지니어 | 리멤버</title>\n</head>\n<body>\n  <main>\n"
+        "    <h3>주요업무</h3>\n    <ul>\n      <li>대용량 데이터 파이프라인 설계 및 운영</li>\n\n"
+        "      <li>사내 분석 플랫폼 개발</li>\n    </ul>\n\n    <h3>자격요건</h3>\n"
+        "    <div>\n      <p>Python 또는 Scala 실무 경험 3년 이상</p>\n      \t\n"
+        "      <p>SQL 및 분산 처리 경험</p>\n    </div>\n    <h3>우대사항</h3>\n"
+        "    <p>Spark, Airflow 운영 경험</p>\n    <pre>\n  채용절차: 서류 → 면접\n</pre>\n"
+        "  </main>\n</body>\n</html>"
+    ),
+}
+
+
+def load_pages(archive_path: str, html_dir: str, limit: int) -> List[Tuple[str, Dict, str]]:
+    pages = []
+    if html_dir:
+        for path in sorted(glob.glob(os.path.join(html_dir, '*.html')))[:limit]:
+            with open(path, encoding='utf-8') as f:
+                pages.append((os.path.basename(path), {}, f.read()))
+        return pages
+    archive = DetailArchive(archive_path)
+    try:
+        for posting_id, url, job, html in archive.iter_latest():
+            pages.append((posting_id, job, html))
+            if len(pages) >= limit:
+                break
+    finally:
+        archive.close()
+    return pages
+
+
+def _max_rss_bytes() -> int:
+    # 리눅스는 KB, macOS 는 bytes
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def _run_backend(backend: str, pages, result_queue):
+    from detail_extraction import DetailExtractor
+
+    extractor = DetailExtractor(parser_backend=backend)
+    baseline = _max_rss_bytes()
+
+    start = time.perf_counter()
+    for _, _, html in pages:
+        parse_html(html, backend).text
+    parse_seconds = time.perf_counter() - start
+
+    outputs = {}
+    start = time.perf_counter()
+    for posting_id, job, html in pages:
+        base = extractor.new_job_info(job.get('직무카테고리', ''))
+        base.update(job)
+        result, reason = extractor.extract_from_html(base, html)
+        outputs[posting_id] = ({k: v for k, v in result.items() if k not in VOLATILE_FIELDS}
+                               if result else {'제외': reason})
+    total_seconds = time.perf_counter() - start
+
+    result_queue.put({
+        'parse_seconds': parse_seconds,
+        'extract_seconds': max(total_seconds - parse_seconds, 0.0),
+        'peak_mb': (_max_rss_bytes() - baseline) / 1024 / 1024,
+        'outputs': outputs,
+    })
+
+
+def bench_backend(backend: str, pages) -> Dict:
+    ctx = mp.get_context('spawn')  # 백엔드별로 깨끗한 프로세스에서 메모리 측정
+    result_queue = ctx.Queue()
+    process = ctx.Process(target=_run_backend, args=(backend, pages, result_queue))
+    process.start()
+    result = result_queue.get()
+    process.join()
+    return result
+
+
+def mismatched_fields(reference: Dict, outputs: Dict) -> List[Tuple[str, str]]:
+    """(페이지, 필드) - html.parser 결과와 다른 필드"""
+    mismatches = []
+    for posting_id, expected in reference.items():
+        actual = outputs.get(posting_id, {})
+        mismatches += [(posting_id, key) for key in sorted(set(expected) | set(actual))
+                       if expected.get(key) != actual.get(key)]
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument('backends', nargs='*')
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE)
+    parser.add_argument('--dir', default=None, help="상세 페이지 .html 파일 폴더 (보관소 대신)")
+    parser.add_argument('--limit', type=int, default=200)
+    parser.add_argument('--check', action='store_true', help="추출 필드 불일치가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    pages = load_pages(args.archive, args.dir, args.limit)
+    if args.check:
+        pages += [(name, {}, html) for name, html in PARITY_SAMPLES.items()]
+    if not pages:
+        print("❌ 벤치마크할 페이지가 없습니다 (보관소가 비어 있음)")
+        return
+
+    backends = args.backends or available_backends()
+    if REFERENCE_BACKEND not in backends:
+        backends.append(REFERENCE_BACKEND)
+    total_mb = sum(len(html.encode('utf-8')) for _, _, html in pages) / 1024 / 1024
+    print(f"🏁 상세 페이지 {len(pages)}개 ({total_mb:.1f} MB), 백엔드: {', '.join(backends)}")
+
+    results = {backend: bench_backend(backend, pages) for backend in backends}
+    reference = results[REFERENCE_BACKEND]
+    baseline = reference['parse_seconds'] + reference['extract_seconds']
+    failed = False
+    for backend, result in results.items():
+        total = result['parse_seconds'] + result['extract_seconds']
+        per_page = total / len(pages) * 1000
+        mismatches = mismatched_fields(reference['outputs'], result['outputs'])
+        print(f"   {backend:12s} 파싱 {result['parse_seconds']:6.2f}초  추출 {result['extract_seconds']:6.2f}초  "
+              f"(페이지당 {per_page:6.1f}ms, x{baseline / total if total else 0:.1f})  "
+              f"최대 메모리 +{result['peak_mb']:6.1f} MB  불일치 필드 {len(mismatches)}개")
+        if args.check:
+            for posting_id, key in mismatches[:20]:
+                expected = reference['outputs'][posting_id].get(key)
+                actual = result['outputs'].get(posting_id, {}).get(key)
+                print(f"      ❌ {posting_id} [{key}] {expected!r} ≠ {actual!r}")
+            failed = failed or bool(mismatches)
+    if args.check:
+        print("❌ 추출 필드 불일치" if failed else "✅ 모든 백엔드 추출 필드 일치")
+        sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
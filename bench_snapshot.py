@@ -0,0 +1,96 @@
+"""
+컬럼형 스냅샷 읽기 벤치마크 (합성 점핏 공고 기준)
+
+job_postings 와 같은 스키마의 합성 공고 N개를 임시 SQLite 에 넣고, 분석에서 쓰는 컬럼만 읽는 시간을 비교한다.
+- sqlite  : SELECT <컬럼> FROM job_postings → DataFrame
+- arrow   : Arrow IPC 스냅샷 memory map → pyarrow.Table (복사 없음) / DataFrame
+- parquet : Parquet 스냅샷 필요한 컬럼만 디코딩 → pyarrow.Table / DataFrame
+
+사용법: python bench_snapshot.py [--rows 1000000] [--dates 30]
+"""
+import os
+import time
+import sqlite3
+import argparse
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import posting_snapshot as ps
+
+COLUMNS = ['title', 'company_name', 'location', 'career_level', 'tech_stacks', 'crawled_at']
+
+
+def synthetic_postings(rows: int, dates: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    pick = lambda values: np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)]
+    stacks = np.array(['Python', 'Java', 'Spring', 'React', 'TypeScript', 'Kotlin', 'Go', 'AWS', 'Docker', 'MySQL'])
+    day = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, dates, rows), unit='D')
+    return pd.DataFrame({
+        'position_id': np.arange(rows).astype(str),
+        'title': pd.Series(pick(['백엔드 개발자', '프론트엔드 개발자', '데이터 엔지니어', 'DevOps 엔지니어',
+                                 'Android 개발자', 'iOS 개발자', 'ML 엔지니어'])) + ' #' + pd.Series(np.arange(rows) % 5000).astype(str),
+        'company_name': pd.Series(rng.integers(0, 3000, rows)).map(lambda i: f"회사{i}"),
+        'location': pick(['서울 강남구', '서울 서초구', '경기 성남시', '서울 마포구', '부산 해운대구']),
+        'career_level': pick(['신입', '경력 1~3년', '경력 3~5년', '경력 5년 이상', '경력무관']),
+        'tech_stacks': [', '.join(stacks[rng.integers(0, len(stacks), 3)]) for _ in range(rows)],
+        'view_count': rng.integers(0, 5000, rows),
+        'crawled_at': day.strftime('%Y-%m-%d') + ' 09:00:00',
+    })
+
+
+def timed(func, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--dates', type=int, default=30)
+    args = parser.parse_args()
+
+    if ps.pa is None:
+        print("❌ pyarrow 가 설치되어 있지 않습니다")
+        return
+
+    df = synthetic_postings(args.rows, args.dates)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'jumpit_jobs.db')
+        conn = sqlite3.connect(db_path)
+        df.to_sql('job_postings', conn, index=False)
+        conn.close()
+
+        roots = {fmt: os.path.join(tmp, fmt) for fmt in ps.EXTENSIONS}
+        for fmt, root in roots.items():
+            start = time.perf_counter()
+            ps.snapshot_sqlite(db_path, 'job_postings', ps.SOURCE_JUMPIT, root, fmt)
+            size = sum(os.path.getsize(p) for p in ps.snapshot_files(root)) / 1024 / 1024
+            print(f"🧊 {fmt:7s} 스냅샷 기록 {time.perf_counter() - start:5.1f}초, {size:6.1f}MB")
+
+        print(f"🏁 공고 {args.rows:,}개, 수집일 {args.dates}개, 컬럼 {len(COLUMNS)}개 읽기 (최소 3회)")
+
+        def read_sqlite():
+            conn = sqlite3.connect(db_path)
+            try:
+                return pd.read_sql(f"SELECT {', '.join(COLUMNS)} FROM job_postings", conn)
+            finally:
+                conn.close()
+
+        baseline, _ = timed(read_sqlite)
+        print(f"   sqlite            {baseline:6.3f}초")
+        for fmt, root in roots.items():
+            seconds, table = timed(lambda: ps.read_snapshot(root, ps.SOURCE_JUMPIT, COLUMNS))
+            print(f"   {fmt:7s} Table     {seconds:6.3f}초  (x{baseline / seconds:.0f}, {table.num_rows:,}행)")
+            seconds, _ = timed(lambda: ps.read_snapshot_df(root, ps.SOURCE_JUMPIT, COLUMNS))
+            print(f"   {fmt:7s} DataFrame {seconds:6.3f}초  (x{baseline / seconds:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+전송 계층 벤치마크 (로컬 테스트 서버)
+
+같은 요청 부하를 세 가지 방식으로 보내 처리량과 연결 생성 수를 비교한다.
+- no-pool : 요청마다 새 연결 (Connection: close) - 연결 재사용 없는 기준선
+- pooled  : PooledTransport (requests + 크기 맞춘 연결 풀 / keep-alive)
+- http2   : PooledTransport (httpx HTTP/2 다중화) - httpx[http2], hypercorn 설치 시에만
+
+사용법: python bench_transport.py [요청 수] [동시성] [응답 지연 ms]
+"""
+import sys
+import json
+import time
+import socket
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+import requests
+
+from http_transport import HTTP2_AVAILABLE, PooledTransport
+
+# 점핏 목록 응답과 비슷한 크기의 본문
+PAYLOAD = json.dumps({"result": {"totalCount": 1000, "positions": [
+    {"id": i, "title": f"백엔드 개발자 {i}", "companyName": "테스트", "techStacks": ["Python", "Django"]}
+    for i in range(20)
+]}}, ensure_ascii=False).encode('utf-8')
+
+# HTTP/2 테스트 서버 (hypercorn ASGI, h2c)
+ASGI_APP = '''
+import asyncio, os
+PAYLOAD = open(os.environ["BENCH_PAYLOAD"], "rb").read()
+DELAY = float(os.environ.get("BENCH_DELAY", "0"))
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    if DELAY:
+        await asyncio.sleep(DELAY)
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": PAYLOAD})
+'''
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    # 헤더와 본문을 한 번에 전송 (따로 보내면 Nagle + delayed ACK 로 keep-alive 연결이 ~40ms 씩 멈춤)
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    delay = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with _Handler.lock:
+            _Handler.connections += 1
+
+    def do_GET(self):
+        if self.delay:
+            time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _run(get, num_requests: int, concurrency: int, url: str) -> Dict:
+    """요청 실패는 중단하지 않고 센다 (크롤러에서는 make_safe_request 가 재시도하는 오류)"""
+    def fetch(i):
+        try:
+            get(url, params={"page": i}).raise_for_status()
+            return 0
+        except requests.exceptions.RequestException:
+            return 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        errors = sum(pool.map(fetch, range(num_requests)))
+    return {'seconds': time.perf_counter() - start, 'errors': errors}
+
+
+def bench_http1(num_requests: int, concurrency: int, delay: float) -> Dict[str, Dict]:
+    _Handler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/positions"
+    results = {}
+    try:
+        _Handler.connections = 0
+        run = _run(lambda u, params: requests.get(u, params=params, headers={"Connection": "close"}),
+                   num_requests, concurrency, url)
+        results['no-pool'] = {**run, 'connections': _Handler.connections}
+
+        _Handler.connections = 0
+        transport = PooledTransport(pool_size=concurrency)
+        run = _run(transport.get, num_requests, concurrency, url)
+        results['pooled'] = {**run, 'connections': _Handler.connections, **transport.stats()}
+        transport.close()
+    finally:
+        server.shutdown()
+    return results
+
+
+def bench_http2(num_requests: int, concurrency: int, delay: float) -> Dict[str, Dict]:
+    try:
+        import hypercorn  # noqa: F401
+    except ImportError:
+        print("⏭️ http2: hypercorn 미설치 - 건너뜀")
+        return {}
+    if not HTTP2_AVAILABLE:
+        print("⏭️ http2: httpx[http2] 미설치 - 건너뜀")
+        return {}
+
+    import os
+    import tempfile
+    workdir = tempfile.mkdtemp()
+    with open(os.path.join(workdir, "bench_app.py"), "w", encoding="utf-8") as f:
+        f.write(ASGI_APP)
+    with open(os.path.join(workdir, "payload.json"), "wb") as f:
+        f.write(PAYLOAD)
+
+    port = _free_port()
+    env = {**os.environ, "BENCH_PAYLOAD": os.path.join(workdir, "payload.json"), "BENCH_DELAY": str(delay)}
+    server = subprocess.Popen([sys.executable, "-m", "hypercorn", "--bind", f"127.0.0.1:{port}",
+                               "bench_app:app"], cwd=workdir, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f"http://127.0.0.1:{port}/api/positions"
+        for _ in range(50):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        transport = PooledTransport(pool_size=concurrency, http2=True, h2_prior_knowledge=True)
+        result = {**_run(transport.get, num_requests, concurrency, url), **transport.stats()}
+        result['connections'] = result['connections_opened']
+        transport.close()
+        return {'http2': result}
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    num_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    delay = float(sys.argv[3]) / 1000 if len(sys.argv) > 3 else 0.0
+
+    print(f"🏁 요청 {num_requests}회, 동시성 {concurrency}, 응답 지연 {delay * 1000:.0f}ms")
+    results = bench_http1(num_requests, concurrency, delay)
+    results.update(bench_http2(num_requests, concurrency, delay))
+
+    baseline = results['no-pool']['seconds']
+    for name, result in results.items():
+        print(f"   {name:8s} {num_requests / result['seconds']:8.1f} req/s  "
+              f"연결 {result['connections']:4d}개  실패 {result['errors']:3d}회  "
+              f"(기준 대비 x{baseline / result['seconds']:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+리멤버 직무 카테고리 병렬 크롤링 (카테고리별 목록 동시 수집 + 공유 상세 큐)
+
+- 카테고리마다 별도 브라우저(전용 user-data-dir)에서 목록 스크롤을 동시에 진행
+- 목록 하나가 끝나면 곧바로 상세 작업을 공유 큐에 넣어, 다른 카테고리 목록이 끝나기 전에 상세 수집 시작
+- 모든 워커의 페이지 이동과 목록 스크롤(무한 스크롤 목록 API 요청)은 공유 politeness 예산(PolitenessBudget)의
+  한 시간축에서 차례를 예약해 사이트 전체 요청 간격을 지킴 (순차 실행의 카테고리 간 30~60초 휴식 대신 요청 간격으로 조절)
+  · 스크롤: 2~4초 (순차 실행의 스크롤 간 읽기 시간과 같음) / 페이지 이동: 4~7초
+  · 따라서 사이트가 받는 요청 빈도는 순차 실행의 목록 스크롤 구간을 넘지 않는다
+
+절충: 목록 스크롤은 워커 수와 무관하게 사이트 전체로 순차 실행 속도를 넘지 못하므로,
+목록 단계 시간 ≈ 전체 스크롤 수 × 3초 (순차 실행에서 카테고리 간 휴식만 빠진 시간) 이고
+"가장 느린 카테고리 목록 시간" 까지 줄지는 않는다. 단축분은 카테고리 간 휴식 제거 +
+목록 수집 중 상세 수집을 겹쳐 실행하는 데서 나온다.
+"""
+import time
+import queue
+import random
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from log_setup import get_run_id, set_run_id
+
+logger = logging.getLogger(__name__)
+
+# 워커 전체 기준 페이지 이동 간격 (초) + 무작위 지연
+DEFAULT_MIN_INTERVAL = 4.0
+DEFAULT_JITTER = 3.0
+# 목록 스크롤 간격 - 순차 실행의 스크롤 후 읽기 시간(2~4초)에 맞춤
+SCROLL_MIN_INTERVAL = 2.0
+SCROLL_JITTER = 2.0
+
+# 상세 워커 종료 신호
+_DONE = None
+
+
+class PolitenessBudget:
+    """
+    여러 워커가 공유하는 페이지 이동 / 목록 스크롤 간격 (스레드 안전).
+    두 종류 모두 같은 시간축에서 차례를 예약하고, 스크롤은 더 짧은 간격만 차지한다.
+    """
+
+    def __init__(self, min_interval: float = DEFAULT_MIN_INTERVAL, jitter: float = DEFAULT_JITTER,
+                 scroll_interval: float = SCROLL_MIN_INTERVAL, scroll_jitter: float = SCROLL_JITTER):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.scroll_interval = scroll_interval
+        self.scroll_jitter = scroll_jitter
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self.stats = {'requests': 0, 'scrolls': 0, 'waited_seconds': 0.0}
+
+    def wait(self, scroll: bool = False):
+        """다음 요청 가능 시각을 예약하고 그때까지 대기 (scroll=True: 목록 스크롤 간격)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            if scroll:
+                self._next_slot = slot + self.scroll_interval + random.uniform(0, self.scroll_jitter)
+                self.stats['scrolls'] += 1
+            else:
+                self._next_slot = slot + self.min_interval + random.uniform(0, self.jitter)
+                self.stats['requests'] += 1
+            self.stats['waited_seconds'] += slot - now
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _listing_worker(crawler, index: int, category_name: str, category_url: str, jobs_per_category: int,
+                    detail_queue: queue.Queue, workers: List, run_id: str):
+    set_run_id(run_id)
+    worker = crawler.spawn_worker(f"list-{index}")
+    workers.append(worker)
+    try:
+        if not worker.setup_stealth_driver():
+            return
+        category_jobs = worker.crawl_single_category(category_name, category_url)
+        selected = category_jobs[:jobs_per_category]
+        for position, job in enumerate(selected):
+            detail_queue.put(((index, position), job))
+        logger.info(f"📊 '{category_name}': {len(selected)}개 상세 큐에 추가 (전체 {len(category_jobs)}개 중)")
+    except Exception as e:
+        logger.error(f"❌ '{category_name}' 목록 워커 오류: {e}")
+    finally:
+        worker.cleanup()
+
+
+def _detail_worker(crawler, index: int, detail_queue: queue.Queue, results: List[Tuple],
+                   workers: List, run_id: str):
+    set_run_id(run_id)
+    worker = crawler.spawn_worker(f"detail-{index}")
+    workers.append(worker)
+    try:
+        if not worker.setup_stealth_driver():
+            return  # 남은 작업은 다른 상세 워커가 처리
+        while True:
+            item = detail_queue.get()
+            if item is _DONE:
+                break
+            order, job = item
+            for result in worker.enhance_with_detailed_info([job], max_detail=1):
+                results.append((order, result))
+    except Exception as e:
+        logger.error(f"❌ 상세 워커 {index} 오류: {e}")
+    finally:
+        worker.cleanup()
+
+
+def crawl_categories_parallel(crawler, jobs_per_category: int = 40, detail_workers: int = 2,
+                              max_listing_workers: Optional[int] = None,
+                              budget: Optional[PolitenessBudget] = None) -> List[Dict]:
+    """
+    카테고리 목록을 동시에 수집하면서 상세 정보를 바로 수집 (crawler.run 의 1~2단계 대체).
+    결과는 카테고리 순서 → 목록 순서로 정렬해 반환하고, 워커 통계는 crawler 에 합산한다.
+    """
+    run_id = get_run_id()
+    crawler.politeness = budget or crawler.politeness or PolitenessBudget()
+    categories = list(crawler.target_job_categories.items())
+    max_listing_workers = max_listing_workers or len(categories)
+
+    detail_queue: queue.Queue = queue.Queue()
+    results: List[Tuple] = []
+    workers: List = []
+    start = time.perf_counter()
+
+    detail_threads = [
+        threading.Thread(target=_detail_worker, name=f"remember-detail-{i}",
+                         args=(crawler, i, detail_queue, results, workers, run_id), daemon=True)
+        for i in range(max(1, detail_workers))
+    ]
+    for thread in detail_threads:
+        thread.start()
+
+    # 목록 워커는 max_listing_workers 개씩 (카테고리 수보다 적게 주면 나눠서 실행)
+    for offset in range(0, len(categories), max_listing_workers):
+        listing_threads = [
+            threading.Thread(target=_listing_worker, name=f"remember-list-{offset + i}",
+                             args=(crawler, offset + i, name, url, jobs_per_category,
+                                   detail_queue, workers, run_id), daemon=True)
+            for i, (name, url) in enumerate(categories[offset:offset + max_listing_workers])
+        ]
+        for thread in listing_threads:
+            thread.start()
+        for thread in listing_threads:
+            thread.join()
+    listing_seconds = time.perf_counter() - start
+    logger.info(f"📋 전체 카테고리 목록 수집 완료 - {listing_seconds:.1f}초 (남은 상세 작업 {detail_queue.qsize()}개)")
+
+    for _ in detail_threads:
+        detail_queue.put(_DONE)
+    for thread in detail_threads:
+        thread.join()
+
+    for worker in workers:
+        crawler.merge_worker_stats(worker)
+    results.sort(key=lambda item: item[0])
+    budget_stats = crawler.politeness.stats
+    logger.info(f"⚡ 병렬 크롤링 완료: {len(results)}개 - {time.perf_counter() - start:.1f}초 "
+                f"(목록 {listing_seconds:.1f}초, 페이지 이동 {budget_stats['requests']}회, 스크롤 {budget_stats['scrolls']}회, "
+                f"간격 대기 {budget_stats['waited_seconds']:.0f}초)")
+    return [job for _, job in results]
@@ -7,6 +7,8 @@ from sklearn.metrics.pairwise import cosine_similarity
 import matplotlib.font_manager as fm
 import matplotlib
 import platform
+from job_matcher import merge_job_sources
+from posting_snapshot import load_postings, SOURCE_RALLIT, SOURCE_REMEMBER_SW
 
 # 맥에서 한글 폰트 설정
 system = platform.system()
@@ -66,17 +68,23 @@ if system == 'Darwin':
 db_path = "job_dev_rallit_1.db"
 csv_path = "remember_sw.csv"
 
-# 데이터 불러오기
-conn = sqlite3.connect(db_path)
-job_df = pd.read_sql("SELECT title, jobSkillKeywords, companyRepresentativeImage, isBookmarked FROM jobs", conn)
-conn.close()
+def read_jobs_db():
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql("SELECT title, jobSkillKeywords, companyRepresentativeImage, isBookmarked FROM jobs", conn)
+    finally:
+        conn.close()
+
 
-csv_df = pd.read_csv(csv_path, encoding='cp949')
-csv_df = csv_df[['title', 'job_description', 'thumbnail_url']]
+# 데이터 불러오기 (컬럼형 스냅샷이 있으면 필요한 컬럼만, 없으면 SQLite / CSV 원본)
+job_df = load_postings(SOURCE_RALLIT, ['title', 'jobSkillKeywords', 'companyRepresentativeImage', 'isBookmarked'],
+                       read_jobs_db)
+csv_df = load_postings(SOURCE_REMEMBER_SW, ['title', 'job_description', 'thumbnail_url'],
+                       lambda: pd.read_csv(csv_path, encoding='cp949'))
 csv_df = csv_df.rename(columns={"job_description": "description"})
 
-# 병합
-df = pd.merge(csv_df, job_df, on="title", how="outer")
+# 병합 (제목 정규화 + 퍼지 매칭)
+df = merge_job_sources(csv_df, job_df, on="title")
 
 # 결측치 처리
 df['description'] = df['description'].fillna('')
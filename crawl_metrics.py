@@ -0,0 +1,217 @@
+"""
+크롤링 계측 (지연 시간 히스토그램, 전송량, 재시도, 429, 대기/작업 시간)
+
+JumpitCrawler 의 make_safe_request / parse_job_posting / save_to_database / sleep 호출을
+감싸서 기록하고, Prometheus 텍스트 포맷과 실행 종료 리포트(dict/JSON)로 내보낸다.
+"""
+import json
+import time
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# 기본 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000)
+
+# 리포트에서 병목 판단에 쓰는 작업 구분
+NETWORK_STAGE = 'request'
+DB_STAGE = 'db'
+
+
+def _escape_label(value) -> str:
+    """Prometheus 라벨 값 이스케이프 (\\, ", 줄바꿈)"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    """Prometheus 방식 누적 버킷 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.total += value
+        self.count += 1
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[idx] += 1
+                break
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (마지막 버킷을 넘으면 가장 큰 상한으로 고정 - JSON 에 Infinity 방지)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        # Prometheus histogram_quantile 과 같이 +Inf 버킷은 가장 큰 유한 상한으로 보고
+        return self.buckets[-1] if self.buckets else 0.0
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result, running = [], 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            result.append((repr(bound), running))
+        result.append(('+Inf', self.count))
+        return result
+
+
+class CrawlMetrics:
+    """크롤러 실행 단위 계측값 모음 (스레드 안전)"""
+
+    def __init__(self, prefix: str = "jumpit_crawler"):
+        self.prefix = prefix
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self.counters: Dict[Tuple[str, Tuple], float] = defaultdict(float)
+        self.histograms: Dict[Tuple[str, Tuple], Histogram] = {}
+        # 단계별 누적 시간 (request / parse / db / sleep:<reason>)
+        self.stage_seconds: Dict[str, float] = defaultdict(float)
+
+    # ------------------------------------------------------------------ 기록
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] += value
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def get(self, name: str, **labels) -> float:
+        """카운터 값 (라벨 미지정 시 모든 라벨 합계)"""
+        with self._lock:
+            if labels:
+                return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+            return sum(v for (n, _), v in self.counters.items() if n == name)
+
+    @contextmanager
+    def timed(self, stage: str, **labels):
+        """작업 구간 시간 측정 (히스토그램 + 단계별 누적)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.observe(f"{stage}_duration_seconds", elapsed, **labels)
+            with self._lock:
+                self.stage_seconds[stage] += elapsed
+
+    def sleep(self, seconds: float, reason: str = "politeness"):
+        """time.sleep 대체 - 대기 사유별로 누적"""
+        if seconds <= 0:
+            return
+        time.sleep(seconds)
+        self.inc("sleep_seconds_total", seconds, reason=reason)
+        with self._lock:
+            self.stage_seconds[f"sleep:{reason}"] += seconds
+
+    def record_response(self, status_code: int, size_bytes: int):
+        """HTTP 응답 상태/크기 기록"""
+        self.inc("requests_total", status=str(status_code))
+        self.inc("response_bytes_total", size_bytes)
+        self.observe("response_size_bytes", size_bytes, buckets=SIZE_BUCKETS)
+        if status_code == 429:
+            self.inc("rate_limited_total")
+
+    # ------------------------------------------------------------------ 내보내기
+    @staticmethod
+    def _format_labels(labels: Tuple, extra: Optional[Dict] = None) -> str:
+        items = list(labels) + list((extra or {}).items())
+        if not items:
+            return ""
+        body = ",".join(f'{k}="{_escape_label(v)}"' for k, v in items)
+        return "{" + body + "}"
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {k: v for k, v in self.histograms.items()}
+            stage_seconds = dict(self.stage_seconds)
+
+        seen = set()
+        for (name, labels), value in sorted(counters.items()):
+            metric = f"{self.prefix}_{name}"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} counter")
+                seen.add(metric)
+            lines.append(f"{metric}{self._format_labels(labels)} {value:g}")
+
+        for (name, labels), histogram in sorted(histograms.items(), key=lambda kv: kv[0]):
+            metric = f"{self.prefix}_{name}"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} histogram")
+                seen.add(metric)
+            for bound, count in histogram.cumulative():
+                lines.append(f"{metric}_bucket{self._format_labels(labels, {'le': bound})} {count}")
+            lines.append(f"{metric}_sum{self._format_labels(labels)} {histogram.total:g}")
+            lines.append(f"{metric}_count{self._format_labels(labels)} {histogram.count}")
+
+        metric = f"{self.prefix}_stage_seconds_total"
+        lines.append(f"# TYPE {metric} counter")
+        for stage, seconds in sorted(stage_seconds.items()):
+            lines.append(f"{metric}{self._format_labels((('stage', stage),))} {seconds:g}")
+        return "\n".join(lines) + "\n"
+
+    def report(self) -> Dict:
+        """실행 종료 리포트 - 네트워크/DB/대기(politeness) 중 어디에 시간이 쓰였는지"""
+        wall = time.time() - self.started_at
+        with self._lock:
+            stage_seconds = dict(self.stage_seconds)
+            histograms = dict(self.histograms)
+
+        sleep_total = sum(v for k, v in stage_seconds.items() if k.startswith('sleep:'))
+        network = stage_seconds.get(NETWORK_STAGE, 0.0)
+        db = stage_seconds.get(DB_STAGE, 0.0)
+        shares = {'network': network, 'db': db, 'politeness': sleep_total,
+                  'cpu': stage_seconds.get('parse', 0.0)}
+        bound = max(shares, key=shares.get) if any(shares.values()) else 'idle'
+
+        latency = {}
+        for (name, labels), histogram in histograms.items():
+            if name.endswith('_duration_seconds') and not labels:
+                latency[name.replace('_duration_seconds', '')] = {
+                    'count': histogram.count,
+                    'avg': round(histogram.total / histogram.count, 4) if histogram.count else 0.0,
+                    'p50': histogram.quantile(0.5),
+                    'p95': histogram.quantile(0.95),
+                }
+
+        return {
+            'wall_seconds': round(wall, 2),
+            'bound_by': bound,
+            'seconds': {k: round(v, 2) for k, v in shares.items()},
+            'share': {k: round(v / wall, 3) if wall else 0.0 for k, v in shares.items()},
+            'sleep_by_reason': {k.split(':', 1)[1]: round(v, 2)
+                                for k, v in stage_seconds.items() if k.startswith('sleep:')},
+            'requests': int(self.get('requests_total')),
+            'failed_requests': int(self.get('failed_requests_total')),
+            'retries': int(self.get('retries_total')),
+            'rate_limited': int(self.get('rate_limited_total')),
+            'bytes': int(self.get('response_bytes_total')),
+            'parsed_postings': int(self.get('parsed_postings_total')),
+            'parse_errors': int(self.get('parse_errors_total')),
+            'latency': latency,
+        }
+
+    def write(self, prom_path: str, report_path: Optional[str] = None):
+        """Prometheus textfile collector 용 파일 + JSON 리포트 저장"""
+        with open(prom_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        if report_path:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, ensure_ascii=False, indent=2)
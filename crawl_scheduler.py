@@ -0,0 +1,204 @@
+"""
+우선순위 기반 크롤링 스케줄러
+
+posting_history (조회수/북마크 변경 이력) 와 job_postings.deadline 으로 공고별 '갱신 가치'를 매기고,
+search_memberships 로 검색 조건별 가치를 합산해 다음 실행의 페이지 예산을 배분한다.
+- 마감 임박 / 조회수·북마크 증가가 빠른 공고 → 가치 높음
+- 마감 지난 공고 → 가치 0 (더 볼 필요 없음)
+- 가치 낮은 검색은 예산을 받지 못해 건너뛰되, max_revisit_hours 가 지나면 최소 1페이지는 다시 확인
+"""
+import math
+import sqlite3
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 공고 점수 가중치
+URGENCY_WEIGHT = 3.0       # 마감 임박도 (1 / (1 + 남은 일수))
+VIEW_GROWTH_WEIGHT = 1.0   # log1p(일 평균 조회수 증가)
+BOOKMARK_GROWTH_WEIGHT = 2.0  # log1p(일 평균 북마크 증가)
+ALWAYS_OPEN_URGENCY = 0.05    # 상시채용 / 마감일 불명
+
+# 검색 점수: 마지막 크롤링 이후 경과 시간 보너스 (revisit 주기 대비 비율 × 가중치)
+STALENESS_WEIGHT = 1.0
+
+# 한 페이지에 담기는 공고 수 (예산 단위, jumpfit.DEFAULT_PAGE_LIMIT 과 동일)
+PAGE_ITEMS = 20
+
+
+@dataclass
+class CrawlSchedule:
+    """검색별 페이지 예산"""
+    budgets: Dict[str, int] = field(default_factory=dict)  # 예산 > 0 인 검색만
+    scores: Dict[str, float] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    total_pages: int = 0
+    hot_postings: int = 0
+
+    def summary(self) -> str:
+        used = sum(self.budgets.values())
+        return (f"검색 {len(self.budgets)}개에 {used}/{self.total_pages}페이지 배분, "
+                f"{len(self.skipped)}개 건너뜀, 우선 갱신 대상 공고 {self.hot_postings}개")
+
+
+def _parse_time(value: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:19], TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def _days_left(deadline: str, now: datetime) -> Optional[float]:
+    """남은 일수 (상시채용/형식 불명은 None)"""
+    if not deadline or deadline == '상시채용':
+        return None
+    try:
+        return (datetime.strptime(deadline[:10], '%Y-%m-%d') + timedelta(days=1) - now).total_seconds() / 86400
+    except ValueError:
+        return None
+
+
+def growth_rates(conn: sqlite3.Connection, now: datetime, window_days: float = 14) -> Dict[str, Dict[str, float]]:
+    """
+    공고별 조회수/북마크 일 평균 증가량.
+    이력은 변경 시점만 기록되므로 (창 시작 시점 값 → 최신 값) / (창 시작 시점 → 현재) 로 계산한다.
+    """
+    since = (now - timedelta(days=window_days)).strftime(TIME_FORMAT)
+    rows = conn.execute('''
+        SELECT position_id, field, observed_at, value
+        FROM posting_history
+        WHERE field IN ('view_count', 'bookmark_count')
+        ORDER BY position_id, field, observed_at
+    ''')
+
+    rates: Dict[str, Dict[str, float]] = {}
+    baseline = latest = None
+    current_key = None
+
+    def flush():
+        if current_key and baseline and latest and latest[0] > baseline[0]:
+            start = max(_parse_time(baseline[0]) or now, now - timedelta(days=window_days))
+            days = max((now - start).total_seconds() / 86400, 1.0)
+            delta = (latest[1] or 0) - (baseline[1] or 0)
+            rates.setdefault(current_key[0], {})[current_key[1]] = max(delta, 0) / days
+
+    for position_id, field_name, observed_at, value in rows:
+        key = (position_id, field_name)
+        if key != current_key:
+            flush()
+            current_key, baseline, latest = key, None, None
+        # 창 이전의 마지막 값이 기준값, 창 안에서는 첫 값이 기준
+        if baseline is None or observed_at <= since:
+            baseline = (observed_at, value)
+        latest = (observed_at, value)
+    flush()
+    return rates
+
+
+def posting_scores(db_name: str, now: Optional[datetime] = None, window_days: float = 14) -> Dict[str, float]:
+    """공고별 갱신 가치 (마감 지난 공고는 제외)"""
+    now = now or datetime.now()
+    conn = sqlite3.connect(db_name)
+    try:
+        rates = growth_rates(conn, now, window_days)
+        scores = {}
+        for position_id, deadline in conn.execute("SELECT position_id, deadline FROM job_postings"):
+            days_left = _days_left(deadline, now)
+            if days_left is not None and days_left < 0:
+                continue
+            urgency = ALWAYS_OPEN_URGENCY if days_left is None else 1 / (1 + days_left)
+            growth = rates.get(position_id, {})
+            scores[position_id] = (URGENCY_WEIGHT * urgency
+                                   + VIEW_GROWTH_WEIGHT * math.log1p(growth.get('view_count', 0))
+                                   + BOOKMARK_GROWTH_WEIGHT * math.log1p(growth.get('bookmark_count', 0)))
+        return scores
+    finally:
+        conn.close()
+
+
+def last_crawled(db_name: str) -> Dict[str, datetime]:
+    """검색별 마지막 크롤링 종료 시각 (crawling_logs)"""
+    conn = sqlite3.connect(db_name)
+    try:
+        rows = conn.execute("SELECT search_type, MAX(end_time) FROM crawling_logs GROUP BY search_type")
+        parsed = {search: _parse_time(end_time) for search, end_time in rows}
+        return {search: end_time for search, end_time in parsed.items() if end_time}
+    finally:
+        conn.close()
+
+
+def build_schedule(search_names: List[str], memberships: Dict[str, set], scores: Dict[str, float],
+                   last_seen: Dict[str, datetime], total_pages: int, max_pages: int,
+                   now: Optional[datetime] = None, revisit_hours: float = 24,
+                   max_revisit_hours: float = 72) -> CrawlSchedule:
+    """
+    검색별 가치 = 구성 공고 가치 합 + 경과 시간 보너스, 가치 비례로 페이지 배분.
+    - 이력 없는 검색은 가치 추정이 불가하므로 최대 예산 (탐색)
+    - 검색별 예산 상한: min(max_pages, 알려진 공고 수를 담을 페이지 수 + 1)
+    """
+    now = now or datetime.now()
+    schedule = CrawlSchedule(total_pages=total_pages)
+
+    demand: Dict[str, int] = {}
+    forced: Dict[str, int] = {}
+    for search in search_names:
+        members = memberships.get(search)
+        if not members:
+            forced[search] = max_pages
+            continue
+        hours = (now - last_seen[search]).total_seconds() / 3600 if search in last_seen else max_revisit_hours
+        value = sum(scores.get(position_id, 0.0) for position_id in members)
+        schedule.scores[search] = round(value * (1 + STALENESS_WEIGHT * hours / revisit_hours), 3)
+        demand[search] = min(max_pages, math.ceil(len(members) / PAGE_ITEMS) + 1)
+        if hours >= max_revisit_hours:
+            forced[search] = 1
+
+    remaining = max(total_pages - sum(forced.values()), 0)
+    budgets = dict(forced)
+    total_score = sum(schedule.scores.values())
+    # 가치 높은 검색부터 비례 배분 (상한 초과분은 다음 검색으로 넘어감)
+    for search in sorted(demand, key=lambda s: -schedule.scores[s]):
+        if remaining <= 0 or not total_score:
+            break
+        # 반올림 0 이면 이번 실행에서는 건너뜀 (낮은 가치 검색은 덜 자주 방문)
+        share = round(remaining * schedule.scores[search] / total_score)
+        pages = min(demand[search] - budgets.get(search, 0), share, remaining)
+        if pages > 0:
+            budgets[search] = budgets.get(search, 0) + pages
+            remaining -= pages
+        total_score -= schedule.scores[search]
+
+    schedule.budgets = {s: budgets[s] for s in search_names if budgets.get(s)}
+    schedule.skipped = [s for s in search_names if s not in schedule.budgets]
+    hot = set()
+    for search in schedule.budgets:
+        hot |= {p for p in memberships.get(search, ()) if scores.get(p, 0.0) > ALWAYS_OPEN_URGENCY * URGENCY_WEIGHT}
+    schedule.hot_postings = len(hot)
+    return schedule
+
+
+def schedule_for_crawler(crawler, search_names: List[str], max_pages_per_search: int = 5,
+                         total_pages: Optional[int] = None, budget_ratio: float = 0.5,
+                         revisit_hours: float = 24, max_revisit_hours: float = 72) -> CrawlSchedule:
+    """
+    JumpitCrawler DB 이력으로 검색별 페이지 예산 산출.
+    total_pages 미지정 시 균등 배분 예산(검색 수 × 검색당 페이지)의 budget_ratio 만큼 사용.
+    """
+    from search_planner import load_memberships
+
+    now = datetime.now()
+    total_pages = total_pages or math.ceil(len(search_names) * max_pages_per_search * budget_ratio)
+    schedule = build_schedule(search_names, load_memberships(crawler.db_name),
+                              posting_scores(crawler.db_name, now), last_crawled(crawler.db_name),
+                              total_pages, max_pages_per_search, now, revisit_hours, max_revisit_hours)
+    logger.info(f"⏱️ 크롤링 스케줄: {schedule.summary()}")
+    for search in sorted(schedule.budgets, key=lambda s: -schedule.scores.get(s, float('inf')))[:10]:
+        logger.info(f"   - '{search}': {schedule.budgets[search]}페이지 (가치 {schedule.scores.get(search, '신규')})")
+    return schedule
@@ -0,0 +1,317 @@
+"""
+상세 페이지 원본 HTML 보관소 (SQLite, zstd 압축, 내용 해시 중복 제거)
+
+- blobs : 내용 해시(sha256) → 압축된 HTML (같은 내용은 한 번만 저장)
+- pages : (공고ID, 내용 해시) → 수집 시각 / URL / 목록 카드 정보(JSON)
+          공고 내용이 바뀌면 새 버전이 쌓이고, 재추출은 공고별 최신 버전을 사용
+- records : 공고ID → 최근 추출 결과와 지문 (목록 카드 지문 / 추출 결과 지문)
+            증분 수집 시 카드가 그대로인 공고는 상세 페이지를 다시 열지 않고 이전 결과를 재사용
+
+zstandard 미설치 시 zlib 으로 압축한다 (codec 컬럼에 기록되므로 섞여 있어도 읽을 수 있음).
+
+재추출 (크롤링 없이 보관된 HTML 에 현재 추출기를 다시 적용):
+    python detail_archive.py reextract [--workers N] [--out 파일.csv] [--archive detail_archive.db]
+    python detail_archive.py stats
+"""
+import sys
+import json
+import zlib
+import sqlite3
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE = "detail_archive.db"
+ZSTD_LEVEL = 10
+ZLIB_LEVEL = 6
+
+CODEC_ZSTD = 'zstd'
+CODEC_ZLIB = 'zlib'
+
+# 재추출 시 한 번에 워커로 넘기는 페이지 수 (보관소 전체를 메모리에 올리지 않음)
+REEXTRACT_BATCH = 256
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+
+def compress(data: bytes) -> Tuple[str, bytes]:
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return CODEC_ZLIB, zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd 로 압축된 페이지 - zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"알 수 없는 압축 형식: {codec}")
+
+
+class DetailArchive:
+    """상세 페이지 원본 보관소"""
+
+    def __init__(self, db_path: str = DEFAULT_ARCHIVE):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_database()
+
+    def init_database(self):
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS blobs (
+                content_hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                raw_size INTEGER NOT NULL,
+                data BLOB NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS pages (
+                posting_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                url TEXT,
+                job_json TEXT,
+                first_seen_at TEXT NOT NULL,
+                last_seen_at TEXT NOT NULL,
+                PRIMARY KEY (posting_id, content_hash)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_pages_latest ON pages(posting_id, last_seen_at);
+
+            CREATE TABLE IF NOT EXISTS records (
+                posting_id TEXT PRIMARY KEY,
+                card_hash TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                job_json TEXT NOT NULL,
+                changed_at TEXT NOT NULL,
+                checked_at TEXT NOT NULL
+            ) WITHOUT ROWID;
+        ''')
+        self.conn.commit()
+
+    def put(self, posting_id: str, html: str, url: str = '', job: Optional[Dict] = None) -> Tuple[str, bool]:
+        """페이지 저장 → (내용 해시, 새 내용 여부). 같은 내용이면 본문은 다시 압축/저장하지 않음"""
+        digest = content_hash(html)
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        is_new = self.conn.execute("SELECT 1 FROM blobs WHERE content_hash = ?", (digest,)).fetchone() is None
+        if is_new:
+            raw = html.encode('utf-8')
+            codec, data = compress(raw)
+            self.conn.execute("INSERT INTO blobs (content_hash, codec, raw_size, data) VALUES (?, ?, ?, ?)",
+                              (digest, codec, len(raw), data))
+        self.conn.execute('''
+            INSERT INTO pages (posting_id, content_hash, url, job_json, first_seen_at, last_seen_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (posting_id, content_hash) DO UPDATE SET
+                last_seen_at = excluded.last_seen_at,
+                url = excluded.url,
+                job_json = excluded.job_json
+        ''', (str(posting_id), digest, url, json.dumps(job or {}, ensure_ascii=False), now, now))
+        self.conn.commit()
+        return digest, is_new
+
+    def get(self, digest: str) -> Optional[str]:
+        row = self.conn.execute("SELECT codec, data FROM blobs WHERE content_hash = ?", (digest,)).fetchone()
+        if row is None:
+            return None
+        return decompress(row[0], row[1]).decode('utf-8')
+
+    def latest(self, posting_id: str) -> Optional[str]:
+        row = self.conn.execute('''
+            SELECT content_hash FROM pages WHERE posting_id = ?
+            ORDER BY last_seen_at DESC LIMIT 1
+        ''', (str(posting_id),)).fetchone()
+        return self.get(row[0]) if row else None
+
+    def iter_latest(self) -> Iterator[Tuple[str, str, Dict, str]]:
+        """공고별 최신 버전: (공고ID, URL, 목록 카드 정보, HTML)"""
+        rows = self.conn.execute('''
+            SELECT p.posting_id, p.url, p.job_json, b.codec, b.data
+            FROM pages p
+            JOIN blobs b ON b.content_hash = p.content_hash
+            WHERE p.last_seen_at = (SELECT MAX(last_seen_at) FROM pages WHERE posting_id = p.posting_id)
+            GROUP BY p.posting_id
+            ORDER BY p.posting_id
+        ''')
+        for posting_id, url, job_json, codec, data in rows:
+            yield posting_id, url, json.loads(job_json or '{}'), decompress(codec, data).decode('utf-8')
+
+    def previous_record(self, posting_id: str) -> Optional[Dict]:
+        """최근 추출 결과 {'card_hash', 'fingerprint', 'job', 'changed_at', 'checked_at'}, 없으면 None"""
+        row = self.conn.execute('''
+            SELECT card_hash, fingerprint, job_json, changed_at, checked_at FROM records WHERE posting_id = ?
+        ''', (str(posting_id),)).fetchone()
+        if row is None:
+            return None
+        return {'card_hash': row[0], 'fingerprint': row[1], 'job': json.loads(row[2]),
+                'changed_at': row[3], 'checked_at': row[4]}
+
+    def put_record(self, posting_id: str, card_hash: str, fingerprint: str, job: Dict) -> str:
+        """추출 결과 기록 → 'new' / 'changed' / 'unchanged' (내용이 그대로면 changed_at 유지)"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        row = self.conn.execute("SELECT fingerprint FROM records WHERE posting_id = ?",
+                                (str(posting_id),)).fetchone()
+        status = 'new' if row is None else ('unchanged' if row[0] == fingerprint else 'changed')
+        self.conn.execute('''
+            INSERT INTO records (posting_id, card_hash, fingerprint, job_json, changed_at, checked_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (posting_id) DO UPDATE SET
+                card_hash = excluded.card_hash,
+                fingerprint = excluded.fingerprint,
+                job_json = excluded.job_json,
+                changed_at = CASE WHEN records.fingerprint = excluded.fingerprint
+                                  THEN records.changed_at ELSE excluded.changed_at END,
+                checked_at = excluded.checked_at
+        ''', (str(posting_id), card_hash, fingerprint, json.dumps(job, ensure_ascii=False, default=str), now, now))
+        self.conn.commit()
+        return status
+
+    def stats(self) -> Dict:
+        postings, versions = self.conn.execute(
+            "SELECT COUNT(DISTINCT posting_id), COUNT(*) FROM pages").fetchone()
+        blobs, raw_bytes, stored_bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs").fetchone()
+        records = self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        return {
+            'postings': postings,
+            'records': records,
+            'versions': versions,
+            'blobs': blobs,
+            'raw_mb': round(raw_bytes / 1024 / 1024, 2),
+            'stored_mb': round(stored_bytes / 1024 / 1024, 2),
+            'compression_ratio': round(raw_bytes / stored_bytes, 1) if stored_bytes else 0.0,
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+# ---------------------------------------------------------------------- 재추출
+
+_extractor = None
+
+
+def _init_extractor(parser_backend: str = "auto"):
+    """워커 프로세스마다 추출기 1개 (selenium / 크롤러 로깅 설정 없이 추출 모듈만 로드)"""
+    global _extractor
+    from detail_extraction import DetailExtractor
+    _extractor = DetailExtractor(parser_backend)
+
+
+def _reextract_with(extractor, item: Tuple[str, str, Dict, str]) -> Tuple[str, Optional[Dict], str]:
+    posting_id, url, job, html = item
+    # 목록 카드 정보 위에 추출 결과를 덮어씀 (빠진 필드는 기본 구조로 채움)
+    base = extractor.new_job_info(job.get('직무카테고리', ''))
+    base.update(job)
+    job = base
+    job['공고ID'] = job.get('공고ID') or posting_id
+    job['link'] = job.get('link') or url
+    try:
+        result, exclude_reason = extractor.extract_from_html(job, html)
+        return posting_id, result, exclude_reason or ''
+    except Exception as e:
+        return posting_id, None, f"오류: {e}"
+
+
+def _reextract_one(item: Tuple[str, str, Dict, str]) -> Tuple[str, Optional[Dict], str]:
+    """프로세스 워커용 (_init_extractor 로 만든 프로세스 전역 추출기 사용)"""
+    if _extractor is None:
+        _init_extractor()
+    return _reextract_with(_extractor, item)
+
+
+def _batches(items: Iterator, size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def reextract(archive_path: str = DEFAULT_ARCHIVE, workers: Optional[int] = None,
+              out: Optional[str] = None) -> Optional[str]:
+    """보관된 최신 HTML 전체에 현재 추출기를 병렬로 다시 적용해 CSV 저장"""
+    import time
+    import pandas as pd
+    from concurrent.futures import ProcessPoolExecutor
+
+    archive = DetailArchive(archive_path)
+    start = time.perf_counter()
+    rows, excluded, failed = [], 0, 0
+    try:
+        items = archive.iter_latest()
+        executor = None
+        if workers == 1:
+            _init_extractor()
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_extractor)
+        try:
+            for batch in _batches(items, REEXTRACT_BATCH):
+                if executor is None:
+                    results = map(_reextract_one, batch)
+                else:
+                    results = executor.map(_reextract_one, batch, chunksize=16)
+                for posting_id, job, reason in results:
+                    if job is not None:
+                        rows.append(job)
+                    elif reason.startswith("오류"):
+                        failed += 1
+                        logger.warning(f"⚠️ 재추출 실패 {posting_id}: {reason}")
+                    else:
+                        excluded += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    finally:
+        archive.close()
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"♻️ 재추출 완료: {len(rows)}개 (제외 {excluded}, 실패 {failed}) - {elapsed:.1f}초")
+    if not rows:
+        return None
+    out = out or f"reextracted_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    columns = [c for c in rows[0] if c not in ('link', 'crawled_at')]
+    pd.DataFrame(rows)[columns].to_csv(out, index=False, encoding='utf-8-sig')
+    logger.info(f"📁 재추출 결과 저장: {out}")
+    return out
+
+
+def main():
+    import argparse
+    from log_setup import setup_logging
+
+    parser = argparse.ArgumentParser(description="상세 페이지 보관소")
+    parser.add_argument('command', choices=['reextract', 'stats'])
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE)
+    parser.add_argument('--workers', type=int, default=None, help="재추출 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--out', default=None)
+    args = parser.parse_args()
+
+    setup_logging('detail_archive.jsonl')
+    if args.command == 'stats':
+        archive = DetailArchive(args.archive)
+        print(json.dumps(archive.stats(), ensure_ascii=False, indent=2))
+        archive.close()
+    else:
+        if not reextract(args.archive, args.workers, args.out):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
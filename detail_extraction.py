@@ -0,0 +1,229 @@
+"""
+상세 페이지 필드 추출 (드라이버 없이 동작)
+
+JD.py 크롤러와 detail_archive 재추출 워커가 함께 쓴다. selenium 을 import 하지 않으므로
+보관된 HTML 재추출 / 파서 벤치마크에서도 브라우저 없이 가져다 쓸 수 있다.
+"""
+import logging
+from datetime import datetime
+
+from html_backend import parse_html, resolve_backend
+from field_extraction import (exclude_reason as find_exclude_reason, most_common_company, detail_fields,
+                              TITLE_SUFFIX_PATTERNS, SECTION_HEADERS, SECTION_HEADER_TAGS,
+                              SECTION_HEADER_PATTERNS, SECTION_OTHER_KEYWORDS, section_fallback,
+                              posted_date, signing_bonus)
+from enrichment import INFERRED, normalize_deadline, ordered_unique, finalize_provenance
+
+logger = logging.getLogger(__name__)
+
+
+class DetailExtractor:
+    """상세 페이지 HTML → 공고 필드 (parser_backend: selectolax > lxml > html.parser, 추출 결과는 동일)"""
+
+    def __init__(self, parser_backend: str = "auto"):
+        self.parser_backend = resolve_backend(parser_backend)
+
+    def is_excluded_job(self, job_text, job_title, company_name):
+        """헤드헌터 공고 및 해외 근무 제외 필터 (키워드 목록은 field_extraction 참고)"""
+        reason = find_exclude_reason(f"{job_title} {company_name} {job_text}")
+        return (True, reason) if reason else (False, None)
+
+    def new_job_info(self, category_name):
+        """완전한 정보 구조"""
+        return {
+            '공고ID': '',
+            '공고명': '',
+            '회사명': '', 
+            '지역': '',
+            '직무': '',
+            '경력요건': '',
+            '학력요건': '',
+            '채용유형': '',
+            '공고시작일': '',
+            '마감일': '',
+            '합격축하금': '',
+            '직무카테고리': category_name,
+            '공고소개': '',
+            '주요업무': '',
+            '자격요건': '',
+            '우대사항': '',
+            '채용절차': '',
+            'link': '',
+            'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def extract_detailed_sections(self, page):
+        """상세 섹션별 정보 추출"""
+        sections = {
+            '공고소개': '',
+            '주요업무': '',
+            '자격요건': '',
+            '우대사항': '',
+            '채용절차': ''
+        }
+        
+        page_text = page.text
+        try:
+            # 섹션 헤더를 찾아서 다음 내용 추출 (키워드별 정규식은 모듈 로드 시 컴파일)
+            for section_name, keywords in SECTION_HEADERS.items():
+                section_content = ''
+                
+                # 방법 1: 헤더 태그 다음의 내용 찾기
+                for keyword in keywords:
+                    # h1~h6, div, span 등에서 키워드 찾기
+                    header_elements = page.find_headers(SECTION_HEADER_TAGS, SECTION_HEADER_PATTERNS[keyword])
+                    other_keywords = SECTION_OTHER_KEYWORDS[keyword]
+                    
+                    for header in header_elements:
+                        # 헤더 다음 형제 요소들에서 내용 수집
+                        content_parts = []
+                        
+                        for text in page.sibling_texts(header):
+                            if len(content_parts) >= 10:  # 최대 10개 요소
+                                break
+                            text = text.strip()
+                            if text and len(text) > 10:  # 의미있는 텍스트만
+                                content_parts.append(text)
+                                
+                            # 다음 섹션 헤더를 만나면 중단
+                            if any(kw in text for kw in other_keywords):
+                                break
+                        
+                        if content_parts:
+                            section_content = ' '.join(content_parts)
+                            break
+                    
+                    if section_content:
+                        break
+                
+                # 방법 2: 정규식으로 텍스트에서 섹션 찾기
+                if not section_content:
+                    for keyword in keywords:
+                        content = section_fallback(page_text, keyword)
+                        if content is not None:
+                            section_content = content.strip()
+                            # 너무 길면 앞부분만
+                            if len(section_content) > 1000:
+                                section_content = section_content[:1000] + "..."
+                            break
+                
+                sections[section_name] = section_content
+            
+        except Exception as e:
+            logger.debug(f"섹션 추출 중 오류: {e}")
+        
+        return sections
+
+    def extract_from_html(self, job, html):
+        """상세 페이지 HTML 에서 필드 추출 (드라이버 없이 동작 - 보관 페이지 재추출에도 사용)
+        제외 대상이면 (None, 제외 사유), 아니면 (job, None)"""
+        # 페이지 전체 텍스트 가져오기
+        page = parse_html(html, self.parser_backend)
+        page_text = page.text
+
+        # 🚫 상세 페이지에서도 제외 필터 재적용
+        is_excluded, exclude_reason = self.is_excluded_job(page_text, job['공고명'], job['회사명'])
+        if is_excluded:
+            return None, exclude_reason
+
+        # 필드별 출처 (기록하지 않은 필드는 값 유무로 extracted / missing)
+        sources = {}
+
+        # 1. 공고명 보완 (다양한 방법 시도)
+        if not job['공고명']:
+            title_strategies = [
+                ("h1", "메인 제목"),
+                ("h2", "부제목"),
+                (".job-title", "job-title 클래스"),
+                ("[class*='title']", "title 포함 클래스"),
+                ("[data-testid*='title']", "title 테스트 ID"),
+                ("strong", "강조 텍스트"),
+                (".posting-title", "posting-title 클래스"),
+                ("h3", "h3 제목")
+            ]
+
+            for selector, desc in title_strategies:
+                try:
+                    title_text = page.select_text(selector).strip()
+                    if title_text and len(title_text) > 3 and len(title_text) < 200:
+                        job['공고명'] = title_text
+                        logger.debug(f"제목 추출 성공 ({desc}): {title_text}")
+                        break
+                except:
+                    continue
+
+            # 여전히 제목이 없으면 페이지 제목에서 추출
+            if not job['공고명']:
+                try:
+                    page_title = page.title
+                    if page_title and "리멤버" not in page_title:
+                        # 페이지 제목에서 불필요한 부분 제거
+                        clean_title = page_title
+                        for suffix_pattern in TITLE_SUFFIX_PATTERNS:
+                            clean_title = suffix_pattern.sub('', clean_title)
+                        if clean_title and len(clean_title) > 3:
+                            job['공고명'] = clean_title.strip()
+                            logger.debug(f"페이지 제목에서 추출: {clean_title}")
+                except:
+                    pass
+
+        # 2. 회사명 보완 (강화된 방법)
+        if not job['회사명']:
+            company_strategies = [
+                ("[class*='company']", "company 클래스"),
+                ("[class*='corp']", "corp 클래스"),
+                ("[class*='brand']", "brand 클래스"),
+                ("[data-testid*='company']", "company 테스트 ID"),
+                (".company-name", "company-name 클래스"),
+                (".employer", "employer 클래스")
+            ]
+
+            for selector, desc in company_strategies:
+                try:
+                    company_text = page.select_text(selector).strip()
+                    if company_text and len(company_text) > 1 and len(company_text) < 100:
+                        job['회사명'] = company_text
+                        logger.debug(f"회사명 추출 성공 ({desc}): {company_text}")
+                        break
+                except:
+                    continue
+
+            # 여전히 회사명이 없으면 텍스트 패턴으로 찾기 (우선순위 높은 패턴의 최빈값)
+            if not job['회사명']:
+                most_common = most_common_company(page_text)
+                if most_common:
+                    job['회사명'] = most_common
+                    sources['회사명'] = INFERRED
+                    logger.debug(f"패턴으로 회사명 추출: {most_common}")
+
+        # 3~5. 직무 분야 / 학력 요건 / 채용 유형 (한 번의 스캔, 없으면 빈 값 - 기본값으로 채우지 않음)
+        fields = detail_fields(page_text)
+        job_matches = fields['category'] or fields['role']
+        if job_matches:
+            job['직무'] = ', '.join(ordered_unique(job_matches))  # 최대 3개, 본문 순서
+
+        if fields['education']:
+            job['학력요건'] = fields['education'][0]
+
+        if fields['employment']:
+            job['채용유형'] = fields['employment'][0]
+
+        # 6. 공고 시작일 (본문에 적힌 등록일/게시일만)
+        if not job['공고시작일']:
+            job['공고시작일'] = posted_date(page_text) or ''
+
+        # 7. 마감일 정규화 (D-N 은 수집 시각 기준 날짜로 추론)
+        job['마감일'], sources['마감일'] = normalize_deadline(job['마감일'], job.get('crawled_at'))
+
+        # 8. 합격축하금 (본문에 적힌 금액만)
+        bonus = signing_bonus(page_text)
+        if bonus is not None:
+            job['합격축하금'] = bonus
+
+        # ⭐ 9. 상세 섹션 정보 추출 (새로 추가!)
+        detailed_sections = self.extract_detailed_sections(page)
+        for section_name, content in detailed_sections.items():
+            job[section_name] = content
+
+        finalize_provenance(job, sources)
+        return job, None
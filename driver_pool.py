@@ -0,0 +1,302 @@
+"""
+Selenium 드라이버 풀 (드라이버 경로 캐시 / 워밍 인스턴스 / 상태 점검 / 자동 재생성)
+
+- chromedriver 경로는 한 번만 확인해서 파일에 캐시 (ChromeDriverManager 네트워크 조회 반복 방지)
+- 슬롯별 user-data-dir 를 재사용해 재시작 후에도 디스크 캐시/쿠키가 따뜻한 상태로 시작
+- 페이지 방문 전 상태 점검: 응답 없는 세션, N 페이지 초과, 브라우저 프로세스 트리 RSS 초과 시 재생성
+- warm_spares 개의 예비 인스턴스를 미리 띄워 두고 재생성 시 즉시 교체 (예비는 백그라운드에서 보충)
+"""
+import os
+import json
+import time
+import shutil
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from log_setup import context_thread
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성 - 없으면 리눅스 /proc 으로 RSS 측정
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "job_crawler", "chromedriver.json")
+DRIVER_CACHE_TTL = 7 * 24 * 3600  # 브라우저 업데이트 주기를 고려해 일주일마다 재확인
+
+# 세션이 죽었음을 뜻하는 WebDriver 오류 클래스 / 메시지
+# ('disconnected' 단독은 net::ERR_INTERNET_DISCONNECTED 같은 네트워크 오류와도 겹치므로 DevTools 연결 끊김만)
+DEAD_SESSION_ERRORS = ('InvalidSessionIdException', 'NoSuchWindowException')
+DEAD_SESSION_MARKERS = ('invalid session id', 'chrome not reachable', 'not connected to devtools',
+                        'session deleted', 'no such window', 'target window already closed',
+                        'connection refused', 'max retries exceeded')
+
+_driver_path_lock = threading.Lock()
+_driver_path: Optional[str] = None
+
+
+def resolve_driver_path(cache_file: str = DRIVER_CACHE_FILE, ttl: float = DRIVER_CACHE_TTL) -> Optional[str]:
+    """
+    chromedriver 경로 (CHROMEDRIVER_PATH 환경 변수 → 프로세스 메모 → 캐시 파일 → PATH → ChromeDriverManager 순).
+    None 이면 Selenium Manager 에 맡긴다.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+
+        env_path = os.environ.get('CHROMEDRIVER_PATH')
+        if env_path and os.path.exists(env_path):
+            _driver_path = env_path
+            return _driver_path
+
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                cached = json.load(f)
+            if os.path.exists(cached['path']) and time.time() - cached['resolved_at'] < ttl:
+                _driver_path = cached['path']
+                return _driver_path
+        except (OSError, ValueError, KeyError):
+            pass
+
+        path = shutil.which('chromedriver')
+        if not path:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                path = ChromeDriverManager().install()
+            except Exception as e:
+                logger.warning(f"⚠️ chromedriver 경로 확인 실패 - Selenium Manager 사용: {e}")
+                return None
+
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'path': path, 'resolved_at': time.time()}, f)
+        except OSError as e:
+            logger.debug(f"드라이버 경로 캐시 저장 실패: {e}")
+        _driver_path = path
+        logger.info(f"🧭 chromedriver 경로 캐시: {path}")
+        return _driver_path
+
+
+def _proc_children(pid: int) -> List[int]:
+    """리눅스 /proc 에서 자식 프로세스 목록 (재귀)"""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', encoding='utf-8') as f:
+                # pid (comm) state ppid ... - comm 에 공백/괄호가 있을 수 있어 마지막 ')' 기준으로 자름
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            parents.setdefault(ppid, []).append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        for child in parents.get(current, []):
+            tree.append(child)
+            stack.append(child)
+    return tree
+
+
+def _proc_rss(pid: int) -> int:
+    try:
+        with open(f'/proc/{pid}/status', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def process_tree_rss(pid: Optional[int]) -> int:
+    """chromedriver 와 하위 브라우저 프로세스들의 RSS 합계 (bytes, 측정 불가 시 0)"""
+    if not pid:
+        return 0
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            total = root.memory_info().rss
+            for child in root.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total
+        except psutil.Error:
+            return 0
+    if os.path.isdir('/proc'):
+        return sum(_proc_rss(p) for p in [pid] + _proc_children(pid))
+    return 0
+
+
+def is_dead_session_error(error: Exception) -> bool:
+    if type(error).__name__ in DEAD_SESSION_ERRORS:
+        return True
+    message = str(error).lower()
+    if 'net::err_' in message:
+        # 페이지 로딩 실패 (네트워크 오류) - 브라우저 세션은 정상
+        return False
+    return any(marker in message for marker in DEAD_SESSION_MARKERS)
+
+
+@dataclass
+class PooledDriver:
+    """풀에서 관리하는 드라이버 인스턴스"""
+    driver: object
+    slot: int
+    profile_dir: str
+    created_at: float = field(default_factory=time.time)
+    pages: int = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        try:
+            return self.driver.service.process.pid
+        except AttributeError:
+            return None
+
+    def rss_bytes(self) -> int:
+        return process_tree_rss(self.pid)
+
+    def is_healthy(self) -> bool:
+        """세션 응답 확인 (창 핸들 + 간단한 스크립트)"""
+        try:
+            return bool(self.driver.window_handles) and self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류 (무시): {e}")
+
+
+class DriverPool:
+    """
+    드라이버 풀.
+    factory(profile_dir) 는 user-data-dir 를 적용한 새 WebDriver 를 반환해야 한다.
+    """
+
+    def __init__(self, factory: Callable[[str], object], profile_root: str = "browser_profiles",
+                 max_pages: int = 150, max_rss_mb: float = 1500, warm_spares: int = 0):
+        self.factory = factory
+        self.profile_root = os.path.abspath(profile_root)
+        self.max_pages = max_pages
+        self.max_rss_bytes = int(max_rss_mb * 1024 * 1024)
+        self.warm_spares = warm_spares
+        self.current: Optional[PooledDriver] = None
+        self._spares: List[PooledDriver] = []
+        self._spare_lock = threading.Lock()
+        self._refill_thread: Optional[threading.Thread] = None
+        self._next_slot = 0
+        self.stats = {'created': 0, 'recycled': 0, 'crashes': 0, 'pages': 0}
+
+    def _slot_dir(self, slot: int) -> str:
+        path = os.path.join(self.profile_root, f"slot-{slot}")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _create(self, slot: Optional[int] = None) -> PooledDriver:
+        if slot is None:
+            # 현재/예비 인스턴스와 겹치지 않는 프로필 디렉터리 (Chrome 은 같은 user-data-dir 동시 사용 불가)
+            # 보충 스레드와 메인 스레드가 동시에 생성할 수 있으므로 잠금 안에서 할당
+            with self._spare_lock:
+                slot = self._next_slot % (1 + self.warm_spares + 1)
+                self._next_slot += 1
+        profile_dir = self._slot_dir(slot)
+        start = time.perf_counter()
+        driver = self.factory(profile_dir)
+        with self._spare_lock:
+            self.stats['created'] += 1
+        logger.info(f"🚗 브라우저 인스턴스 생성 (slot {slot}, {time.perf_counter() - start:.1f}초)")
+        return PooledDriver(driver=driver, slot=slot, profile_dir=profile_dir)
+
+    def _refill_spares(self):
+        while True:
+            with self._spare_lock:
+                if len(self._spares) >= self.warm_spares:
+                    return
+            try:
+                spare = self._create()
+            except Exception as e:
+                logger.warning(f"⚠️ 예비 브라우저 생성 실패: {e}")
+                return
+            with self._spare_lock:
+                self._spares.append(spare)
+
+    def _refill_async(self):
+        if self.warm_spares <= 0:
+            return
+        if self._refill_thread and self._refill_thread.is_alive():
+            return
+        self._refill_thread = context_thread(self._refill_spares, name="driver-pool-refill")
+        self._refill_thread.start()
+
+    def _take(self) -> PooledDriver:
+        with self._spare_lock:
+            while self._spares:
+                spare = self._spares.pop(0)
+                if spare.is_healthy():
+                    break
+                spare.quit()
+            else:
+                spare = None
+        self._refill_async()
+        return spare or self._create()
+
+    def start(self) -> object:
+        """첫 인스턴스 생성 (예비는 백그라운드에서)"""
+        if self.current is None:
+            self.current = self._create()
+            self._refill_async()
+        return self.current.driver
+
+    def recycle(self, reason: str = "") -> object:
+        """현재 인스턴스 교체"""
+        if self.current is not None:
+            logger.info(f"♻️ 브라우저 재생성 (slot {self.current.slot}, {self.current.pages}페이지 사용, {reason})")
+            self.current.quit()
+            self.stats['recycled'] += 1
+        self.current = self._take()
+        return self.current.driver
+
+    def acquire(self) -> object:
+        """페이지 방문 전 호출: 상태 점검 후 사용할 드라이버 반환 (필요 시 재생성)"""
+        if self.current is None:
+            return self.start()
+        if not self.current.is_healthy():
+            self.stats['crashes'] += 1
+            return self.recycle("응답 없음")
+        if self.current.pages >= self.max_pages:
+            return self.recycle(f"{self.max_pages}페이지 도달")
+        rss = self.current.rss_bytes()
+        if rss and rss > self.max_rss_bytes:
+            return self.recycle(f"RSS {rss / 1024 / 1024:.0f}MB 초과")
+        return self.current.driver
+
+    def page_done(self):
+        """페이지 방문 완료 기록"""
+        if self.current is not None:
+            self.current.pages += 1
+        self.stats['pages'] += 1
+
+    def report(self) -> dict:
+        rss = self.current.rss_bytes() if self.current else 0
+        return {**self.stats, 'rss_mb': round(rss / 1024 / 1024, 1)}
+
+    def close(self):
+        if self._refill_thread and self._refill_thread.is_alive():
+            self._refill_thread.join(timeout=60)
+        with self._spare_lock:
+            spares, self._spares = self._spares, []
+        for pooled in spares + ([self.current] if self.current else []):
+            pooled.quit()
+        self.current = None
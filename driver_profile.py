@@ -0,0 +1,165 @@
+"""
+Selenium 드라이버 경량 프로필 (리소스 차단 / page load 전략 / 헤드리스)
+
+- CDP Network.setBlockedURLs 로 이미지·폰트·미디어·서드파티 트래커 요청을 브라우저 단에서 차단
+- pageLoadStrategy 'eager': DOMContentLoaded 시점에 driver.get 반환 (이미지/광고 로딩 대기 없음)
+- 헤드리스 모드 (--headless=new)
+- 허용 호스트 목록(allowed_hosts): 목록 밖 호스트는 이름 해석을 실패시켜 요청 자체가 나가지 않음
+  (--host-resolver-rules "MAP * ~NOTFOUND, EXCLUDE <허용 호스트>")
+
+setBlockedURLs 는 차단 패턴만 지원하고, Fetch.enable 가로채기는 requestPaused 이벤트를 받아
+매 요청을 풀어 줘야 하는데 execute_cdp_cmd 로는 이벤트를 받을 수 없어 브라우저 인자로 허용 목록을 건다.
+프록시를 거치는 요청(--proxy-server)은 이름 해석을 프록시가 하므로 이 허용 목록이 적용되지 않는다.
+"""
+import fnmatch
+import logging
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 정적 리소스 확장자 (쿼리스트링이 붙는 경우까지 포함)
+IMAGE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.avif',
+                  '*.png?*', '*.jpg?*', '*.jpeg?*', '*.gif?*', '*.webp?*', '*.svg?*', '*.avif?*']
+FONT_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*.woff2?*', '*.woff?*']
+MEDIA_PATTERNS = ['*.mp4', '*.webm', '*.mp3', '*.m3u8']
+STYLESHEET_PATTERNS = ['*.css', '*.css?*']
+
+# 분석/광고/채팅 위젯 등 서드파티 트래커
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*googleadservices.com*', '*facebook.net*', '*facebook.com/tr*', '*connect.facebook.net*',
+    '*analytics.tiktok.com*', '*hotjar.com*', '*amplitude.com*', '*mixpanel.com*', '*segment.io*',
+    '*sentry.io*', '*braze.com*', '*appsflyer.com*', '*branch.io*', '*kakao.com/*/pixel*',
+    '*wcs.naver.net*', '*channel.io*', '*clarity.ms*', '*criteo.com*', '*adnxs.com*',
+]
+
+
+@dataclass
+class DriverProfile:
+    """드라이버 실행 프로필"""
+    name: str
+    headless: bool = False
+    page_load_strategy: str = 'normal'  # normal | eager | none
+    window_size: Tuple[int, int] = (1920, 1080)
+    blocked_patterns: List[str] = field(default_factory=list)
+    allowed_hosts: List[str] = field(default_factory=list)
+    block_images_pref: bool = False  # Chrome 콘텐츠 설정으로도 이미지 차단 (CDP 누락분 보완)
+
+    def with_headless(self, headless: bool) -> 'DriverProfile':
+        return replace(self, headless=headless)
+
+
+# 기존 동작 그대로 (벤치마크 기준선)
+FULL_PROFILE = DriverProfile(name='full')
+
+# 리멤버 목록/상세 페이지용: 텍스트 추출에 필요 없는 리소스 차단.
+# CSS 는 유지 - 무한 스크롤이 레이아웃(IntersectionObserver) 기준으로 다음 목록을 불러오기 때문
+REMEMBER_PROFILE = DriverProfile(
+    name='remember',
+    page_load_strategy='eager',
+    window_size=(1280, 900),
+    blocked_patterns=IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS,
+    allowed_hosts=['career.rememberapp.co.kr', '*.rememberapp.co.kr'],
+    block_images_pref=True,
+)
+
+# 상세 페이지 본문만 필요할 때: CSS 까지 차단 (스크롤 로딩이 없는 페이지 전용)
+MINIMAL_PROFILE = replace(
+    REMEMBER_PROFILE,
+    name='minimal',
+    blocked_patterns=REMEMBER_PROFILE.blocked_patterns + STYLESHEET_PATTERNS,
+)
+
+PROFILES: Dict[str, DriverProfile] = {p.name: p for p in (FULL_PROFILE, REMEMBER_PROFILE, MINIMAL_PROFILE)}
+
+# 허용 목록을 써도 항상 해석되어야 하는 호스트 (chromedriver ↔ 브라우저 로컬 통신)
+ALWAYS_ALLOWED_HOSTS = ['localhost', '127.0.0.1']
+
+# 허용 호스트의 필수 요청 예시 (차단 패턴 검증용)
+_ESSENTIAL_PATHS = ['/', '/job/postings', '/_next/static/chunks/main.js', '/api/job_postings']
+
+
+def get_profile(name: str, headless: Optional[bool] = None) -> DriverProfile:
+    profile = PROFILES.get(name)
+    if profile is None:
+        logger.warning(f"⚠️ 알 수 없는 드라이버 프로필 '{name}' - 'full' 사용")
+        profile = FULL_PROFILE
+    return profile.with_headless(headless) if headless is not None else profile
+
+
+def host_resolver_rules(allowed_hosts: List[str]) -> str:
+    """허용 호스트(와일드카드 가능) 외 모든 호스트를 NOTFOUND 로 매핑하는 --host-resolver-rules 값"""
+    excludes = ", ".join(f"EXCLUDE {host}" for host in ALWAYS_ALLOWED_HOSTS + list(allowed_hosts))
+    return f"MAP * ~NOTFOUND, {excludes}"
+
+
+def check_allowed_hosts(profile: DriverProfile) -> List[str]:
+    """허용 호스트의 문서/스크립트/API 요청을 막는 차단 패턴 목록 (비어 있어야 정상)"""
+    conflicts = []
+    for host in profile.allowed_hosts:
+        host = host.replace('*.', 'www.')
+        for path in _ESSENTIAL_PATHS:
+            url = f"https://{host}{path}"
+            conflicts += [p for p in profile.blocked_patterns if fnmatch.fnmatch(url, p)]
+    return sorted(set(conflicts))
+
+
+def apply_to_options(chrome_options, profile: DriverProfile):
+    """Chrome Options 에 프로필 적용 (드라이버 생성 전)"""
+    chrome_options.page_load_strategy = profile.page_load_strategy
+    width, height = profile.window_size
+    chrome_options.add_argument(f'--window-size={width},{height}')
+    if profile.headless:
+        chrome_options.add_argument('--headless=new')
+    if profile.allowed_hosts:
+        chrome_options.add_argument(f'--host-resolver-rules={host_resolver_rules(profile.allowed_hosts)}')
+    if profile.block_images_pref:
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+        })
+
+
+def enable_resource_blocking(driver, profile: DriverProfile) -> bool:
+    """CDP 로 URL 패턴 차단 (드라이버 생성 후, 첫 페이지 이동 전)"""
+    if not profile.blocked_patterns:
+        return False
+    conflicts = check_allowed_hosts(profile)
+    if conflicts:
+        logger.warning(f"⚠️ 허용 호스트 요청과 겹치는 차단 패턴 제외: {conflicts}")
+    patterns = [p for p in profile.blocked_patterns if p not in conflicts]
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        # 리소스 전송량 측정을 위해 Resource Timing 버퍼 확장
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': 'performance.setResourceTimingBufferSize(5000);'
+        })
+        logger.info(f"🚫 리소스 차단 활성화: 패턴 {len(patterns)}개 (프로필 '{profile.name}')")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ CDP 리소스 차단 설정 실패: {e}")
+        return False
+
+
+# 현재 문서 기준 전송량 (문서 + 하위 리소스, 캐시 적중은 0)
+# Timing-Allow-Origin 이 없는 교차 출처 리소스는 크기가 모두 0 으로 보고됨 → bytes 는 하한값,
+# 크기를 알 수 없는 요청은 unmeasured 로 따로 센다 (같은 출처 캐시 적중은 decodedBodySize 가 남아 구분됨)
+TRANSFER_BYTES_SCRIPT = """
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {
+    bytes: entries.reduce((sum, e) => sum + (e.transferSize || 0), 0),
+    requests: entries.length,
+    unmeasured: entries.filter(e => !e.transferSize && !e.decodedBodySize).length,
+};
+"""
+
+
+def page_transfer_stats(driver) -> Dict[str, int]:
+    """현재 페이지가 내려받은 바이트/요청 수 (Resource Timing API, 크기를 알 수 없는 교차 출처 요청 수 포함)"""
+    try:
+        stats = driver.execute_script(TRANSFER_BYTES_SCRIPT) or {}
+        return {key: int(stats.get(key, 0)) for key in ('bytes', 'requests', 'unmeasured')}
+    except Exception as e:
+        logger.debug(f"전송량 측정 실패: {e}")
+        return {'bytes': 0, 'requests': 0, 'unmeasured': 0}
@@ -0,0 +1,108 @@
+"""
+리멤버 공고 필드 보강 결과의 출처 기록 + 내용 지문 (변경 감지용)
+
+필드마다 값이 어디서 왔는지 '필드출처' 에 JSON 으로 남긴다.
+- extracted : 목록 카드 / 상세 페이지에 실제로 적힌 값
+- inferred  : 페이지 값에서 계산한 값 (D-N → 수집 시각 기준 마감일, 본문 최빈 회사명 패턴)
+- missing   : 찾지 못함 - 빈 값 그대로 둠 (기본값 / 오늘 날짜 / 무작위 값으로 채우지 않음)
+
+같은 페이지는 언제 다시 추출해도 같은 결과가 나오므로, 내용 지문을 이전 수집 결과와 비교해
+바뀐 공고만 골라낼 수 있다 (card_fingerprint: 목록 카드 기준, content_fingerprint: 추출 결과 전체).
+"""
+import json
+import hashlib
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+EXTRACTED = 'extracted'
+INFERRED = 'inferred'
+MISSING = 'missing'
+
+PROVENANCE_FIELD = '필드출처'
+FINGERPRINT_FIELD = '내용해시'
+
+# 출처를 기록하는 필드 (공고ID / 직무카테고리 / link 는 수집 경로 자체라 제외)
+ENRICHED_FIELDS = (
+    '공고명', '회사명', '지역', '직무', '경력요건', '학력요건', '채용유형', '공고시작일', '마감일', '합격축하금',
+    '공고소개', '주요업무', '자격요건', '우대사항', '채용절차',
+)
+# 목록 카드에서 바로 얻는 필드 (상세 페이지를 다시 볼지 판단)
+CARD_FIELDS = ('공고ID', '공고명', '회사명', '지역', '경력요건', '마감일', '직무카테고리')
+# 실행마다 달라지거나 내용이 아닌 필드 (지문 계산에서 제외)
+NON_CONTENT_FIELDS = ('link', 'crawled_at', PROVENANCE_FIELD, FINGERPRINT_FIELD)
+
+CRAWLED_AT_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def parse_crawled_at(value) -> datetime:
+    """수집 시각 문자열 → datetime (형식이 다르면 현재 시각)"""
+    try:
+        return datetime.strptime(str(value), CRAWLED_AT_FORMAT)
+    except (TypeError, ValueError):
+        return datetime.now()
+
+
+def normalize_deadline(value, crawled_at) -> Tuple[str, str]:
+    """마감일 → (값, 출처). 'D-N' 은 수집 시각 기준 날짜로 바꾸므로 다음 날 다시 수집해도 같은 값"""
+    value = str(value or '').strip()
+    if not value:
+        return '', MISSING
+    if value.startswith('D-'):
+        try:
+            days_left = int(value[2:])
+        except ValueError:
+            return value, EXTRACTED
+        deadline = parse_crawled_at(crawled_at) + timedelta(days=days_left)
+        return deadline.strftime('%Y-%m-%d'), INFERRED
+    return value, EXTRACTED
+
+
+def ordered_unique(values: Iterable[str]) -> List[str]:
+    """처음 나온 순서를 유지한 중복 제거 (set 과 달리 실행마다 순서가 같음)"""
+    return list(dict.fromkeys(values))
+
+
+def finalize_provenance(job: Dict, sources: Optional[Dict[str, str]] = None) -> Dict:
+    """sources 에 없는 필드는 값이 있으면 extracted, 없으면 missing 으로 기록"""
+    sources = dict(sources or {})
+    for field in ENRICHED_FIELDS:
+        if field not in sources:
+            sources[field] = EXTRACTED if job.get(field) not in (None, '') else MISSING
+    job[PROVENANCE_FIELD] = json.dumps(sources, ensure_ascii=False, sort_keys=True)
+    return job
+
+
+def load_provenance(job: Dict) -> Dict[str, str]:
+    try:
+        return json.loads(job.get(PROVENANCE_FIELD) or '{}')
+    except (TypeError, ValueError):
+        return {}
+
+
+def _fingerprint(job: Dict, fields: Iterable[str]) -> str:
+    payload = json.dumps({field: job.get(field, '') for field in fields}, ensure_ascii=False,
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def content_fingerprint(job: Dict) -> str:
+    """추출 결과 전체의 지문 (수집 시각 / 출처 기록 제외)"""
+    return _fingerprint(job, sorted(k for k in job if k not in NON_CONTENT_FIELDS))
+
+
+def card_fingerprint(job: Dict) -> str:
+    """목록 카드 정보의 지문 (D-N 마감일은 날짜로 바꿔서 비교)"""
+    card = {field: job.get(field, '') for field in CARD_FIELDS}
+    card['마감일'], _ = normalize_deadline(card['마감일'], job.get('crawled_at'))
+    return _fingerprint(card, CARD_FIELDS)
+
+
+def provenance_counts(jobs: Iterable[Dict]) -> Dict[str, Counter]:
+    """필드별 출처 분포 {필드: Counter(출처)}"""
+    counts: Dict[str, Counter] = {field: Counter() for field in ENRICHED_FIELDS}
+    for job in jobs:
+        for field, source in load_provenance(job).items():
+            if field in counts:
+                counts[field][source] += 1
+    return counts
@@ -0,0 +1,191 @@
+"""
+리멤버 공고 필드 추출용 정규식 모음 (모듈 로드 시 한 번만 컴파일)
+
+- 상세 페이지의 직무/직급/학력/채용유형은 이름 있는 그룹으로 합친 정규식 한 번의 finditer 로 수집하고,
+  필요한 개수를 모두 찾으면 본문 끝까지 가지 않고 멈춤
+- 섹션 본문 대체 추출은 기존 정규식이 사실상 '키워드 뒤부터 본문 끝까지'를 한 글자씩 늘려 가며 찾던 것을
+  키워드 위치 검색 + 문자열 슬라이스로 계산 (결과 동일)
+- 제외 키워드(헤드헌터/해외근무)는 정규식 대체(alternation)보다 str 부분 문자열 검색이 훨씬 빨라서
+  소문자 키워드 튜플을 미리 만들어 두고 그대로 검사
+- 회사명 후보 패턴은 우선순위가 있고 서로 겹쳐서(예: '(주) 한글주식회사') 합치면 결과가 달라지므로,
+  순서대로 search 로 존재만 확인하고 처음 매칭된 패턴 하나만 전체 스캔
+
+추출 규칙(우선순위, 첫 매칭/최빈값 선택)은 JD.py 의 기존 동작과 같다.
+"""
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# ---------------------------------------------------------------------- 제외 필터
+
+HEADHUNTER_KEYWORDS = (
+    '헤드헌터', '헤드헌팅', 'headhunter', 'headhunting',
+    '인재개발', '인사컨설팅', '채용대행', '서치펌',
+    '스카우트', 'scout', '리크루터', 'recruiter',
+    '인력파견', '파견', '용역', '아웃소싱',
+)
+
+OVERSEAS_KEYWORDS = (
+    '해외근무', '해외파견', '해외출장', '국외근무',
+    '중국', '일본', '미국', '유럽', '동남아', '베트남', '태국', '인도네시아',
+    '싱가포르', '말레이시아', '필리핀', '인도', '캐나다', '호주',
+    'china', 'japan', 'usa', 'vietnam', 'thailand', 'singapore',
+    '해외사업', '글로벌', '국제', 'overseas', 'global', 'international',
+)
+
+
+_HEADHUNTER_LOWER = tuple(keyword.lower() for keyword in HEADHUNTER_KEYWORDS)
+_OVERSEAS_LOWER = tuple(keyword.lower() for keyword in OVERSEAS_KEYWORDS)
+
+
+def exclude_reason(text: str) -> Optional[str]:
+    """제외 사유 (헤드헌터 키워드가 하나라도 있으면 해외근무보다 우선), 없으면 None"""
+    full_text = text.lower()
+    if any(keyword in full_text for keyword in _HEADHUNTER_LOWER):
+        return "헤드헌터"
+    if any(keyword in full_text for keyword in _OVERSEAS_LOWER):
+        return "해외근무"
+    return None
+
+
+# ---------------------------------------------------------------------- 목록 카드
+
+# "D-13﹒서울 영등포구﹒7년 이상"
+CARD_MIXED_PATTERN = re.compile(r'(D-\d+)﹒([^﹒]+)﹒([^﹒]+)')
+CARD_DEADLINE_PATTERN = re.compile(r'(D-\d+|상시채용|\d{4}-\d{2}-\d{2})')
+CARD_LOCATION_PATTERN = re.compile(r'(서울[^﹒]*|경기[^﹒]*|인천[^﹒]*|부산[^﹒]*|원격근무|재택)')
+CARD_CAREER_PATTERN = re.compile(r'(\d+년[^﹒]*|신입[^﹒]*|경력[^﹒]*|\d+~\d+년)')
+POSTING_ID_PATTERN = re.compile(r'/job/postings/(\d+)')
+
+
+def card_fields(text: str) -> Dict[str, str]:
+    """카드 혼합 텍스트에서 마감일/지역/경력 (찾은 필드만)"""
+    mixed = CARD_MIXED_PATTERN.search(text)
+    if mixed:
+        return {'마감일': mixed.group(1), '지역': mixed.group(2), '경력요건': mixed.group(3)}
+    fields = {}
+    for key, pattern in (('마감일', CARD_DEADLINE_PATTERN), ('지역', CARD_LOCATION_PATTERN),
+                         ('경력요건', CARD_CAREER_PATTERN)):
+        match = pattern.search(text)
+        if match:
+            fields[key] = match.group(1)
+    return fields
+
+
+# ---------------------------------------------------------------------- 상세 페이지
+
+TITLE_SUFFIX_PATTERNS = (re.compile(r'\s*-\s*리멤버.*'), re.compile(r'\s*\|\s*.*'))
+
+COMPANY_PATTERNS = (
+    r'([가-힣]+\s*주식회사)',
+    r'(\([주]\)\s*[가-힣]+)',
+    r'(㈜\s*[가-힣]+)',
+    r'([A-Za-z]+\s*Inc\.?)',
+    r'([A-Za-z]+\s*Corp\.?)',
+    r'([A-Za-z]+\s*Ltd\.?)',
+    r'([A-Za-z]+\s*Co\.?,?\s*Ltd\.?)',
+)
+COMPANY_REGEXES = tuple(re.compile(p) for p in COMPANY_PATTERNS)
+
+CATEGORY_WORDS = ('프론트엔드|백엔드|풀스택|데이터|AI|머신러닝|DevOps|모바일|iOS|안드로이드|서비스기획|'
+                  '상품기획|마케팅|디자인|HR|영업|경영지원')
+ROLE_WORDS = '개발자|엔지니어|기획자|디자이너|매니저|팀장|대리|과장|차장|부장'
+EDUCATION_WORDS = '고졸|전문학사|학사|석사|박사|대졸|대학교|학력무관'
+EMPLOYMENT_WORDS = '정규직|계약직|인턴|파트타임|프리랜서|임시직'
+
+# 직무 분야 / 직급 / 학력 / 채용유형을 한 번에 (직무·직급은 대소문자 무시)
+DETAIL_FIELD_PATTERN = re.compile(
+    f"(?P<category>(?i:{CATEGORY_WORDS}))|(?P<role>(?i:{ROLE_WORDS}))"
+    f"|(?P<education>{EDUCATION_WORDS})|(?P<employment>{EMPLOYMENT_WORDS})"
+)
+MAX_CATEGORY_MATCHES = 3
+
+
+def most_common_company(text: str) -> Optional[str]:
+    """우선순위가 가장 높은 회사명 패턴의 최빈 매칭"""
+    for pattern in COMPANY_REGEXES:
+        if pattern.search(text):
+            return Counter(pattern.findall(text)).most_common(1)[0][0].strip()
+    return None
+
+
+def detail_fields(text: str) -> Dict[str, List[str]]:
+    """직무 분야(최대 3개) / 직급(최대 3개) / 학력(첫 매칭) / 채용유형(첫 매칭) 한 번의 스캔"""
+    found: Dict[str, List[str]] = {'category': [], 'role': [], 'education': [], 'employment': []}
+    for match in DETAIL_FIELD_PATTERN.finditer(text):
+        group = match.lastgroup
+        values = found[group]
+        limit = 1 if group in ('education', 'employment') else MAX_CATEGORY_MATCHES
+        if len(values) < limit:
+            values.append(match.group(0))
+        if (len(found['category']) >= MAX_CATEGORY_MATCHES and found['education'] and found['employment']):
+            break
+    return found
+
+
+# ---------------------------------------------------------------------- 상세 섹션
+
+SECTION_HEADERS: Dict[str, Tuple[str, ...]] = {
+    '공고소개': ('공고소개', '회사소개', '기업소개', '소개'),
+    '주요업무': ('주요업무', '업무내용', '담당업무', '주요 업무', '업무'),
+    '자격요건': ('자격요건', '지원자격', '필수자격', '자격 요건', '요구사항'),
+    '우대사항': ('우대사항', '우대조건', '우대 사항', '선호사항', '플러스'),
+    '채용절차': ('채용절차', '전형절차', '채용 절차', '전형과정', '선발과정'),
+}
+SECTION_HEADER_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'span', 'p')
+
+_ALL_SECTION_KEYWORDS = [kw for keywords in SECTION_HEADERS.values() for kw in keywords]
+
+# 키워드별: 헤더 매칭 정규식 / 다음 섹션 판단용 다른 키워드 / 본문 정규식 대체 추출
+SECTION_HEADER_PATTERNS = {kw: re.compile(kw, re.IGNORECASE) for kw in _ALL_SECTION_KEYWORDS}
+SECTION_OTHER_KEYWORDS = {kw: tuple(other for other in _ALL_SECTION_KEYWORDS if other != kw)
+                          for kw in _ALL_SECTION_KEYWORDS}
+# 기존 대체 정규식: rf'{kw}[:\s]*(...*?)(?=(?:{"│".join(키워드)})|$)' (DOTALL)
+# 본문 그룹은 어떤 문자열에도 매칭되므로, 결과는 키워드(+콜론/공백) 뒤부터
+# 키워드를 '│' 로 이어 붙인 문자열이 처음 나오는 곳(또는 본문 끝, 마지막 줄바꿈 앞)까지
+SECTION_KEYWORD_PATTERNS = {kw: re.compile(rf'{kw}[:\s]*', re.IGNORECASE) for kw in _ALL_SECTION_KEYWORDS}
+_SECTION_STOP_LITERAL = "│".join(_ALL_SECTION_KEYWORDS)
+
+
+def section_fallback(text: str, keyword: str) -> Optional[str]:
+    """본문 텍스트에서 키워드 뒤 내용 (키워드가 없으면 None)"""
+    match = SECTION_KEYWORD_PATTERNS[keyword].search(text)
+    if not match:
+        return None
+    start = match.end()
+    end = len(text) - 1 if text.endswith('\n') else len(text)
+    stop = text.find(_SECTION_STOP_LITERAL, start, end)
+    if stop == -1 or stop > end:
+        stop = end
+    if start > stop:  # 키워드 뒤 공백이 마지막 줄바꿈까지 먹은 경우
+        stop = start
+    return text[start:stop]
+
+
+# ---------------------------------------------------------------------- 날짜 / 합격축하금
+
+# "등록일 2024.03.05" / "공고 시작일: 2024-03-05" / "게시일 2024년 3월 5일"
+POSTED_DATE_PATTERN = re.compile(r'(?:등록일|게시일|공고\s*시작일|접수\s*시작일?)\s*[:：]?\s*'
+                                 r'(\d{4})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})')
+# "합격축하금 50만원" / "합격 축하금: 1,000,000원"
+SIGNING_BONUS_PATTERN = re.compile(r'합격\s*축하금\s*[:：]?\s*(\d[\d,]*)\s*(만)?\s*원')
+
+
+def posted_date(text: str) -> Optional[str]:
+    """본문에 적힌 공고 시작일 (YYYY-MM-DD), 없으면 None"""
+    match = POSTED_DATE_PATTERN.search(text)
+    if not match:
+        return None
+    year, month, day = (int(g) for g in match.groups())
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def signing_bonus(text: str) -> Optional[int]:
+    """본문에 적힌 합격축하금 (원 단위), 없으면 None"""
+    match = SIGNING_BONUS_PATTERN.search(text)
+    if not match:
+        return None
+    amount = int(match.group(1).replace(',', ''))
+    return amount * 10000 if match.group(2) else amount
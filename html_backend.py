@@ -0,0 +1,328 @@
+"""
+상세 페이지 HTML 파서 백엔드 (bs4 / lxml / selectolax)
+
+detail_extraction 의 추출기는 아래 몇 가지 연산만 쓰므로, 백엔드별로 이 연산을 직접 구현해
+BeautifulSoup(html.parser) 과 같은 추출 결과를 내면서 파싱/순회를 C 구현에 맡긴다.
+- text            : soup.get_text() (script/style/template/주석 제외)
+- title           : <title> 텍스트
+- select_text     : CSS 선택자 첫 요소의 텍스트
+- find_headers    : find_all(tags, string=정규식) - 문자열 자식 하나뿐인 요소 중 정규식 매칭
+                    (후보 요소와 문자열은 페이지당 한 번만 모으고 키워드마다 재사용)
+- sibling_texts   : 요소 다음 형제들(텍스트 노드 포함)의 get_text()
+
+백엔드:
+- 'html.parser' : BeautifulSoup 기본 파서 (기준 / 가장 느림)
+- 'bs4-lxml'    : BeautifulSoup + lxml 트리 빌더
+- 'lxml'        : lxml.html 직접 사용 (XPath 로 텍스트 수집)
+- 'selectolax'  : selectolax (lexbor) - 설치 시에만
+
+'auto' 는 설치된 백엔드 중 가장 빠른 것을 고른다.
+
+lxml / selectolax 도 bs4 처럼 공백만 있는 텍스트 노드를 '\n' / ' ' 하나로 줄인다 (pre/textarea 제외).
+그래도 text 가 글자 단위로 같다는 보장은 없다 - 파서마다 잘못된 마크업 복구 방식이 다르고
+(lxml 은 </html> 뒤 텍스트를 버리고, lexbor 는 <pre> 바로 뒤 줄바꿈을 버린다).
+추출 필드 기준 비교는 bench_html_parser.py --check (보관 페이지 + 내장 샘플) 로 확인한다.
+"""
+import re
+import logging
+from typing import Iterator, List, Optional, Sequence
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # 선택 의존성
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+# get_text() 가 내용에서 제외하는 태그
+NON_TEXT_TAGS = ('script', 'style')
+
+# bs4 는 공백(ASCII)만 있는 문자열을 '\n' 또는 ' ' 하나로 줄인다 (pre/textarea 안은 유지)
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+PRESERVE_WHITESPACE_TAGS = ('pre', 'textarea')
+
+# 빠른 순서
+BACKEND_PREFERENCE = ('selectolax', 'lxml', 'bs4-lxml', 'html.parser')
+
+
+class BS4Page:
+    """BeautifulSoup 기반 (기준 구현)"""
+
+    def __init__(self, html: str, parser: str = 'html.parser'):
+        self.soup = BeautifulSoup(html, parser)
+        self._text = None
+        self._headers = {}
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.soup.get_text()
+        return self._text
+
+    @property
+    def title(self) -> str:
+        return self.soup.title.get_text() if self.soup.title else ''
+
+    def select_text(self, selector: str) -> str:
+        element = self.soup.select_one(selector)
+        return element.get_text() if element else ''
+
+    def find_headers(self, tags: Sequence[str], pattern) -> list:
+        candidates = self._headers.get(tuple(tags))
+        if candidates is None:
+            candidates = self._headers[tuple(tags)] = [
+                (element, element.string) for element in self.soup.find_all(list(tags))
+                if element.string is not None
+            ]
+        return [element for element, string in candidates if pattern.search(string)]
+
+    def sibling_texts(self, header) -> Iterator[str]:
+        current = header.next_sibling
+        while current:
+            yield current.get_text() if hasattr(current, 'get_text') else ''
+            current = current.next_sibling
+
+
+# ---------------------------------------------------------------------- lxml
+
+# template 내용은 bs4 에서 TemplateString 이라 get_text() 에 포함되지 않음
+_LXML_TEXT = '//text()[not(parent::script) and not(parent::style) and not(ancestor::template)]'
+_LXML_NODE_TEXT = './/text()[not(parent::script) and not(parent::style) and not(ancestor::template)]'
+
+# 추출기에서 쓰는 단순 선택자 (tag / .class / [attr*='value']) → XPath
+_SIMPLE_SELECTOR = re.compile(r"^(?P<tag>[a-zA-Z][a-zA-Z0-9]*)?"
+                              r"(?:\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)\*=['\"](?P<value>[^'\"]*)['\"]\])?$")
+
+
+def css_to_xpath(selector: str) -> str:
+    try:
+        from cssselect import GenericTranslator
+        return GenericTranslator().css_to_xpath(selector)
+    except ImportError:
+        pass
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not (match.group('tag') or match.group('cls') or match.group('attr')):
+        raise ValueError(f"지원하지 않는 선택자 (cssselect 필요): {selector}")
+    xpath = f"descendant-or-self::{match.group('tag') or '*'}"
+    if match.group('cls'):
+        xpath += f"[contains(concat(' ', normalize-space(@class), ' '), ' {match.group('cls')} ')]"
+    elif match.group('attr'):
+        xpath += f"[@{match.group('attr')} and contains(@{match.group('attr')}, '{match.group('value')}')]"
+    return xpath
+
+
+_xpath_cache = {}
+
+
+def _compiled_xpath(selector: str):
+    xpath = _xpath_cache.get(selector)
+    if xpath is None:
+        xpath = _xpath_cache[selector] = lxml.html.etree.XPath(css_to_xpath(selector))
+    return xpath
+
+
+def _collapse_whitespace(string: str) -> str:
+    return '\n' if '\n' in string else ' '
+
+
+def _bs4_whitespace(strings) -> str:
+    """bs4 와 같이 공백만 있는 텍스트 노드를 '\n' / ' ' 하나로 줄여서 이어 붙임"""
+    parts = []
+    for string in strings:
+        if not string.strip(ASCII_SPACES):
+            parent = string.getparent()
+            if parent is None or (parent.tag not in PRESERVE_WHITESPACE_TAGS and
+                                  not any(True for _ in parent.iterancestors(*PRESERVE_WHITESPACE_TAGS))):
+                string = _collapse_whitespace(string)
+        parts.append(string)
+    return ''.join(parts)
+
+
+def _lxml_text(element) -> str:
+    if not isinstance(element.tag, str):
+        return ''  # 주석 / 처리 명령
+    if element.tag in NON_TEXT_TAGS:
+        return element.text or ''
+    return _bs4_whitespace(element.xpath(_LXML_NODE_TEXT))
+
+
+def _lxml_string(element) -> Optional[str]:
+    """bs4 의 Tag.string: 자식이 하나뿐이면 그 문자열 (자식이 태그면 재귀)"""
+    while True:
+        if not isinstance(element.tag, str):
+            return element.text  # 주석
+        children = len(element)
+        if element.text and children == 0:
+            return element.text
+        if not element.text and children == 1 and not element[0].tail:
+            element = element[0]
+            continue
+        return None
+
+
+class LxmlPage:
+    """lxml.html 직접 사용"""
+
+    def __init__(self, html: str):
+        self.root = lxml.html.document_fromstring(html) if html.strip() else lxml.html.Element('html')
+        self._text = None
+        self._headers = {}
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = _bs4_whitespace(self.root.xpath(_LXML_TEXT))
+        return self._text
+
+    @property
+    def title(self) -> str:
+        element = self.root.find('.//title')
+        return _lxml_text(element) if element is not None else ''
+
+    def select_text(self, selector: str) -> str:
+        elements = _compiled_xpath(selector)(self.root)
+        return _lxml_text(elements[0]) if elements else ''
+
+    def find_headers(self, tags: Sequence[str], pattern) -> list:
+        candidates = self._headers.get(tuple(tags))
+        if candidates is None:
+            candidates = self._headers[tuple(tags)] = [
+                (element, string) for element in self.root.iter(*tags)
+                for string in (_lxml_string(element),) if string is not None
+            ]
+        return [element for element, string in candidates if pattern.search(string)]
+
+    def sibling_texts(self, header) -> Iterator[str]:
+        # lxml 은 형제 텍스트 노드를 앞 요소의 tail 로 보관
+        if header.tail:
+            yield header.tail
+        for sibling in header.itersiblings():
+            yield _lxml_text(sibling)
+            if sibling.tail:
+                yield sibling.tail
+
+
+# ---------------------------------------------------------------------- selectolax
+
+def _lexbor_preserves_whitespace(node) -> bool:
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in PRESERVE_WHITESPACE_TAGS:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _lexbor_string_text(node) -> str:
+    """텍스트 노드 - 공백만 있으면 bs4 와 같이 하나로 줄임 (pre/textarea 안은 유지)"""
+    text = node.text_content or ''
+    if not text.strip(ASCII_SPACES) and not _lexbor_preserves_whitespace(node):
+        return _collapse_whitespace(text)
+    return text
+
+
+def _lexbor_text(node) -> str:
+    tag = node.tag
+    if tag == '-text':
+        return _lexbor_string_text(node)
+    if tag.startswith('-') or tag.startswith('_'):
+        return ''  # 주석 / doctype
+    if tag in NON_TEXT_TAGS:
+        return node.text(deep=True)
+    # script/style 안의 텍스트는 제외
+    return ''.join(_lexbor_string_text(n) for n in node.traverse(include_text=True)
+                   if n.tag == '-text' and n.parent.tag not in NON_TEXT_TAGS)
+
+
+def _lexbor_string(node) -> Optional[str]:
+    while True:
+        if node.tag == '-text':
+            return node.text_content
+        if node.tag == '-comment':
+            return node.comment_content
+        children = list(node.iter(include_text=True))
+        if len(children) != 1:
+            return None
+        node = children[0]
+
+
+class SelectolaxPage:
+    """selectolax (lexbor)"""
+
+    def __init__(self, html: str):
+        self.tree = LexborHTMLParser(html)
+        self._text = None
+        self._headers = {}
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            root = self.tree.root
+            self._text = _lexbor_text(root) if root is not None else ''
+        return self._text
+
+    @property
+    def title(self) -> str:
+        node = self.tree.css_first('title')
+        return _lexbor_text(node) if node is not None else ''
+
+    def select_text(self, selector: str) -> str:
+        node = self.tree.css_first(selector)
+        return _lexbor_text(node) if node is not None else ''
+
+    def find_headers(self, tags: Sequence[str], pattern) -> list:
+        candidates = self._headers.get(tuple(tags))
+        if candidates is None:
+            candidates = self._headers[tuple(tags)] = [
+                (node, string) for node in self.tree.css(', '.join(tags))
+                for string in (_lexbor_string(node),) if string is not None
+            ]
+        return [node for node, string in candidates if pattern.search(string)]
+
+    def sibling_texts(self, header) -> Iterator[str]:
+        current = header.next
+        while current is not None:
+            yield _lexbor_text(current)
+            current = current.next
+
+
+# ---------------------------------------------------------------------- 선택
+
+def available_backends() -> List[str]:
+    backends = []
+    if LexborHTMLParser is not None:
+        backends.append('selectolax')
+    if LXML_AVAILABLE:
+        backends += ['lxml', 'bs4-lxml']
+    backends.append('html.parser')
+    return backends
+
+
+def resolve_backend(name: str = 'auto') -> str:
+    available = available_backends()
+    if name == 'auto':
+        return next(b for b in BACKEND_PREFERENCE if b in available)
+    if name not in available:
+        fallback = resolve_backend('auto')
+        logger.warning(f"⚠️ HTML 파서 백엔드 '{name}' 사용 불가 - '{fallback}' 사용")
+        return fallback
+    return name
+
+
+def parse_html(html: str, backend: str = 'html.parser'):
+    """백엔드별 페이지 객체 (backend 는 resolve_backend 로 확정된 이름)"""
+    if backend == 'selectolax':
+        return SelectolaxPage(html)
+    if backend == 'lxml':
+        return LxmlPage(html)
+    if backend == 'bs4-lxml':
+        return BS4Page(html, 'lxml')
+    return BS4Page(html, 'html.parser')
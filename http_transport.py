@@ -0,0 +1,197 @@
+"""
+HTTP 전송 계층 (연결 풀 / keep-alive / HTTP/2 / 압축 협상)
+
+- requests: HTTPAdapter 풀 크기를 동시성에 맞추고 TCP keep-alive 소켓 옵션 설정
+- httpx (설치 시, http2=True): 한 연결에서 여러 요청을 다중화 (h2 패키지 필요)
+- Accept-Encoding 은 실제로 디코딩 가능한 코덱만 광고 (brotli/zstandard 미설치 시 br/zstd 제외)
+- 요청별로 새 연결인지 재사용인지 기록해 연결 재사용률을 계측에 남긴다
+
+두 백엔드 모두 requests 예외(Timeout / ConnectionError)로 맞춰 올려서
+make_safe_request 의 재시도 로직을 그대로 쓴다.
+"""
+import socket
+import logging
+import weakref
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import httpx
+except ImportError:  # 선택 의존성
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원 여부 확인용)
+    HTTP2_AVAILABLE = httpx is not None
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+KEEPALIVE_EXPIRY = 60.0  # 유휴 연결 유지 시간 (초, httpx)
+
+# TCP keep-alive: 유휴 연결이 중간 장비(NAT/LB)에서 끊기지 않도록 주기적으로 probe
+KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    KEEPALIVE_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+    ]
+
+
+def supported_encodings() -> str:
+    """클라이언트가 디코딩 가능한 Content-Encoding 목록 (urllib3 기준: gzip,deflate[,br][,zstd])"""
+    return ", ".join(codec.strip() for codec in ACCEPT_ENCODING.split(","))
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """TCP keep-alive 소켓 옵션을 적용하고 실제 TCP 연결(connect) 횟수를 세는 HTTPAdapter"""
+
+    def __init__(self, *args, **kwargs):
+        self.connects = 0
+        self._connect_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _count_connect(self):
+        with self._connect_lock:
+            self.connects += 1
+
+    def init_poolmanager(self, *args, **kwargs):
+        # 기본 옵션(TCP_NODELAY)은 유지하고 keep-alive 옵션만 추가
+        kwargs.setdefault('socket_options', HTTPConnection.default_socket_options + KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+        # 서버가 연결을 닫으면 urllib3 는 같은 연결 객체로 다시 connect 하므로 connect 호출 자체를 센다
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._counting_pool(pool_cls) for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def _counting_pool(self, pool_cls):
+        adapter = self
+        base_conn = pool_cls.ConnectionCls
+
+        class CountingConnection(base_conn):
+            def connect(self):
+                adapter._count_connect()
+                return super().connect()
+
+        return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': CountingConnection})
+
+
+class PooledTransport:
+    """
+    requests.Session 과 같은 get() 인터페이스의 연결 풀 전송 계층.
+    http2=True 이고 httpx/h2 가 설치되어 있으면 httpx HTTP/2 클라이언트를 쓰고, 아니면 requests 풀을 쓴다.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False,
+                 headers: Optional[Dict[str, str]] = None, metrics=None, h2_prior_knowledge: bool = False):
+        self.pool_size = pool_size
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.http_versions: Dict[str, int] = {}
+        # 살아 있는 연결만 약한 참조로 추적 (닫힌 연결은 자동으로 빠짐 → 무한히 쌓이지 않음)
+        self._seen_streams = weakref.WeakSet()
+
+        headers = dict(headers or {})
+        headers['Accept-Encoding'] = supported_encodings()
+
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("⚠️ httpx[http2] 미설치 - HTTP/1.1 연결 풀로 대체")
+        self.http2 = http2 and HTTP2_AVAILABLE
+
+        if self.http2:
+            self.backend = 'httpx'
+            # h2_prior_knowledge: TLS 없는 로컬 테스트 서버(h2c)용 - HTTP/1.1 협상 없이 바로 HTTP/2
+            # 주의: 동기 httpx(httpcore 1.0.x)의 HTTP/2 연결은 스레드 안전하지 않음 - 여러 스레드가 공유하면
+            # stream id 순서가 뒤바뀌어 연결이 끊기거나 (PROTOCOL_ERROR) 내부 오류가 남. 크롤러는 순차 요청이라 해당 없음
+            self.client = httpx.Client(
+                http1=not h2_prior_knowledge,
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size,
+                                    keepalive_expiry=KEEPALIVE_EXPIRY),
+            )
+        else:
+            self.backend = 'requests'
+            self.client = requests.Session()
+            self.client.headers.update(headers)
+            # 재시도는 make_safe_request 가 담당하므로 어댑터 재시도는 끔
+            adapter = KeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+            self.client.mount('https://', adapter)
+            self.client.mount('http://', adapter)
+            self.adapter = adapter
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def _record(self, new_connection: bool, http_version: str):
+        with self._lock:
+            self.requests += 1
+            self.connections_opened += int(new_connection)
+            self.http_versions[http_version] = self.http_versions.get(http_version, 0) + 1
+        if self.metrics is not None:
+            self.metrics.inc("connections_total", state="new" if new_connection else "reused")
+
+    def get(self, url: str, params: Dict = None, timeout: float = 30, stream: bool = False):
+        """stream=True 면 본문을 읽지 않고 반환 (iter_chunks 로 읽은 뒤 close 필요)"""
+        if self.backend == 'httpx':
+            try:
+                request = self.client.build_request("GET", url, params=params, timeout=timeout)
+                response = self.client.send(request, stream=stream)
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+            stream = response.extensions.get('network_stream')
+            with self._lock:
+                new_connection = stream not in self._seen_streams
+                self._seen_streams.add(stream)
+            self._record(new_connection, response.http_version)
+            return response
+
+        before = self.adapter.connects
+        response = self.client.get(url, params=params, timeout=timeout, stream=stream)
+        # 동시 요청이 있으면 근사치 (다른 스레드의 연결 생성이 섞일 수 있음)
+        new_connection = self.adapter.connects > before
+        version = {10: 'HTTP/1.0', 11: 'HTTP/1.1'}.get(getattr(response.raw, 'version', 11), 'HTTP/1.1')
+        self._record(new_connection, version)
+        return response
+
+    def iter_chunks(self, response, chunk_size: int):
+        """스트리밍 응답 본문 (Content-Encoding 디코딩된 바이트 청크)"""
+        if self.backend == 'httpx':
+            try:
+                yield from response.iter_bytes(chunk_size)
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+        else:
+            yield from response.iter_content(chunk_size)
+
+    def stats(self) -> Dict:
+        """연결 재사용 통계"""
+        with self._lock:
+            reused = self.requests - self.connections_opened
+            return {
+                'backend': self.backend,
+                'pool_size': self.pool_size,
+                'requests': self.requests,
+                'connections_opened': self.connections_opened,
+                'reuse_ratio': round(reused / self.requests, 3) if self.requests else 0.0,
+                'http_versions': dict(self.http_versions),
+                'accept_encoding': self.headers.get('Accept-Encoding', ''),
+            }
+
+    def close(self):
+        self.client.close()
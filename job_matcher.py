@@ -0,0 +1,225 @@
+"""
+채용공고 엔티티 매칭 (리멤버 CSV ↔ 랠릿 DB)
+
+제목/회사명을 정규화한 뒤 토큰 블로킹 인덱스로 후보 쌍만 골라
+문자 바이그램 Dice 유사도로 점수를 매긴다. 전체 쌍 비교 없이
+수십만 건 규모에서도 동작하며, 소스 간 공통 job_uid 를 부여한다.
+"""
+import re
+import hashlib
+import unicodedata
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 회사명에서 제거할 법인 표기
+COMPANY_SUFFIX_PATTERN = re.compile(
+    r'\(주\)|㈜|\(유\)|주식회사|유한회사|\b(?:inc|corp|corporation|co|ltd|llc)\b\.?',
+    re.IGNORECASE
+)
+# 제목에서 의미 없는 괄호 태그 ([채용], (경력) 등은 유지하고 기호만 제거)
+PUNCTUATION_PATTERN = re.compile(r'[^\w가-힣]+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_title(title) -> str:
+    """제목 정규화: 유니코드 NFKC, 소문자, 기호 → 공백, 공백 축약"""
+    if not isinstance(title, str):
+        return ""
+    text = unicodedata.normalize('NFKC', title).lower()
+    text = PUNCTUATION_PATTERN.sub(' ', text)
+    return WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def normalize_company(company) -> str:
+    """회사명 정규화: 법인 표기 제거 후 제목과 동일 규칙 적용"""
+    if not isinstance(company, str):
+        return ""
+    text = unicodedata.normalize('NFKC', company)
+    text = COMPANY_SUFFIX_PATTERN.sub(' ', text)
+    return normalize_title(text)
+
+
+def compact(text: str) -> str:
+    """공백 제거 형태 ('백엔드 개발자' == '백엔드개발자')"""
+    return text.replace(' ', '')
+
+
+def char_bigrams(text: str) -> frozenset:
+    """문자 바이그램 집합 (한 글자 문자열은 자기 자신)"""
+    if len(text) < 2:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def dice_similarity(a: frozenset, b: frozenset) -> float:
+    """Dice 계수 (0.0 ~ 1.0)"""
+    if not a or not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+
+def make_job_uid(title_key: str, company_key: str = "", discriminator: str = "") -> str:
+    """
+    정규화 키 기반 안정적인 소스 공통 ID.
+    회사 키가 없으면 제목만으로는 다른 공고를 구분할 수 없으므로 discriminator (소스 + 행/원본 ID) 를 함께 해시.
+    """
+    key = f"{title_key}|{company_key}" if company_key or not discriminator else f"{title_key}||{discriminator}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return f"job_{digest[:16]}"
+
+
+class JobTitleMatcher:
+    """토큰 블로킹 + 바이그램 유사도 기반 공고 매처"""
+
+    def __init__(self, threshold: float = 0.85, max_block_size: int = 500,
+                 company_weight: float = 0.3, max_candidates: int = 200):
+        self.threshold = threshold
+        # 너무 흔한 토큰('개발자' 등)은 블록에서 제외해 후보 폭증 방지
+        self.max_block_size = max_block_size
+        # 행당 비교 후보 상한 (드문 토큰 블록부터 채움) → 비교 횟수 ≤ len(left) × max_candidates
+        self.max_candidates = max_candidates
+        self.company_weight = company_weight
+
+    def _prepare(self, titles: List, companies: Optional[List]) -> List[Dict]:
+        records = []
+        for idx, title in enumerate(titles):
+            title_norm = normalize_title(title)
+            company_norm = normalize_company(companies[idx]) if companies is not None else ""
+            title_key = compact(title_norm)
+            records.append({
+                'title_key': title_key,
+                'company_key': compact(company_norm),
+                'tokens': set(title_norm.split()) | ({title_key} if title_key else set()),
+                'title_grams': char_bigrams(title_key),
+                'company_grams': char_bigrams(compact(company_norm)),
+            })
+        return records
+
+    def _build_index(self, records: List[Dict]) -> Dict[str, List[int]]:
+        index = defaultdict(list)
+        for idx, record in enumerate(records):
+            for token in record['tokens']:
+                index[token].append(idx)
+        return index
+
+    def _score(self, left: Dict, right: Dict) -> float:
+        title_score = dice_similarity(left['title_grams'], right['title_grams'])
+        if left['company_grams'] and right['company_grams']:
+            company_score = dice_similarity(left['company_grams'], right['company_grams'])
+            return (1 - self.company_weight) * title_score + self.company_weight * company_score
+        return title_score
+
+    def match(self, left_titles: List, right_titles: List,
+              left_companies: Optional[List] = None,
+              right_companies: Optional[List] = None) -> List[Tuple[int, int, float]]:
+        """1:1 매칭 결과 (left_idx, right_idx, score) 목록 반환"""
+        left_records = self._prepare(left_titles, left_companies)
+        right_records = self._prepare(right_titles, right_companies)
+        index = self._build_index(right_records)
+
+        candidates = []
+        for left_idx, left in enumerate(left_records):
+            if not left['title_key']:
+                continue
+            seen = set()
+            # 공백 제거 키 블록 먼저, 나머지는 작은(드문 토큰) 블록부터
+            blocks = sorted(((token, index[token]) for token in left['tokens'] if token in index),
+                            key=lambda item: (item[0] != left['title_key'], len(item[1])))
+            for token, block in blocks:
+                # 공백 제거 키 블록은 크기와 무관하게 항상 사용
+                if len(block) > self.max_block_size and token != left['title_key']:
+                    continue
+                if len(seen) >= self.max_candidates:
+                    break
+                for right_idx in block:
+                    if right_idx in seen:
+                        continue
+                    if len(seen) >= self.max_candidates:
+                        break
+                    seen.add(right_idx)
+                    score = self._score(left, right_records[right_idx])
+                    if score >= self.threshold:
+                        candidates.append((score, left_idx, right_idx))
+
+        # 점수 높은 쌍부터 그리디하게 1:1 배정 (중복 제목으로 인한 행 증식 방지)
+        candidates.sort(key=lambda c: (-c[0], c[1], c[2]))
+        used_left, used_right = set(), set()
+        pairs = []
+        for score, left_idx, right_idx in candidates:
+            if left_idx in used_left or right_idx in used_right:
+                continue
+            used_left.add(left_idx)
+            used_right.add(right_idx)
+            pairs.append((left_idx, right_idx, score))
+
+        logger.info(f"🔗 공고 매칭: 후보 {len(candidates)}쌍 중 {len(pairs)}쌍 매칭 "
+                    f"(left {len(left_records)}개, right {len(right_records)}개)")
+        return pairs
+
+
+def _dedupe(df: pd.DataFrame, title_col: str, company_col: Optional[str]) -> pd.DataFrame:
+    """
+    (제목, 회사) 정규화 키 기준 소스 내부 중복 제거.
+    회사 컬럼이 없으면 제목만으로는 다른 공고를 구분할 수 없으므로 제거하지 않는다.
+    """
+    if not company_col or company_col not in df.columns:
+        return df.reset_index(drop=True)
+    keys = df[title_col].map(lambda t: compact(normalize_title(t)))
+    keys = keys + '|' + df[company_col].map(lambda c: compact(normalize_company(c)))
+    return df.loc[~keys.duplicated()].reset_index(drop=True)
+
+
+def merge_job_sources(left_df: pd.DataFrame, right_df: pd.DataFrame,
+                      on: str = "title",
+                      left_company: Optional[str] = None,
+                      right_company: Optional[str] = None,
+                      threshold: float = 0.85,
+                      left_id: Optional[str] = None,
+                      right_id: Optional[str] = None) -> pd.DataFrame:
+    """
+    pd.merge(left, right, on=title, how='outer') 대체.
+    정규화·퍼지 매칭된 행끼리 합치고 job_uid, match_score 컬럼을 추가한다.
+    회사 키가 없는 행의 job_uid 는 소스(left/right) + 원본 ID 컬럼(left_id/right_id, 없으면 행 위치)으로 구분
+    (같은 제목의 서로 다른 공고가 같은 ID 를 받지 않도록).
+    """
+    left = _dedupe(left_df, on, left_company)
+    right = _dedupe(right_df, on, right_company)
+
+    matcher = JobTitleMatcher(threshold=threshold)
+    pairs = matcher.match(
+        left[on].tolist(), right[on].tolist(),
+        left[left_company].tolist() if left_company else None,
+        right[right_company].tolist() if right_company else None
+    )
+
+    def row_uid(df, idx, company_col, id_col, side):
+        company = df.at[idx, company_col] if company_col else ""
+        row_id = df.at[idx, id_col] if id_col else idx
+        return make_job_uid(compact(normalize_title(df.at[idx, on])),
+                            compact(normalize_company(company)), f"{side}:{row_id}")
+
+    left_uids = [row_uid(left, i, left_company, left_id, 'left') for i in range(len(left))]
+    right_uids = [row_uid(right, i, right_company, right_id, 'right') for i in range(len(right))]
+    # 병합 키: 매칭 쌍만 같은 키를 공유, 매칭되지 않은 행(중복 제목 포함)은 각자 고유 키
+    left_keys = [f"L{i}" for i in range(len(left))]
+    right_keys = [f"R{i}" for i in range(len(right))]
+    scores = {}
+    for left_idx, right_idx, score in pairs:
+        # 매칭 쌍은 사전순으로 작은 쪽 ID를 공유 → 실행 순서와 무관하게 안정적
+        uid = min(left_uids[left_idx], right_uids[right_idx])
+        left_uids[left_idx] = right_uids[right_idx] = uid
+        right_keys[right_idx] = left_keys[left_idx]
+        scores[left_keys[left_idx]] = round(score, 4)
+
+    left = left.assign(job_uid=left_uids, _pair=left_keys)
+    right = right.rename(columns={on: f"{on}_right"}).assign(job_uid_right=right_uids, _pair=right_keys)
+    merged = pd.merge(left, right, on="_pair", how="outer", sort=False)
+    merged[on] = merged[on].fillna(merged[f"{on}_right"])
+    merged['job_uid'] = merged['job_uid'].fillna(merged['job_uid_right'])
+    merged['match_score'] = merged['_pair'].map(scores)
+    return merged.drop(columns=[f"{on}_right", 'job_uid_right', '_pair'])
@@ -0,0 +1,213 @@
+"""
+채용공고 전문 검색 (SQLite FTS5)
+
+job_postings(점핏) 와 postings(웨어하우스, 리멤버 섹션 포함) 의 텍스트 컬럼을
+external-content FTS5 인덱스로 만들고 트리거로 동기화한다.
+한글은 띄어쓰기/조사와 무관하게 부분 일치가 필요하므로 trigram 토크나이저를 사용한다.
+"""
+import re
+import sqlite3
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 정의: 원본 테이블 → (FTS 테이블명, 인덱싱 컬럼, bm25 컬럼 가중치)
+SEARCH_INDEXES = {
+    # 점핏 job_postings
+    'job_postings': {
+        'fts_table': 'job_postings_fts',
+        'columns': ['title', 'description', 'requirements', 'preferred_qualifications', 'tech_stacks'],
+        'weights': [5.0, 1.0, 2.0, 1.5, 3.0],
+        'result_columns': ['position_id', 'title', 'company_name', 'tech_stacks'],
+    },
+    # 웨어하우스 postings (리멤버: description=공고소개+주요업무, requirements=자격요건,
+    # preferred_qualifications=우대사항)
+    'postings': {
+        'fts_table': 'postings_fts',
+        'columns': ['title', 'description', 'requirements', 'preferred_qualifications', 'tech_stacks'],
+        'weights': [5.0, 1.0, 2.0, 1.5, 3.0],
+        'result_columns': ['source', 'source_id', 'title', 'company_name', 'tech_stacks'],
+    },
+}
+
+# trigram 토크나이저는 3글자 미만 검색어를 인덱스로 처리하지 못함
+MIN_TRIGRAM_LENGTH = 3
+TERM_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def _update_trigger_sql(table: str, fts: str, cols: List[str]) -> str:
+    """
+    UPDATE 동기화 트리거.
+    save_to_database 는 모든 컬럼을 SET 하므로 UPDATE OF 만으로는 매 재수집마다 재색인된다
+    → 색인 컬럼 값이 실제로 바뀐 행만 (IS NOT: NULL 비교 포함)
+    """
+    col_list = ", ".join(cols)
+    changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in cols)
+    return f"""CREATE TRIGGER {fts}_au AFTER UPDATE OF {col_list} ON {table}
+        WHEN {changed} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {", ".join(f"old.{c}" for c in cols)});
+            INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {", ".join(f"new.{c}" for c in cols)});
+        END"""
+
+
+def ensure_search_index(conn: sqlite3.Connection, table: str = 'job_postings') -> bool:
+    """
+    FTS5 테이블과 동기화 트리거 생성 (없을 때만). 새로 만들었으면 기존 행 색인.
+    이미 있는 인덱스는 UPDATE 트리거가 현재 정의와 다르면 교체.
+    """
+    spec = SEARCH_INDEXES[table]
+    fts = spec['fts_table']
+    cols = spec['columns']
+    col_list = ", ".join(cols)
+    new_values = ", ".join(f"new.{c}" for c in cols)
+    old_values = ", ".join(f"old.{c}" for c in cols)
+    update_trigger = _update_trigger_sql(table, fts, cols)
+
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+    ).fetchone()
+    if exists:
+        current = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (f"{fts}_au",)
+        ).fetchone()
+        if current is None or current[0] != update_trigger:
+            conn.execute(f"DROP TRIGGER IF EXISTS {fts}_au")
+            conn.execute(update_trigger)
+            logger.info(f"🔎 '{fts}' UPDATE 트리거 갱신 (색인 컬럼이 바뀐 행만 재색인)")
+        return False
+
+    conn.executescript(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {col_list},
+            content='{table}', content_rowid='id', tokenize='trigram'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_values});
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_values});
+        END;
+
+        {update_trigger};
+
+        INSERT INTO {fts}({fts}) VALUES ('rebuild');
+    ''')
+    logger.info(f"🔎 전문 검색 인덱스 '{fts}' 생성 완료")
+    return True
+
+
+def build_match_query(query: str) -> Tuple[str, List[str]]:
+    """
+    사용자 검색어 → (FTS5 MATCH 식, 짧은 검색어 목록).
+    공백 구분 검색어는 AND, "따옴표"는 구문 검색. 3글자 미만은 LIKE 로 별도 처리.
+    """
+    phrases, short_terms = [], []
+    for quoted, bare in TERM_PATTERN.findall(query):
+        term = (quoted or bare).strip()
+        if not term:
+            continue
+        if len(term) < MIN_TRIGRAM_LENGTH:
+            short_terms.append(term)
+        else:
+            phrases.append('"' + term.replace('"', '""') + '"')
+    return " AND ".join(phrases), short_terms
+
+
+class JobSearchIndex:
+    """채용공고 검색 API"""
+
+    def __init__(self, db_name: str = "jumpit_jobs.db", table: str = 'job_postings'):
+        self.db_name = db_name
+        self.table = table
+        self.spec = SEARCH_INDEXES[table]
+        conn = sqlite3.connect(self.db_name)
+        try:
+            ensure_search_index(conn, table)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def search(self, query: str, limit: int = 20, offset: int = 0,
+               columns: Optional[List[str]] = None) -> List[Dict]:
+        """bm25 순위로 정렬된 검색 결과 (snippet 포함)"""
+        fts = self.spec['fts_table']
+        match_expr, short_terms = build_match_query(query)
+        if columns:
+            # 특정 컬럼으로 제한: {title requirements} : (식)
+            match_expr = f"{{{' '.join(columns)}}} : ({match_expr})" if match_expr else ""
+
+        weights = ", ".join(str(w) for w in self.spec['weights'])
+        select_cols = ", ".join(f"t.{c}" for c in self.spec['result_columns'])
+        where, params = [], []
+        if match_expr:
+            where.append(f"{fts} MATCH ?")
+            params.append(match_expr)
+        for term in short_terms:
+            # 짧은 검색어는 FTS 테이블 컬럼 LIKE 로 필터 (MATCH 결과 위에서만 평가됨)
+            like_cols = " OR ".join(f"{fts}.{c} LIKE ?" for c in (columns or self.spec['columns']))
+            where.append(f"({like_cols})")
+            params.extend([f"%{term}%"] * len(columns or self.spec['columns']))
+        if not where:
+            return []
+
+        if match_expr:
+            score_expr = f"bm25({fts}, {weights})"
+            snippet_expr = f"snippet({fts}, -1, '[', ']', '…', 12)"
+            order = "score"
+        else:
+            # 짧은 검색어만 있는 경우: 순위 정보가 없으므로 최신순
+            score_expr, snippet_expr, order = "0.0", "''", "t.id DESC"
+        sql = f"""
+            SELECT t.id, {select_cols},
+                   {score_expr} AS score,
+                   {snippet_expr} AS snippet
+            FROM {fts}
+            JOIN {self.table} t ON t.id = {fts}.rowid
+            WHERE {" AND ".join(where)}
+            ORDER BY {order}
+            LIMIT ? OFFSET ?
+        """
+        params.extend([limit, offset])
+
+        try:
+            conn = sqlite3.connect(self.db_name)
+            conn.row_factory = sqlite3.Row
+            rows = [dict(row) for row in conn.execute(sql, params)]
+            conn.close()
+            return rows
+        except sqlite3.OperationalError as e:
+            logger.error(f"❌ 검색 실패 ('{query}'): {e}")
+            return []
+
+    def count(self, query: str) -> int:
+        """검색 결과 수"""
+        fts = self.spec['fts_table']
+        match_expr, short_terms = build_match_query(query)
+        if short_terms or not match_expr:
+            return len(self.search(query, limit=-1))
+        conn = sqlite3.connect(self.db_name)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {fts} WHERE {fts} MATCH ?",
+                                (match_expr,)).fetchone()[0]
+        finally:
+            conn.close()
+
+    def rebuild(self):
+        """전체 재색인 (원본 테이블을 트리거 없이 일괄 수정한 경우)"""
+        fts = self.spec['fts_table']
+        conn = sqlite3.connect(self.db_name)
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        conn.commit()
+        conn.close()
+        logger.info(f"🔁 '{fts}' 재색인 완료")
+
+    def optimize(self):
+        """세그먼트 병합 (대량 적재 후 검색 지연 감소)"""
+        fts = self.spec['fts_table']
+        conn = sqlite3.connect(self.db_name)
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('optimize')")
+        conn.commit()
+        conn.close()
@@ -0,0 +1,362 @@
+"""
+다중 소스 채용공고 웨어하우스 (점핏 / 리멤버 / 랠릿)
+
+세 가지 형태의 데이터를 하나의 정규화된 postings 테이블로 모은다.
+- 점핏: jumpfit.JumpitCrawler.parse_job_posting 이 만든 JobPosting (job_postings 테이블)
+- 리멤버: JD.MultiJobCategoryCrawler.extract_basic_job_info 가 만든 한글 키 dict (CSV)
+- 랠릿: camelCase 컬럼의 jobs 테이블
+"""
+import json
+import sqlite3
+import logging
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from job_matcher import normalize_title, normalize_company, compact, make_job_uid
+from job_search import ensure_search_index
+
+logger = logging.getLogger(__name__)
+
+# 정규 공고 스키마 (컬럼 순서 = INSERT 순서)
+CANONICAL_COLUMNS = [
+    'source', 'source_id', 'job_uid', 'title', 'company_name', 'company_key', 'location',
+    'career_level', 'employment_type', 'education_level', 'job_category',
+    'tech_stacks', 'description', 'requirements', 'preferred_qualifications',
+    'deadline', 'view_count', 'bookmark_count', 'link', 'crawled_at', 'raw_json'
+]
+
+SOURCE_JUMPIT = "jumpit"
+SOURCE_REMEMBER = "remember"
+SOURCE_RALLIT = "rallit"
+
+
+def _text(value) -> str:
+    """None/NaN 안전 문자열 변환"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value != value:  # NaN
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value if v)
+    return str(value).strip()
+
+
+def _int(value) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _job_uid(title: str, company: str) -> str:
+    return make_job_uid(compact(normalize_title(title)), compact(normalize_company(company)))
+
+
+def from_jumpit(posting) -> Dict:
+    """점핏 JobPosting (또는 job_postings 행 dict) → 정규 스키마"""
+    data = asdict(posting) if is_dataclass(posting) else dict(posting)
+    return {
+        'source': SOURCE_JUMPIT,
+        'source_id': _text(data.get('position_id')),
+        'job_uid': _job_uid(_text(data.get('title')), _text(data.get('company_name'))),
+        'title': _text(data.get('title')),
+        'company_name': _text(data.get('company_name')),
+        'company_key': compact(normalize_company(_text(data.get('company_name')))),
+        'location': _text(data.get('location')),
+        'career_level': _text(data.get('career_level')),
+        'employment_type': _text(data.get('employment_type')),
+        'education_level': _text(data.get('education_level')),
+        'job_category': _text(data.get('job_category')),
+        'tech_stacks': _text(data.get('tech_stacks')),
+        'description': _text(data.get('description')),
+        'requirements': _text(data.get('requirements')),
+        'preferred_qualifications': _text(data.get('preferred_qualifications')),
+        'deadline': _text(data.get('deadline')),
+        'view_count': _int(data.get('view_count')),
+        'bookmark_count': _int(data.get('bookmark_count')),
+        'link': f"https://www.jumpit.co.kr/position/{_text(data.get('position_id'))}",
+        'crawled_at': _text(data.get('crawled_at')),
+        'raw_json': json.dumps({'api_url': _text(data.get('api_url'))}, ensure_ascii=False),
+    }
+
+
+def from_remember(job: Dict) -> Dict:
+    """리멤버 공고 dict (extract_basic_job_info / enhance_with_detailed_info 결과) → 정규 스키마"""
+    return {
+        'source': SOURCE_REMEMBER,
+        'source_id': _text(job.get('공고ID')),
+        'job_uid': _job_uid(_text(job.get('공고명')), _text(job.get('회사명'))),
+        'title': _text(job.get('공고명')),
+        'company_name': _text(job.get('회사명')),
+        'company_key': compact(normalize_company(_text(job.get('회사명')))),
+        'location': _text(job.get('지역')),
+        'career_level': _text(job.get('경력요건')),
+        'employment_type': _text(job.get('채용유형')),
+        'education_level': _text(job.get('학력요건')),
+        'job_category': _text(job.get('직무카테고리')),
+        'tech_stacks': "",
+        'description': " ".join(filter(None, [_text(job.get('공고소개')), _text(job.get('주요업무'))])),
+        'requirements': _text(job.get('자격요건')),
+        'preferred_qualifications': _text(job.get('우대사항')),
+        'deadline': _text(job.get('마감일')),
+        'view_count': 0,
+        'bookmark_count': 0,
+        'link': _text(job.get('link')),
+        'crawled_at': _text(job.get('crawled_at')),
+        'raw_json': json.dumps({'직무': _text(job.get('직무')), '채용절차': _text(job.get('채용절차')),
+                                '필드출처': _text(job.get('필드출처'))}, ensure_ascii=False),
+    }
+
+
+def from_rallit(row: Dict) -> Dict:
+    """랠릿 jobs 테이블 행 (camelCase) → 정규 스키마"""
+    title = _text(row.get('title'))
+    company = _text(row.get('companyName'))
+    source_id = _text(row.get('id')) or _job_uid(title, company)
+    return {
+        'source': SOURCE_RALLIT,
+        'source_id': source_id,
+        'job_uid': _job_uid(title, company),
+        'title': title,
+        'company_name': company,
+        'company_key': compact(normalize_company(company)),
+        'location': _text(row.get('addressRegion')),
+        'career_level': _text(row.get('jobLevels')),
+        'employment_type': "",
+        'education_level': "",
+        'job_category': _text(row.get('jobCategory')),
+        'tech_stacks': _text(row.get('jobSkillKeywords')),
+        'description': _text(row.get('description')),
+        'requirements': "",
+        'preferred_qualifications': "",
+        'deadline': _text(row.get('endedAt')),
+        'view_count': 0,
+        # isBookmarked 는 수집 계정의 북마크 여부 (공고 북마크 수 아님) → raw_json 에만 보관
+        'bookmark_count': None,
+        'link': _text(row.get('url')),
+        'crawled_at': "",
+        'raw_json': json.dumps({k: _text(v) for k, v in row.items()}, ensure_ascii=False),
+    }
+
+
+class JobWarehouse:
+    """정규화 공고 웨어하우스 (SQLite)"""
+
+    def __init__(self, db_name: str = "job_warehouse.db"):
+        self.db_name = db_name
+        self.init_database()
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_name)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def init_database(self):
+        """웨어하우스 테이블 및 공용 인덱스 생성"""
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS postings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source TEXT NOT NULL,
+                    source_id TEXT NOT NULL,
+                    job_uid TEXT,
+                    title TEXT,
+                    company_name TEXT,
+                    company_key TEXT,
+                    location TEXT,
+                    career_level TEXT,
+                    employment_type TEXT,
+                    education_level TEXT,
+                    job_category TEXT,
+                    tech_stacks TEXT,
+                    description TEXT,
+                    requirements TEXT,
+                    preferred_qualifications TEXT,
+                    deadline TEXT,
+                    view_count INTEGER DEFAULT 0,
+                    bookmark_count INTEGER DEFAULT 0,
+                    link TEXT,
+                    crawled_at TEXT,
+                    raw_json TEXT,
+                    loaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(source, source_id)
+                )
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_postings_job_uid ON postings(job_uid)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_postings_company ON postings(company_key, source)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_postings_location ON postings(location, source)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_postings_category ON postings(job_category, source)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_postings_deadline ON postings(deadline)")
+            ensure_search_index(conn, 'postings')
+            conn.commit()
+            conn.close()
+            logger.info(f"✅ 웨어하우스 '{self.db_name}' 초기화 완료")
+        except Exception as e:
+            logger.error(f"❌ 웨어하우스 초기화 실패: {e}")
+
+    def bulk_load(self, rows: Iterable[Dict], batch_size: int = 5000) -> int:
+        """정규 스키마 행 일괄 적재 (source, source_id 기준 upsert)"""
+        fields = ", ".join(CANONICAL_COLUMNS)
+        placeholders = ", ".join(["?"] * len(CANONICAL_COLUMNS))
+        updates = ", ".join(f"{c} = excluded.{c}" for c in CANONICAL_COLUMNS[2:])
+        sql = (f"INSERT INTO postings ({fields}) VALUES ({placeholders}) "
+               f"ON CONFLICT(source, source_id) DO UPDATE SET {updates}, loaded_at = CURRENT_TIMESTAMP")
+
+        loaded = 0
+        conn = None
+        try:
+            conn = self.connect()
+            batch = []
+            for row in rows:
+                if not row.get('source_id'):
+                    continue
+                batch.append([row[c] for c in CANONICAL_COLUMNS])
+                if len(batch) >= batch_size:
+                    conn.executemany(sql, batch)
+                    loaded += len(batch)
+                    batch = []
+            if batch:
+                conn.executemany(sql, batch)
+                loaded += len(batch)
+            conn.commit()
+            logger.info(f"💾 웨어하우스 적재 완료: {loaded}개")
+            return loaded
+        except Exception as e:
+            # 커밋 전 실패 → 전체 롤백되므로 적재된 행 없음
+            if conn is not None:
+                conn.rollback()
+            logger.error(f"❌ 웨어하우스 적재 실패 (롤백): {e}")
+            return 0
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def load_jumpit_postings(self, postings: List) -> int:
+        """JobPosting 목록 적재 (crawl_search_type 결과)"""
+        return self.bulk_load(from_jumpit(p) for p in postings)
+
+    def load_remember_jobs(self, jobs: List[Dict]) -> int:
+        """리멤버 공고 dict 목록 적재 (MultiJobCategoryCrawler 결과)"""
+        return self.bulk_load(from_remember(j) for j in jobs)
+
+    def load_jumpit_db(self, db_path: str = "jumpit_jobs.db") -> int:
+        """jumpit_jobs.db 의 job_postings 테이블 적재"""
+        src = sqlite3.connect(db_path)
+        src.row_factory = sqlite3.Row
+        try:
+            cursor = src.execute("SELECT * FROM job_postings")
+            return self.bulk_load(from_jumpit(dict(row)) for row in cursor)
+        finally:
+            src.close()
+
+    def load_remember_csv(self, csv_path: str, encoding: str = 'utf-8-sig') -> int:
+        """save_complete_results 가 만든 리멤버 CSV 적재"""
+        df = pd.read_csv(csv_path, encoding=encoding, dtype=str).fillna('')
+        return self.bulk_load(from_remember(job) for job in df.to_dict('records'))
+
+    def load_rallit_db(self, db_path: str = "job_dev_rallit_1.db") -> int:
+        """랠릿 jobs 테이블 적재"""
+        src = sqlite3.connect(db_path)
+        src.row_factory = sqlite3.Row
+        try:
+            cursor = src.execute("SELECT * FROM jobs")
+            return self.bulk_load(from_rallit(dict(row)) for row in cursor)
+        finally:
+            src.close()
+
+    def get_cross_source_stats(self, top_n: int = 10) -> Dict:
+        """전체 소스 통합 통계 (단일 테이블 질의)"""
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT source, COUNT(*), COUNT(DISTINCT company_key),
+                       SUM(CASE WHEN description != '' OR requirements != '' THEN 1 ELSE 0 END)
+                FROM postings
+                GROUP BY source
+            """)
+            by_source = {
+                source: {'jobs': jobs, 'companies': companies, 'with_detail': with_detail}
+                for source, jobs, companies, with_detail in cursor.fetchall()
+            }
+
+            cursor.execute("""
+                SELECT MIN(company_name), COUNT(*) AS job_count, COUNT(DISTINCT source) AS sources
+                FROM postings
+                WHERE company_key != ''
+                GROUP BY company_key
+                ORDER BY job_count DESC
+                LIMIT ?
+            """, (top_n,))
+            top_companies = cursor.fetchall()
+
+            cursor.execute("""
+                SELECT location, COUNT(*) AS job_count
+                FROM postings
+                WHERE location != ''
+                GROUP BY location
+                ORDER BY job_count DESC
+                LIMIT ?
+            """, (top_n,))
+            top_locations = cursor.fetchall()
+
+            # 둘 이상 소스에 동시에 게시된 공고 (job_uid 기준)
+            cursor.execute("""
+                SELECT COUNT(*) FROM (
+                    SELECT job_uid FROM postings
+                    GROUP BY job_uid
+                    HAVING COUNT(DISTINCT source) > 1
+                )
+            """)
+            cross_posted = cursor.fetchone()[0]
+
+            conn.close()
+            return {
+                "total_jobs": sum(s['jobs'] for s in by_source.values()),
+                "by_source": by_source,
+                "top_companies": top_companies,
+                "top_locations": top_locations,
+                "cross_posted": cross_posted,
+            }
+        except Exception as e:
+            logger.error(f"❌ 웨어하우스 통계 조회 실패: {e}")
+            return {}
+
+
+def main(jumpit_db: str = "jumpit_jobs.db", remember_csv: Optional[str] = None,
+         rallit_db: Optional[str] = "job_dev_rallit_1.db"):
+    """세 소스를 모두 적재하고 통합 통계 출력"""
+    warehouse = JobWarehouse()
+    started = datetime.now()
+
+    for label, loader, path in [
+        ("점핏", warehouse.load_jumpit_db, jumpit_db),
+        ("리멤버", warehouse.load_remember_csv, remember_csv),
+        ("랠릿", warehouse.load_rallit_db, rallit_db),
+    ]:
+        if not path:
+            continue
+        try:
+            count = loader(path)
+            print(f"✅ {label}: {count}개 적재 ({path})")
+        except Exception as e:
+            print(f"⚠️ {label} 적재 건너뜀 ({path}): {e}")
+
+    stats = warehouse.get_cross_source_stats()
+    print(f"\n💾 전체 공고: {stats.get('total_jobs', 0)}개 "
+          f"({(datetime.now() - started).total_seconds():.1f}초)")
+    for source, info in stats.get('by_source', {}).items():
+        print(f"   {source}: {info['jobs']}개 / 회사 {info['companies']}곳")
+    print(f"🔗 다중 소스 동시 게시: {stats.get('cross_posted', 0)}개")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    main()
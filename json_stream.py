@@ -0,0 +1,186 @@
+"""
+positions 응답 스트리밍 디코딩
+
+응답 본문을 청크 단위로 받으면서 `"positions": [...]` 배열의 원소(공고 객체)를
+하나씩 잘라 orjson 으로 디코딩해 바로 넘긴다.
+- 본문 전체를 메모리에 두지 않음 (버퍼에는 아직 완성되지 않은 공고 객체 하나만 남음)
+- 첫 공고는 본문 수신이 끝나기 전에 파싱 가능
+- positions 배열 밖의 나머지(totalCount, page 등)는 배열을 비운 골격으로 모아 마지막에 디코딩
+
+orjson 미설치 시 표준 json 으로 동작한다.
+"""
+import re
+import json
+import time
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 16 * 1024
+
+_POSITIONS_KEY = re.compile(rb'"positions"\s*:\s*\[')
+_STRUCTURAL = re.compile(rb'["\\\[\]{}]')
+_IN_STRING = re.compile(rb'["\\]')
+
+_QUOTE, _BACKSLASH = ord('"'), ord('\\')
+_OPENERS, _CLOSERS = b'{[', b'}]'
+
+
+def loads(data):
+    """bytes 를 한 번에 디코딩 (str 로 변환하지 않음)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class PositionsDecoder:
+    """청크를 받아 positions 배열 원소를 완성되는 대로 돌려주는 증분 디코더"""
+
+    def __init__(self, key_pattern=_POSITIONS_KEY):
+        self.key_pattern = key_pattern
+        self.phase = 'prefix'  # prefix → array → suffix
+        self.buf = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.obj_start: Optional[int] = None
+        self.prefix = b''
+        self.suffix = bytearray()
+
+    def feed(self, chunk: bytes) -> List[Dict]:
+        if self.phase == 'suffix':
+            self.suffix += chunk
+            return []
+
+        self.buf += chunk
+        if self.phase == 'prefix':
+            match = self.key_pattern.search(self.buf)
+            if not match:
+                return []
+            # 골격에는 '[' 직전까지 남기고, 배열 본문부터 스캔
+            self.prefix = bytes(self.buf[:match.end() - 1])
+            del self.buf[:match.end()]
+            self.phase = 'array'
+            self.pos = 0
+
+        return self._scan()
+
+    def _scan(self) -> List[Dict]:
+        items = []
+        buf = self.buf
+        while True:
+            pattern = _IN_STRING if self.in_string else _STRUCTURAL
+            match = pattern.search(buf, self.pos)
+            if not match:
+                # 이스케이프 건너뛰기로 pos 가 버퍼 끝을 넘었으면 그대로 유지
+                self.pos = max(self.pos, len(buf))
+                break
+            i = match.start()
+            char = buf[i]
+            if char == _BACKSLASH:
+                # 이스케이프된 다음 바이트는 건너뜀 (청크 경계에 걸치면 다음 feed 에서 건너뜀)
+                self.pos = i + 2
+                continue
+            if char == _QUOTE:
+                self.in_string = not self.in_string
+            elif char in _OPENERS:
+                if self.depth == 0:
+                    self.obj_start = i
+                self.depth += 1
+            elif char in _CLOSERS:
+                if self.depth == 0:
+                    # positions 배열 끝
+                    self.suffix += buf[i + 1:]
+                    self.phase = 'suffix'
+                    self.buf = bytearray()
+                    return items
+                self.depth -= 1
+                if self.depth == 0 and self.obj_start is not None:
+                    item = loads(bytes(buf[self.obj_start:i + 1]))
+                    if isinstance(item, dict):
+                        items.append(item)
+                    self.obj_start = None
+            self.pos = i + 1
+
+        # 처리 끝난 앞부분 버리기 (미완성 객체 시작점부터만 보관)
+        keep = self.obj_start if self.obj_start is not None else min(self.pos, len(buf))
+        if keep:
+            del buf[:keep]
+            self.pos -= keep
+            if self.obj_start is not None:
+                self.obj_start = 0
+        return items
+
+    def finish(self):
+        """(골격 dict, positions 배열이 없던 경우의 전체 dict) 반환"""
+        if self.phase == 'suffix':
+            return loads(self.prefix + b'[]' + bytes(self.suffix)), None
+        if self.phase == 'prefix':
+            # positions 키가 없는 응답 구조 → 전체 본문 디코딩으로 대체
+            data = loads(bytes(self.buf)) if self.buf.strip() else {}
+            return None, data
+        raise ValueError("응답 본문이 positions 배열 중간에서 끊김")
+
+
+class PositionsStream:
+    """
+    스트리밍 응답을 감싼 반복자: for job_data in stream → 공고 dict 를 도착 순서대로.
+    반복이 끝나면 total_count / count / bytes / error 가 채워진다.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], close: Optional[Callable[[], None]] = None,
+                 fallback: Optional[Callable[[Dict], tuple]] = None,
+                 on_complete: Optional[Callable[[int, Optional[float]], None]] = None):
+        self.chunks = chunks
+        self._close = close
+        self.fallback = fallback  # 골격 대신 전체 dict 를 받았을 때 (공고 목록, 전체 개수) 추출
+        self.on_complete = on_complete
+        self.decoder = PositionsDecoder()
+        self.count = 0
+        self.bytes = 0
+        self.total_count = 0
+        self.meta: Dict = {}
+        self.error: Optional[Exception] = None
+        self.first_item_seconds: Optional[float] = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        start = time.perf_counter()
+        try:
+            for chunk in self.chunks:
+                self.bytes += len(chunk)
+                for item in self.decoder.feed(chunk):
+                    if self.first_item_seconds is None:
+                        self.first_item_seconds = time.perf_counter() - start
+                    self.count += 1
+                    yield item
+
+            meta, full = self.decoder.finish()
+            if meta is not None:
+                self.meta = meta
+                result = meta.get('result', meta) if isinstance(meta, dict) else {}
+                self.total_count = result.get('totalCount', 0) if isinstance(result, dict) else 0
+            elif full is not None and self.fallback:
+                jobs_list, self.total_count = self.fallback(full)
+                self.meta = full
+                for item in jobs_list:
+                    self.count += 1
+                    yield item
+        except Exception as e:
+            # 연결 끊김 / 본문 손상 - 여기까지 받은 공고는 유지
+            self.error = e
+            logger.warning(f"⚠️ 스트리밍 응답 처리 중단 ({self.count}개 수신 후): {e}")
+        finally:
+            self.close()
+            if self.on_complete:
+                self.on_complete(self.bytes, self.first_item_seconds)
+
+    def close(self):
+        if self._close:
+            self._close()
+            self._close = None
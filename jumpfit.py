@@ -6,23 +6,87 @@ import logging
 import sqlite3
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from collections import Counter
 import os
 from pathlib import Path
 import urllib.parse
 from dataclasses import dataclass, asdict
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('jumpit_crawler.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+from job_search import ensure_search_index
+from crawl_metrics import CrawlMetrics
+from http_transport import DEFAULT_POOL_SIZE, PooledTransport, supported_encodings
+from json_stream import STREAM_CHUNK_SIZE, PositionsStream, loads as json_loads
+from log_setup import setup_logging, new_run_id, SAMPLED
+from sharded_crawl import run_sharded_crawling
+from search_planner import BROAD_SCAN_NAME, BROAD_SCAN_PARAMS, local_memberships, plan_for_crawler
+from crawl_scheduler import schedule_for_crawler
+from stage_pipeline import run_jumpit_pipeline
+
+# 로깅 설정은 main / run_quick_test 에서 (큐 기반 비동기, JSON Lines 파일 + 콘솔, 요청 단위 로그 샘플링)
+LOG_FILE = 'jumpit_crawler.jsonl'
 logger = logging.getLogger(__name__)
 
+# 크롤링 간 변화를 이력으로 남길 필드 (값이 바뀔 때만 기록)
+TRACKED_FIELDS = ('view_count', 'bookmark_count', 'deadline')
+
+# 통계 요약 테이블(stats_counters) 계산에 필요한 컬럼
+STATS_COLUMNS = ('company_name', 'location', 'career_level', 'api_url', 'tech_stacks',
+                 'salary', 'work_location_type', 'tags')
+
+# 페이지 크기: 기본값(수집 예산 단위)과 탐색 후보 (큰 값부터)
+DEFAULT_PAGE_LIMIT = 20
+# 이 limit 이상이면 응답을 스트리밍 디코딩 (작은 응답은 한 번에 디코딩하는 편이 빠름)
+STREAM_MIN_LIMIT = 50
+PAGE_LIMIT_CANDIDATES = (100, 50, DEFAULT_PAGE_LIMIT)
+
+
+def plan_page_limit(max_pages: int, max_limit: Optional[int]) -> Tuple[int, int]:
+    """
+    수집 예산(기본 페이지 크기 기준 max_pages) + 확인된 최대 limit → (요청 limit, 페이지 수).
+    예산보다 큰 페이지는 요청하지 않고, 같은 요청 수로 나눠 떨어지게 맞춤.
+    """
+    if not max_limit:
+        return DEFAULT_PAGE_LIMIT, max_pages
+    max_items = max_pages * DEFAULT_PAGE_LIMIT
+    pages = -(-max_items // max_limit)
+    return -(-max_items // pages), pages
+
+# 기술 스택별 통계 대상 (점핏 스타일)
+MAJOR_TECHS = [
+    'Java', 'Python', 'JavaScript', 'React', 'Vue.js', 'Node.js',
+    'Spring Boot', 'Django', 'PHP', 'C++', 'C#', 'AWS',
+    'MySQL', 'Oracle', 'Docker', 'Kubernetes'
+]
+
+
+def stat_keys(row) -> List[tuple]:
+    """공고 한 건이 기여하는 (통계 차원, 키) 목록 - get_database_stats 의 집계 조건과 동일"""
+    def value(field):
+        v = row[field]
+        return v if v is not None else ""
+    
+    keys = [('total', '')]
+    for dimension, field in (('company', 'company_name'), ('location', 'location'),
+                             ('career', 'career_level'), ('category', 'api_url')):
+        if value(field) != '':
+            keys.append((dimension, value(field)))
+    
+    # SQLite LIKE 와 동일하게 대소문자 무시 부분 일치
+    tech_stacks = value('tech_stacks').lower()
+    for tech in MAJOR_TECHS:
+        if tech.lower() in tech_stacks:
+            keys.append(('tech', tech))
+    
+    salary = value('salary')
+    if salary != '' and '협의' not in salary:
+        keys.append(('salary_disclosed', ''))
+    
+    remote_text = f"{value('work_location_type')} {value('tags')}"
+    if '재택' in remote_text or '원격' in remote_text:
+        keys.append(('remote', ''))
+    return keys
+
 @dataclass
 class JobPosting:
     """채용공고 데이터 클래스"""
@@ -57,18 +121,25 @@ class JobPosting:
     api_url: str = ""
 
 class JumpitCrawler:
-    def __init__(self, db_name: str = "jumpit_jobs.db"):
+    def __init__(self, db_name: str = "jumpit_jobs.db", init_db: bool = True,
+                 pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False, stream_responses: bool = True):
         self.base_api_url = "https://jumpit-api.saramin.co.kr/api/positions"
-        self.session = requests.Session()
         self.db_name = db_name
+        self.stream_responses = stream_responses
         self.job_data: List[JobPosting] = []
         
+        # 계측 (요청 지연/전송량/재시도/대기 시간)
+        self.metrics = CrawlMetrics()
+        
+        # 엔드포인트별 최대 페이지 크기 캐시 (api_page_limits 테이블과 동기화)
+        self.page_limits: Dict[str, int] = {}
+        
         # 요청 헤더 설정 (한국 사용자 시뮬레이션)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': supported_encodings(),  # 디코딩 가능한 코덱만 광고
             'Connection': 'keep-alive',
             'Referer': 'https://www.jumpit.co.kr/',
             'Origin': 'https://www.jumpit.co.kr',
@@ -77,7 +148,9 @@ class JumpitCrawler:
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'cross-site'
         }
-        self.session.headers.update(self.headers)
+        # 연결 풀 전송 계층 (keep-alive, 선택적 HTTP/2, 연결 재사용 계측)
+        self.session = PooledTransport(pool_size=pool_size, http2=http2, headers=self.headers,
+                                       metrics=self.metrics)
         
         # 점핏 실제 직무 분류에 맞춘 검색 파라미터
         self.search_params = {
@@ -140,8 +213,9 @@ class JumpitCrawler:
             "부산지역": {"location": "부산", "sort": "reg_dt"}
         }
         
-        # 데이터베이스 초기화
-        self.init_database()
+        # 데이터베이스 초기화 (샤딩 워커는 코디네이터가 초기화한 DB를 그대로 사용)
+        if init_db:
+            self.init_database()
         
     def init_database(self):
         """SQLite 데이터베이스 초기화"""
@@ -201,57 +275,164 @@ class JumpitCrawler:
                 )
             ''')
             
+            # API 페이지 크기 탐색 결과 캐시
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS api_page_limits (
+                    endpoint TEXT PRIMARY KEY,
+                    max_limit INTEGER NOT NULL,
+                    probed_at TEXT
+                )
+            ''')
+            
+            # 통계 요약 테이블 (save_to_database 에서 증분 갱신)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS stats_counters (
+                    dimension TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (dimension, key)
+                ) WITHOUT ROWID
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_stats_counters_rank ON stats_counters(dimension, count DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawling_logs_created ON crawling_logs(created_at)")
+            
+            # 공고 필드 변경 이력 테이블 (append-only, 변경된 필드만 기록)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS posting_history (
+                    position_id TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    observed_at TEXT NOT NULL,
+                    value,
+                    PRIMARY KEY (position_id, field, observed_at)
+                ) WITHOUT ROWID
+            ''')
+            
+            # 검색 조건 ↔ 공고 멤버십 (검색 간 중복도 추정 → search_planner 실행 계획)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS search_memberships (
+                    search_type TEXT NOT NULL,
+                    position_id TEXT NOT NULL,
+                    last_seen_at TEXT,
+                    PRIMARY KEY (search_type, position_id)
+                ) WITHOUT ROWID
+            ''')
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_search_memberships_position ON search_memberships(position_id)")
+            
+            # 전문 검색 인덱스 (FTS5, 트리거 동기화)
+            ensure_search_index(conn, 'job_postings')
+            
             conn.commit()
+            
+            # 기존 DB에 요약 테이블이 처음 추가된 경우 한 번 전체 집계
+            cursor.execute("SELECT COUNT(*) FROM stats_counters")
+            if cursor.fetchone()[0] == 0:
+                cursor.execute("SELECT COUNT(*) FROM job_postings")
+                if cursor.fetchone()[0] > 0:
+                    self.rebuild_stats_counters(conn)
+            
             conn.close()
             logger.info(f"✅ 데이터베이스 '{self.db_name}' 초기화 완료")
             
         except Exception as e:
             logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
     
-    def make_safe_request(self, url: str, params: Dict = None, max_retries: int = 3) -> Optional[Dict]:
-        """안전한 API 요청 (재시도 로직 포함)"""
+    def rebuild_stats_counters(self, conn: sqlite3.Connection = None):
+        """통계 요약 테이블 전체 재계산 (기존 DB 마이그레이션/검증용)"""
+        own_conn = conn is None
+        if own_conn:
+            conn = sqlite3.connect(self.db_name)
+        conn.row_factory = sqlite3.Row
+        
+        counters = Counter()
+        for row in conn.execute(f"SELECT {', '.join(STATS_COLUMNS)} FROM job_postings"):
+            counters.update(stat_keys(row))
+        
+        conn.execute("DELETE FROM stats_counters")
+        conn.executemany(
+            "INSERT INTO stats_counters (dimension, key, count) VALUES (?, ?, ?)",
+            [(dimension, key, count) for (dimension, key), count in counters.items()]
+        )
+        conn.commit()
+        conn.row_factory = None
+        if own_conn:
+            conn.close()
+        logger.info(f"📊 통계 요약 테이블 재계산 완료 ({len(counters)}개 항목)")
+    
+    def make_safe_request(self, url: str, params: Dict = None, max_retries: int = 3,
+                          stream: bool = False) -> Optional[Union[Dict, PositionsStream]]:
+        """
+        안전한 API 요청 (재시도 로직 포함)
+        
+        stream=True 면 본문을 버퍼링하지 않고 PositionsStream 을 반환한다.
+        (반복하면 positions 원소가 도착하는 대로 디코딩됨, 재시도는 응답 헤더 수신까지만 적용)
+        """
         for attempt in range(max_retries):
             try:
                 # 요청 전 랜덤 대기 (서버 부하 방지)
                 delay = random.uniform(2, 5) + (attempt * 2)  # 재시도 시 더 긴 대기
-                time.sleep(delay)
+                self.metrics.sleep(delay, "politeness")
                 
-                logger.info(f"🔄 API 요청 중... (시도 {attempt + 1}/{max_retries})")
-                logger.debug(f"URL: {url}")
-                logger.debug(f"Params: {params}")
+                if attempt > 0:
+                    self.metrics.inc("retries_total")
+                logger.info("🔄 API 요청 중... (시도 %d/%d)", attempt + 1, max_retries, extra=SAMPLED)
+                logger.debug("URL: %s Params: %s", url, params)
                 
-                response = self.session.get(url, params=params, timeout=30)
+                with self.metrics.timed("request"):
+                    response = self.session.get(url, params=params, timeout=30, stream=stream)
+                
+                if stream and response.status_code == 200:
+                    return PositionsStream(
+                        self.session.iter_chunks(response, STREAM_CHUNK_SIZE),
+                        close=response.close,
+                        fallback=self.extract_positions,
+                        on_complete=self._record_stream,
+                    )
+                
+                body = response.content
+                self.metrics.record_response(response.status_code, len(body))
                 
                 # 상태 코드 확인
                 if response.status_code == 200:
-                    data = response.json()
-                    logger.info(f"✅ API 요청 성공 (응답 크기: {len(response.content)} bytes)")
+                    data = json_loads(body)  # bytes 에서 바로 디코딩 (text 변환 생략)
+                    logger.info("✅ API 요청 성공 (응답 크기: %d bytes)", len(body), extra=SAMPLED)
                     return data
                 elif response.status_code == 429:  # Too Many Requests
                     wait_time = random.uniform(30, 60)
                     logger.warning(f"⚠️ Rate limit 도달, {wait_time:.1f}초 대기...")
-                    time.sleep(wait_time)
+                    self.metrics.sleep(wait_time, "rate_limit")
                     continue
                 else:
                     logger.warning(f"⚠️ HTTP {response.status_code}: {response.text[:200]}")
                     
             except requests.exceptions.Timeout:
+                self.metrics.inc("request_errors_total", kind="timeout")
                 logger.warning(f"⏰ 요청 타임아웃 (시도 {attempt + 1})")
             except requests.exceptions.ConnectionError as e:
+                self.metrics.inc("request_errors_total", kind="connection")
                 logger.warning(f"🔌 연결 오류 (시도 {attempt + 1}): {e}")
             except requests.exceptions.RequestException as e:
+                self.metrics.inc("request_errors_total", kind="request")
                 logger.warning(f"📡 요청 오류 (시도 {attempt + 1}): {e}")
             except json.JSONDecodeError as e:
+                self.metrics.inc("request_errors_total", kind="json")
                 logger.warning(f"📄 JSON 파싱 오류 (시도 {attempt + 1}): {e}")
             
             if attempt < max_retries - 1:
                 wait_time = random.uniform(10, 20) * (attempt + 1)
                 logger.info(f"💤 {wait_time:.1f}초 후 재시도...")
-                time.sleep(wait_time)
+                self.metrics.sleep(wait_time, "retry_backoff")
         
+        self.metrics.inc("failed_requests_total")
         logger.error("❌ 모든 재시도 실패")
         return None
     
+    def _record_stream(self, size_bytes: int, first_item_seconds: Optional[float]):
+        """스트리밍 응답 수신 완료 시 계측 (전송량 / 첫 공고까지 걸린 시간)"""
+        self.metrics.record_response(200, size_bytes)
+        if first_item_seconds is not None:
+            self.metrics.observe("first_position_seconds", first_item_seconds)
+        logger.info("✅ API 스트리밍 수신 완료 (응답 크기: %d bytes)", size_bytes, extra=SAMPLED)
+    
     def parse_job_posting(self, job_data: Dict, search_type: str = "") -> JobPosting:
         """실제 점핏 API 응답 구조에 맞춘 JobPosting 객체 변환"""
         try:
@@ -333,7 +514,6 @@ class JumpitCrawler:
             elif closed_at:
                 try:
                     # ISO 형식 날짜를 일반 형식으로 변환
-                    from datetime import datetime
                     dt = datetime.fromisoformat(closed_at.replace('T', ' ').replace('Z', ''))
                     deadline = dt.strftime('%Y-%m-%d')
                 except:
@@ -386,36 +566,167 @@ class JumpitCrawler:
             
         except Exception as e:
             logger.error(f"❌ 채용공고 파싱 오류: {e}")
-            logger.debug(f"문제 데이터: {job_data}")
+            logger.debug("문제 데이터: %s", job_data)
             return JobPosting()
     
-    def crawl_search_type(self, search_name: str, params: Dict, max_pages: int = 10) -> List[JobPosting]:
-        """특정 검색 조건으로 채용공고 크롤링"""
+    def extract_positions(self, response_data, page: int = 1) -> tuple:
+        """API 응답에서 (공고 목록, 전체 개수) 추출"""
+        jobs_list = []
+        total_count = 0
+        current_page = page
+        
+        # 점핏 API 응답 구조: {result: {totalCount, page, positions: [...]}}
+        if "result" in response_data:
+            result_data = response_data["result"]
+            
+            # 총 개수 확인
+            total_count = result_data.get("totalCount", 0)
+            current_page = result_data.get("page", page)
+            
+            # positions 배열에서 채용공고 목록 가져오기
+            if "positions" in result_data:
+                jobs_list = result_data["positions"]
+            
+            logger.info("📊 API 응답: 총 %s개 중 페이지 %s", total_count, current_page, extra=SAMPLED)
+            
+        # 백업: 다른 응답 구조도 처리
+        elif "positions" in response_data:
+            jobs_list = response_data["positions"]
+            total_count = response_data.get("totalCount", len(jobs_list))
+        elif "data" in response_data:
+            if isinstance(response_data["data"], list):
+                jobs_list = response_data["data"]
+            elif "positions" in response_data["data"]:
+                jobs_list = response_data["data"]["positions"]
+        elif isinstance(response_data, list):
+            jobs_list = response_data
+        
+        return jobs_list, total_count
+    
+    def parse_positions(self, jobs_list: List[Dict], search_name: str) -> List[JobPosting]:
+        """공고 목록 일괄 파싱 (숨김 공고/파싱 실패 제외)"""
+        page_jobs = []
+        for job_data in jobs_list:
+            try:
+                # 숨겨진 공고는 제외
+                if job_data.get("hiddenPosition", False):
+                    continue
+                    
+                with self.metrics.timed("parse"):
+                    job_posting = self.parse_job_posting(job_data, search_name)
+                if job_posting.position_id:  # 유효한 데이터인 경우
+                    page_jobs.append(job_posting)
+                    self.metrics.inc("parsed_postings_total")
+                else:
+                    self.metrics.inc("parse_errors_total")
+                    
+            except Exception as e:
+                self.metrics.inc("parse_errors_total")
+                logger.warning(f"⚠️ 공고 파싱 오류: {e}")
+                continue
+        return page_jobs
+    
+    def get_page_limit(self, endpoint: str) -> Optional[int]:
+        """엔드포인트별로 확인된 최대 limit (메모리 → DB 캐시 순)"""
+        if endpoint in self.page_limits:
+            return self.page_limits[endpoint]
+        try:
+            conn = sqlite3.connect(self.db_name)
+            cursor = conn.cursor()
+            cursor.execute("SELECT max_limit FROM api_page_limits WHERE endpoint = ?", (endpoint,))
+            row = cursor.fetchone()
+            conn.close()
+        except sqlite3.Error:
+            row = None
+        if row:
+            self.page_limits[endpoint] = row[0]
+            return row[0]
+        return None
+    
+    def set_page_limit(self, endpoint: str, limit: int):
+        """확인된 최대 limit 캐시 (다음 실행/다른 워커에서도 재사용)"""
+        self.page_limits[endpoint] = limit
+        try:
+            conn = sqlite3.connect(self.db_name)
+            conn.execute(
+                "INSERT OR REPLACE INTO api_page_limits (endpoint, max_limit, probed_at) VALUES (?, ?, ?)",
+                (endpoint, limit, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ 페이지 크기 캐시 저장 실패: {e}")
+        logger.info(f"📐 '{endpoint}' 최대 페이지 크기: {limit}")
+    
+    def crawl_search_type(self, search_name: str, params: Dict, max_pages: int = 10,
+                          page_callback: Optional[Callable[[List[JobPosting]], None]] = None,
+                          collect: bool = True) -> List[JobPosting]:
+        """
+        특정 검색 조건으로 채용공고 크롤링 (page_callback 지정 시 페이지마다 파싱 결과 전달)
+        collect=False 면 결과를 모아 두지 않고 page_callback 으로만 넘김 (스트리밍 파이프라인)
+        
+        max_pages 는 기본 페이지 크기(20) 기준의 수집 예산이다. API 가 더 큰 limit 을 허용하면
+        같은 공고 수를 더 적은 요청으로 가져오고, 첫 응답의 totalCount 로 필요한 페이지 수를 미리 정한다.
+        """
         logger.info(f"🎯 '{search_name}' 검색 시작...")
         logger.info(f"📋 검색 파라미터: {params}")
         
         search_jobs = []
+        parsed_count = 0
         page = 1
         total_found = 0
         failed_requests = 0
         
+        # 수집 예산 (공고 수) - 페이지 크기와 무관하게 유지
+        max_items = max_pages * DEFAULT_PAGE_LIMIT
+        endpoint = self.base_api_url
+        
+        # 페이지 크기: 캐시된 값이 없으면 예산과 무관하게 가장 큰 후보부터 시도 (첫 응답으로 판별)
+        cached_limit = self.get_page_limit(endpoint)
+        if cached_limit:
+            # 예산보다 큰 페이지는 요청하지 않음 (검색 내 limit 고정)
+            limit_candidates = [plan_page_limit(max_pages, cached_limit)[0]]
+        else:
+            limit_candidates = list(PAGE_LIMIT_CANDIDATES)
+        probing = cached_limit is None
+        
         # 기본 파라미터 설정
         base_params = {
             "highlight": "false",
             "page": page,
-            "limit": 20  # 한 번에 가져올 공고 수
+            "limit": limit_candidates[0]  # 한 번에 가져올 공고 수
         }
         base_params.update(params)
+        planned_pages = -(-max_items // base_params["limit"])
         
-        while page <= max_pages:
-            logger.info(f"📄 페이지 {page}/{max_pages} 처리 중...")
+        while page <= planned_pages:
+            logger.info("📄 페이지 %d/%d 처리 중... (limit %d)", page, planned_pages, base_params["limit"], extra=SAMPLED)
             
             base_params["page"] = page
             
-            # API 요청
-            response_data = self.make_safe_request(self.base_api_url, base_params)
+            # API 요청 (큰 limit 은 스트리밍 디코딩 - 본문 전체를 버퍼링하지 않음)
+            streaming = self.stream_responses and base_params["limit"] >= STREAM_MIN_LIMIT
+            response_data = self.make_safe_request(self.base_api_url, base_params, stream=streaming)
+            
+            page_jobs = None
+            if isinstance(response_data, PositionsStream):
+                # 공고가 도착하는 대로 파싱 (첫 공고를 본문 수신 완료 전에 처리)
+                page_jobs = self.parse_positions(response_data, search_name)
+                if response_data.error is not None:
+                    # 중간에 끊긴 스트림 → 남은 공고를 잃지 않도록 같은 페이지를 일반 요청으로 다시 받음
+                    self.metrics.inc("request_errors_total", kind="stream")
+                    logger.warning(f"⚠️ 페이지 {page} 스트리밍 중단 - 일반 요청으로 재요청")
+                    page_jobs = None
+                    response_data = self.make_safe_request(self.base_api_url, base_params)
             
             if not response_data:
+                # 큰 limit 탐색 중 실패 → 더 작은 limit 으로 첫 페이지 재시도
+                if probing and len(limit_candidates) > 1:
+                    limit_candidates.pop(0)
+                    base_params["limit"] = limit_candidates[0]
+                    planned_pages = -(-max_items // base_params["limit"])
+                    logger.info(f"📐 limit 축소 후 재시도: {base_params['limit']}")
+                    continue
                 failed_requests += 1
                 logger.warning(f"⚠️ 페이지 {page} 요청 실패")
                 if failed_requests >= 3:  # 연속 3번 실패 시 중단
@@ -424,93 +735,74 @@ class JumpitCrawler:
                 page += 1
                 continue
             
-            # 응답 데이터 구조 확인 - 점핏 실제 API 구조
-            jobs_list = []
-            total_count = 0
-            current_page = page
+            if page_jobs is not None:
+                jobs_count, total_count = response_data.count, response_data.total_count
+                logger.info("📊 API 응답: 총 %s개 중 페이지 %s (스트리밍)", total_count, page, extra=SAMPLED)
+            else:
+                # 응답 데이터 구조 확인 - 점핏 실제 API 구조
+                jobs_list, total_count = self.extract_positions(response_data, page)
+                jobs_count = len(jobs_list)
+            
+            if probing:
+                # 요청보다 적게 왔는데 전체가 더 많다면 서버 상한 = 받은 개수
+                requested = base_params["limit"]
+                if jobs_count == requested:
+                    # 가장 큰 후보가 그대로 통과했을 때만 상한으로 기록 (작은 후보는 상한을 알려주지 않음)
+                    if requested == PAGE_LIMIT_CANDIDATES[0]:
+                        self.set_page_limit(endpoint, requested)
+                    probing = False
+                elif jobs_count and total_count > jobs_count:
+                    self.set_page_limit(endpoint, jobs_count)
+                    base_params["limit"] = jobs_count
+                    probing = False
+                # 결과가 요청보다 적고 전체도 적으면 판별 불가 → 다음 검색에서 다시 확인
+            
+            # 탐색용 큰 페이지가 예산을 넘으면 남은 예산만큼만 사용
+            remaining = max_items - total_found
+            if jobs_count > remaining:
+                jobs_count = remaining
+                if page_jobs is None:
+                    jobs_list = jobs_list[:remaining]
+                else:
+                    page_jobs = page_jobs[:remaining]
             
-            # 점핏 API 응답 구조: {result: {totalCount, page, positions: [...]}}
-            if "result" in response_data:
-                result_data = response_data["result"]
-                
-                # 총 개수 확인
-                total_count = result_data.get("totalCount", 0)
-                current_page = result_data.get("page", page)
-                
-                # positions 배열에서 채용공고 목록 가져오기
-                if "positions" in result_data:
-                    jobs_list = result_data["positions"]
-                
-                logger.info(f"📊 API 응답: 총 {total_count}개 중 페이지 {current_page}")
-                
-            # 백업: 다른 응답 구조도 처리
-            elif "positions" in response_data:
-                jobs_list = response_data["positions"]
-                total_count = response_data.get("totalCount", len(jobs_list))
-            elif "data" in response_data:
-                if isinstance(response_data["data"], list):
-                    jobs_list = response_data["data"]
-                elif "positions" in response_data["data"]:
-                    jobs_list = response_data["data"]["positions"]
-            elif isinstance(response_data, list):
-                jobs_list = response_data
-            
-            if not jobs_list:
+            if not jobs_count:
                 logger.info(f"📭 페이지 {page}에서 더 이상 공고를 찾을 수 없음")
                 break
             
-            logger.info(f"📊 페이지 {page}에서 {len(jobs_list)}개 공고 발견 (전체 {total_count}개)")
-            total_found += len(jobs_list)
+            logger.info("📊 페이지 %d에서 %d개 공고 발견 (전체 %s개)", page, jobs_count, total_count, extra=SAMPLED)
+            total_found += jobs_count
             
             # 각 채용공고 파싱
-            page_jobs = []
-            for job_data in jobs_list:
-                try:
-                    # 숨겨진 공고는 제외
-                    if job_data.get("hiddenPosition", False):
-                        continue
-                        
-                    job_posting = self.parse_job_posting(job_data, search_name)
-                    if job_posting.position_id:  # 유효한 데이터인 경우
-                        page_jobs.append(job_posting)
-                        
-                except Exception as e:
-                    logger.warning(f"⚠️ 공고 파싱 오류: {e}")
-                    continue
-            
-            search_jobs.extend(page_jobs)
-            logger.info(f"✅ 페이지 {page}: {len(page_jobs)}개 파싱 완료")
-            
-            # 페이지네이션 확인 - 점핏 스타일
-            has_more = False
-            
-            # 1. totalCount 기반 판단
+            if page_jobs is None:
+                page_jobs = self.parse_positions(jobs_list, search_name)
+            
+            parsed_count += len(page_jobs)
+            if collect:
+                search_jobs.extend(page_jobs)
+            if page_callback and page_jobs:
+                page_callback(page_jobs)
+            logger.info("✅ 페이지 %d: %d개 파싱 완료", page, len(page_jobs), extra=SAMPLED)
+            
+            # 페이지네이션 계획 - 첫 응답의 totalCount 로 전체 요청 수를 미리 결정
+            items_per_page = base_params["limit"]
             if total_count > 0:
-                items_per_page = base_params.get("limit", 20)
-                max_possible_pages = (total_count + items_per_page - 1) // items_per_page
-                has_more = page < max_possible_pages and page < max_pages
-                
-            # 2. 현재 페이지 결과 기반 판단
-            elif len(jobs_list) == base_params.get("limit", 20):
-                has_more = page < max_pages
-                
-            # 3. 빈 결과 확인
-            elif len(jobs_list) == 0:
-                has_more = False
+                planned_pages = -(-min(total_count, max_items) // items_per_page)
+            elif jobs_count < items_per_page:
+                planned_pages = page
             
-            if not has_more:
-                logger.info(f"✅ 페이지네이션 완료 (총 페이지: {page})")
+            if page >= planned_pages or total_found >= max_items:
+                logger.info(f"✅ 페이지네이션 완료 (총 페이지: {page}, limit {items_per_page})")
                 break
             
             page += 1
             
             # 페이지 간 적절한 휴식
-            if page <= max_pages:
-                rest_time = random.uniform(3, 8)
-                logger.info(f"💤 다음 페이지 로딩 전 {rest_time:.1f}초 휴식...")
-                time.sleep(rest_time)
+            rest_time = random.uniform(3, 8)
+            logger.info("💤 다음 페이지 로딩 전 %.1f초 휴식...", rest_time, extra=SAMPLED)
+            self.metrics.sleep(rest_time, "page_rest")
         
-        logger.info(f"✅ '{search_name}' 검색 완료: {len(search_jobs)}개 수집 (총 {total_found}개 발견)")
+        logger.info(f"✅ '{search_name}' 검색 완료: {parsed_count}개 수집 (총 {total_found}개 발견)")
         return search_jobs
     
     def save_to_database(self, jobs: List[JobPosting]) -> int:
@@ -520,17 +812,44 @@ class JumpitCrawler:
         
         try:
             conn = sqlite3.connect(self.db_name)
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
             saved_count = 0
             updated_count = 0
+            history_rows = []
+            membership_rows = []
+            stats_delta = Counter()
+            existing_columns = ", ".join(TRACKED_FIELDS + STATS_COLUMNS)
             
             for job in jobs:
-                # 기존 데이터 확인
-                cursor.execute("SELECT id FROM job_postings WHERE position_id = ?", (job.position_id,))
+                # 기존 데이터 확인 (이력 비교용 추적 필드 + 통계 차감용 컬럼 포함)
+                cursor.execute(
+                    f"SELECT id, {existing_columns} FROM job_postings WHERE position_id = ?",
+                    (job.position_id,)
+                )
                 existing = cursor.fetchone()
                 
                 job_dict = asdict(job)
+                observed_at = job.crawled_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                # 신규 공고는 기준값 전체, 기존 공고는 값이 바뀐 필드만 이력에 추가
+                for field in TRACKED_FIELDS:
+                    new_value = job_dict[field]
+                    if existing is None or existing[field] != new_value:
+                        history_rows.append((job.position_id, field, observed_at, new_value))
+                
+                # 검색 멤버십 (전체 스캔 결과는 로컬 필터로 각 검색에 배정)
+                if job.api_url == BROAD_SCAN_NAME:
+                    membership_rows.extend((name, position_id, observed_at)
+                                           for name, position_id in local_memberships(self.search_params, [job_dict]))
+                if job.api_url:
+                    membership_rows.append((job.api_url, job.position_id, observed_at))
+                
+                # 통계 증분: 이전 값의 기여분을 빼고 새 값의 기여분을 더함
+                if existing:
+                    stats_delta.subtract(stat_keys(existing))
+                stats_delta.update(stat_keys(job_dict))
                 
                 if existing:
                     # 업데이트
@@ -550,16 +869,68 @@ class JumpitCrawler:
                     )
                     saved_count += 1
             
+            if history_rows:
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO posting_history (position_id, field, observed_at, value) VALUES (?, ?, ?, ?)",
+                    history_rows
+                )
+            
+            if membership_rows:
+                cursor.executemany('''
+                    INSERT INTO search_memberships (search_type, position_id, last_seen_at) VALUES (?, ?, ?)
+                    ON CONFLICT(search_type, position_id) DO UPDATE SET last_seen_at = excluded.last_seen_at
+                ''', membership_rows)
+            
+            # 통계 요약 테이블 갱신 (같은 트랜잭션)
+            stats_rows = [(dimension, key, delta) for (dimension, key), delta in stats_delta.items() if delta]
+            if stats_rows:
+                cursor.executemany('''
+                    INSERT INTO stats_counters (dimension, key, count) VALUES (?, ?, ?)
+                    ON CONFLICT(dimension, key) DO UPDATE SET count = count + excluded.count
+                ''', stats_rows)
+                # 0 이 된 항목만 정리 (전체 스캔 없이 PK 조회)
+                cursor.executemany(
+                    "DELETE FROM stats_counters WHERE dimension = ? AND key = ? AND count <= 0",
+                    [(dimension, key) for dimension, key, delta in stats_rows if delta < 0]
+                )
+            
             conn.commit()
             conn.close()
             
-            logger.info(f"💾 DB 저장 완료: 신규 {saved_count}개, 업데이트 {updated_count}개")
+            logger.info(f"💾 DB 저장 완료: 신규 {saved_count}개, 업데이트 {updated_count}개, 변경 이력 {len(history_rows)}건")
             return saved_count + updated_count
             
         except Exception as e:
             logger.error(f"❌ DB 저장 실패: {e}")
             return 0
     
+    def get_posting_history(self, position_id: str) -> List[Dict]:
+        """공고별 추적 필드 시계열 (변경 시점마다 전체 값을 채워서 반환)"""
+        try:
+            conn = sqlite3.connect(self.db_name)
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT observed_at, field, value
+                FROM posting_history
+                WHERE position_id = ?
+                ORDER BY observed_at
+            ''', (position_id,))
+            rows = cursor.fetchall()
+            conn.close()
+        except Exception as e:
+            logger.error(f"❌ 이력 조회 실패: {e}")
+            return []
+        
+        timeline = []
+        current = {field: None for field in TRACKED_FIELDS}
+        for observed_at, field, value in rows:
+            current[field] = value
+            if timeline and timeline[-1]['observed_at'] == observed_at:
+                timeline[-1][field] = value
+            else:
+                timeline.append({'observed_at': observed_at, **current})
+        return timeline
+    
     def save_crawling_log(self, search_type: str, total_found: int, successfully_crawled: int, 
                          failed_requests: int, start_time: str, end_time: str, duration: float):
         """크롤링 로그 저장"""
@@ -618,92 +989,49 @@ class JumpitCrawler:
             return ""
     
     def get_database_stats(self) -> Dict:
-        """데이터베이스 통계 조회"""
+        """데이터베이스 통계 조회 (stats_counters 요약 테이블에서 읽기)"""
         try:
             conn = sqlite3.connect(self.db_name)
             cursor = conn.cursor()
             
+            def top(dimension: str, limit: Optional[int] = 10) -> List[tuple]:
+                cursor.execute("""
+                    SELECT key, count
+                    FROM stats_counters 
+                    WHERE dimension = ?
+                    ORDER BY count DESC 
+                    LIMIT ?
+                """, (dimension, limit if limit is not None else -1))
+                return cursor.fetchall()
+            
+            def single(dimension: str) -> int:
+                cursor.execute("SELECT count FROM stats_counters WHERE dimension = ? AND key = ''", (dimension,))
+                row = cursor.fetchone()
+                return row[0] if row else 0
+            
             # 전체 공고 수
-            cursor.execute("SELECT COUNT(*) FROM job_postings")
-            total_jobs = cursor.fetchone()[0]
+            total_jobs = single('total')
             
             # 회사별 공고 수 (상위 10개)
-            cursor.execute("""
-                SELECT company_name, COUNT(*) as job_count 
-                FROM job_postings 
-                WHERE company_name != ''
-                GROUP BY company_name 
-                ORDER BY job_count DESC 
-                LIMIT 10
-            """)
-            top_companies = cursor.fetchall()
+            top_companies = top('company')
             
             # 🔥 주요 기술 스택별 통계 (점핏 스타일)
-            tech_stats = {}
-            major_techs = [
-                'Java', 'Python', 'JavaScript', 'React', 'Vue.js', 'Node.js',
-                'Spring Boot', 'Django', 'PHP', 'C++', 'C#', 'AWS',
-                'MySQL', 'Oracle', 'Docker', 'Kubernetes'
-            ]
-            
-            for tech in major_techs:
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM job_postings 
-                    WHERE tech_stacks LIKE ?
-                """, (f'%{tech}%',))
-                count = cursor.fetchone()[0]
-                if count > 0:
-                    tech_stats[tech] = count
+            tech_stats = dict(top('tech', None))
             
             # 직무 카테고리별 통계
-            cursor.execute("""
-                SELECT api_url, COUNT(*) as job_count 
-                FROM job_postings 
-                WHERE api_url != ''
-                GROUP BY api_url 
-                ORDER BY job_count DESC 
-                LIMIT 10
-            """)
-            job_category_stats = cursor.fetchall()
+            job_category_stats = top('category')
             
             # 지역별 통계
-            cursor.execute("""
-                SELECT location, COUNT(*) as job_count 
-                FROM job_postings 
-                WHERE location != ''
-                GROUP BY location 
-                ORDER BY job_count DESC 
-                LIMIT 10
-            """)
-            top_locations = cursor.fetchall()
+            top_locations = top('location')
             
             # 연봉 관련 통계
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM job_postings 
-                WHERE salary != '' AND salary NOT LIKE '%협의%'
-            """)
-            salary_disclosed = cursor.fetchone()[0]
+            salary_disclosed = single('salary_disclosed')
             
             # 경력별 통계
-            cursor.execute("""
-                SELECT career_level, COUNT(*) as count
-                FROM job_postings 
-                WHERE career_level != ''
-                GROUP BY career_level 
-                ORDER BY count DESC
-            """)
-            career_stats = cursor.fetchall()
+            career_stats = top('career', None)
             
             # 재택근무 가능 공고
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM job_postings 
-                WHERE work_location_type LIKE '%재택%' OR work_location_type LIKE '%원격%'
-                   OR tags LIKE '%재택%' OR tags LIKE '%원격%'
-            """)
-            remote_jobs = cursor.fetchone()[0]
+            remote_jobs = single('remote')
             
             # 최근 크롤링 로그
             cursor.execute("""
@@ -732,37 +1060,106 @@ class JumpitCrawler:
             logger.error(f"❌ 통계 조회 실패: {e}")
             return {}
     
-    def run_full_crawling(self, max_pages_per_search: int = 5):
-        """전체 크롤링 실행"""
-        logger.info("🚀 점핏 전체 크롤링 시작!")
+    def log_metrics_report(self, prom_path: str = "jumpit_metrics.prom",
+                           report_path: str = "jumpit_metrics.json") -> Dict:
+        """계측 리포트 로그 출력 및 파일 저장 (Prometheus 텍스트 + JSON)"""
+        report = self.metrics.report()
+        logger.info(f"📈 계측 리포트: {report['bound_by']} 병목 "
+                    f"(네트워크 {report['share']['network']:.0%}, DB {report['share']['db']:.0%}, "
+                    f"대기 {report['share']['politeness']:.0%})")
+        logger.info(f"📈 요청 {report['requests']}회, 실패 {report['failed_requests']}회, "
+                    f"재시도 {report['retries']}회, 429 {report['rate_limited']}회, "
+                    f"수신 {report['bytes'] / 1024:.1f} KB")
+        report['transport'] = self.session.stats()
+        logger.info(f"🔗 연결: {report['transport']['connections_opened']}개 생성, "
+                    f"재사용률 {report['transport']['reuse_ratio']:.0%} ({report['transport']['backend']}, "
+                    f"{report['transport']['http_versions']})")
+        try:
+            self.metrics.write(prom_path, report_path)
+        except OSError as e:
+            logger.warning(f"⚠️ 계측 파일 저장 실패: {e}")
+        return report
+    
+    def run_full_crawling(self, max_pages_per_search: int = 5, workers: int = 1, use_plan: bool = False,
+                          use_schedule: bool = False, streaming: bool = False):
+        """
+        전체 크롤링 실행 (workers > 1 이면 다중 프로세스 샤딩 모드)
+        streaming=True 면 페이지를 받는 대로 저장 단계로 넘기는 파이프라인 (전체 결과를 모아 두지 않음)
+        use_plan=True 면 수집 이력의 검색 간 중복도로 검색 조건을 줄인 실행 계획만 크롤링
+        use_schedule=True 면 마감 임박/조회수 증가 공고가 많은 검색에 페이지 예산을 우선 배분
+        """
+        run_id = new_run_id()
+        logger.info(f"🚀 점핏 전체 크롤링 시작! (run_id={run_id})")
         logger.info(f"🎯 검색 유형: {len(self.search_params)}개")
         logger.info(f"📄 검색당 최대 페이지: {max_pages_per_search}")
         logger.info("=" * 60)
         
+        search_params = self.search_params
+        page_budgets = {}
+        plan = None
+        if use_plan:
+            plan = plan_for_crawler(self, max_pages_per_search)
+            search_params = {name: self.search_params[name] for name in plan.selected}
+            if plan.strategy == "broad_scan":
+                # 전체 스캔을 먼저 수행 (로컬 필터로 제외된 검색의 멤버십도 갱신됨)
+                search_params = {BROAD_SCAN_NAME: BROAD_SCAN_PARAMS, **search_params}
+                page_budgets[BROAD_SCAN_NAME] = -(-plan.broad_scan_size // DEFAULT_PAGE_LIMIT)
+        if use_schedule:
+            schedule = schedule_for_crawler(self, [name for name in search_params if name not in page_budgets],
+                                            max_pages_per_search)
+            search_params = {name: params for name, params in search_params.items()
+                             if name in page_budgets or name in schedule.budgets}
+            page_budgets.update(schedule.budgets)
+        requests_before = self.metrics.get("requests_total")
+        
+        if workers > 1:
+            result = run_sharded_crawling(self, max_pages_per_search, workers,
+                                          search_params=search_params, page_budgets=page_budgets)
+            if result['total_found']:
+                csv_filename = self.export_to_csv()
+                logger.info(f"📄 CSV 파일 생성: {csv_filename}")
+            if plan:
+                logger.info(f"🧭 계획 대비: 예상 요청 {plan.requests_before} → 실제 {result['metrics']['requests']}회 "
+                            f"(예상 커버리지 {plan.coverage:.1%})")
+            return result['total_found']
+        
+        if streaming:
+            result = run_jumpit_pipeline(self, search_params, max_pages_per_search, page_budgets)
+            logger.info(f"📊 총 수집 공고: {result['found']}개, 저장 {result['saved']}개")
+            self.log_metrics_report()
+            if result['found']:
+                csv_filename = self.export_to_csv()
+                logger.info(f"📄 CSV 파일 생성: {csv_filename}")
+            return result['found']
+        
         overall_start = datetime.now()
         all_jobs = []
-        total_searches = len(self.search_params)
+        total_searches = len(search_params)
         
-        for idx, (search_name, params) in enumerate(self.search_params.items(), 1):
+        for idx, (search_name, params) in enumerate(search_params.items(), 1):
             logger.info(f"🔍 [{idx}/{total_searches}] '{search_name}' 검색 시작...")
             
             search_start = datetime.now()
+            failed_before = self.metrics.get("failed_requests_total")
             
             try:
                 # 해당 검색 조건으로 크롤링
-                search_jobs = self.crawl_search_type(search_name, params, max_pages_per_search)
+                search_jobs = self.crawl_search_type(search_name, params,
+                                                     page_budgets.get(search_name, max_pages_per_search))
                 
                 if search_jobs:
                     # 데이터베이스에 저장
-                    saved_count = self.save_to_database(search_jobs)
+                    with self.metrics.timed("db"):
+                        saved_count = self.save_to_database(search_jobs)
                     all_jobs.extend(search_jobs)
                     
                     search_end = datetime.now()
                     duration = (search_end - search_start).total_seconds()
+                    failed_requests = int(self.metrics.get("failed_requests_total") - failed_before)
                     
                     # 크롤링 로그 저장
                     self.save_crawling_log(
-                        search_name, len(search_jobs), saved_count, 0,
+                        search_name, len(search_jobs), saved_count, failed_requests,
                         search_start.strftime('%Y-%m-%d %H:%M:%S'),
                         search_end.strftime('%Y-%m-%d %H:%M:%S'),
                         duration
@@ -779,7 +1176,7 @@ class JumpitCrawler:
             if idx < total_searches:
                 rest_time = random.uniform(10, 20)
                 logger.info(f"💤 다음 검색 전 {rest_time:.1f}초 휴식...")
-                time.sleep(rest_time)
+                self.metrics.sleep(rest_time, "search_rest")
                 logger.info("-" * 40)
         
         overall_end = datetime.now()
@@ -789,6 +1186,14 @@ class JumpitCrawler:
         logger.info("🎉 === 전체 크롤링 완료! ===")
         logger.info(f"⏱️ 총 소요시간: {total_duration:.1f}초 ({total_duration/60:.1f}분)")
         logger.info(f"📊 총 수집 공고: {len(all_jobs)}개")
+        if plan:
+            unique_jobs = len({job.position_id for job in all_jobs})
+            logger.info(f"🧭 계획 대비: 예상 요청 {plan.requests_before} → 실제 "
+                        f"{int(self.metrics.get('requests_total') - requests_before)}회, "
+                        f"고유 공고 {unique_jobs}개 (예상 커버리지 {plan.coverage:.1%})")
+        
+        # 계측 리포트 (네트워크/DB/대기 중 병목 확인)
+        self.log_metrics_report()
         
         # CSV 내보내기
         if all_jobs:
@@ -816,6 +1221,7 @@ class JumpitCrawler:
 
 def main():
     """메인 실행 함수"""
+    setup_logging(LOG_FILE)
     print("🚀 점핏(Jumpit) 채용공고 크롤러 v2.0")
     print("=" * 60)
     print("📋 주요 기능:")
@@ -853,15 +1259,21 @@ def main():
             # 전체 크롤링
             pages_input = input("검색당 최대 페이지 수 (기본값 5): ").strip()
             max_pages = int(pages_input) if pages_input.isdigit() else 5
+            workers_input = input("병렬 프로세스 수 (기본값 1): ").strip()
+            workers = int(workers_input) if workers_input.isdigit() else 1
+            plan_input = input("수집 이력 기반 실행 계획 사용? (y/N): ").strip().lower()
+            schedule_input = input("우선순위 스케줄 사용 (마감 임박/인기 공고 우선)? (y/N): ").strip().lower()
+            stream_input = input("스트리밍 저장 (페이지 단위로 바로 DB 저장)? (y/N): ").strip().lower() if workers <= 1 else 'n'
             
             print(f"\n🚀 전체 크롤링 시작 (페이지당 최대 {max_pages}개)...")
-            total_jobs = crawler.run_full_crawling(max_pages)
+            total_jobs = crawler.run_full_crawling(max_pages, workers, use_plan=plan_input == 'y',
+                                                   use_schedule=schedule_input == 'y', streaming=stream_input == 'y')
             
             if total_jobs > 0:
                 print(f"\n🎉 크롤링 성공! 총 {total_jobs}개 채용공고 수집")
                 print("📁 파일 위치:")
                 print(f"   - 데이터베이스: {crawler.db_name}")
-                print(f"   - 로그 파일: jumpit_crawler.log")
+                print(f"   - 로그 파일: jumpit_crawler.jsonl")
                 
                 # 자동으로 CSV도 생성
                 csv_file = crawler.export_to_csv()
@@ -892,12 +1304,14 @@ def main():
                 jobs = crawler.crawl_search_type(selected_search, selected_params, max_pages)
                 
                 if jobs:
-                    saved_count = crawler.save_to_database(jobs)
+                    with crawler.metrics.timed("db"):
+                        saved_count = crawler.save_to_database(jobs)
                     search_end = datetime.now()
                     duration = (search_end - search_start).total_seconds()
                     
                     crawler.save_crawling_log(
-                        selected_search, len(jobs), saved_count, 0,
+                        selected_search, len(jobs), saved_count,
+                        int(crawler.metrics.get("failed_requests_total")),
                         search_start.strftime('%Y-%m-%d %H:%M:%S'),
                         search_end.strftime('%Y-%m-%d %H:%M:%S'),
                         duration
@@ -987,6 +1401,7 @@ def main():
 
 def run_quick_test():
     """빠른 테스트 함수"""
+    setup_logging(LOG_FILE)
     print("🧪 점핏 API 연결 테스트...")
     
     crawler = JumpitCrawler()
@@ -0,0 +1,160 @@
+"""
+비동기 구조화 로깅 설정 (QueueHandler / QueueListener)
+
+- 로거 호출 스레드는 큐에 넣기만 하고, 파일/콘솔 쓰기는 리스너 스레드가 처리
+- 파일은 JSON Lines (크기 기반 로테이션), 콘솔은 기존 사람이 읽는 형식
+- 요청/페이지 단위 INFO 로그는 extra=SAMPLED 로 표시하면 N건 중 1건만 기록
+- 실행 단위 상관관계 ID(run_id)를 모든 레코드에 부여
+- 설정은 실행 진입점(main)에서만 호출 (모듈 import 시 호출하면 다른 모듈의 설정을 덮어씀)
+"""
+import atexit
+import json
+import queue
+import uuid
+import logging
+import itertools
+import threading
+import contextvars
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 샘플링 대상 표시: logger.info("...", extra=SAMPLED)
+SAMPLED = {'sampled': True}
+
+# 실행 상관관계 ID (스레드/작업 단위로 덮어쓸 수 있도록 ContextVar 사용)
+_run_id = contextvars.ContextVar('run_id', default='')
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드만 골라내기 위함)
+_RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener: Optional[QueueListener] = None
+
+
+def new_run_id() -> str:
+    """새 실행 ID 생성 및 현재 컨텍스트에 설정"""
+    run_id = uuid.uuid4().hex[:12]
+    _run_id.set(run_id)
+    return run_id
+
+
+def set_run_id(run_id: str):
+    _run_id.set(run_id)
+
+
+def get_run_id() -> str:
+    return _run_id.get()
+
+
+def context_thread(target, args: tuple = (), name: Optional[str] = None, daemon: bool = True) -> threading.Thread:
+    """현재 컨텍스트(run_id 등)를 복사해 그 안에서 target 을 실행하는 스레드 (시작은 호출자가)"""
+    context = contextvars.copy_context()
+    return threading.Thread(target=context.run, args=(target, *args), name=name, daemon=daemon)
+
+
+class RunContextFilter(logging.Filter):
+    """레코드에 run_id 부여 (로깅 호출 시점의 컨텍스트 기준)"""
+
+    def filter(self, record):
+        if not getattr(record, 'run_id', ''):
+            record.run_id = _run_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """SAMPLED 표시된 INFO 이하 레코드는 sample_every 건 중 1건만 통과"""
+
+    def __init__(self, sample_every: int = 10):
+        super().__init__()
+        self.sample_every = max(1, sample_every)
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        if not getattr(record, 'sampled', False) or record.levelno > logging.INFO:
+            return True
+        return next(self._counter) % self.sample_every == 0
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """한 줄 한 레코드 JSON 포맷"""
+
+    def format(self, record):
+        payload = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'run_id': getattr(record, 'run_id', ''),
+            'msg': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and key not in payload and key != 'sampled':
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _PreparedQueueHandler(QueueHandler):
+    """큐에 넣기 전 메시지만 확정하고 extra 필드는 보존"""
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_text = None
+        # exc_info 는 그대로 두고 리스너 스레드에서 포맷
+        return record
+
+
+def setup_logging(log_file: str, level: int = logging.INFO, sample_every: int = 10,
+                  max_bytes: int = 20 * 1024 * 1024, backup_count: int = 5,
+                  console: bool = True, run_id: Optional[str] = None) -> str:
+    """
+    루트 로거를 큐 기반으로 구성하고 run_id 반환.
+    여러 번 호출되면 기존 리스너를 정리하고 다시 구성한다.
+    """
+    global _listener
+
+    if run_id:
+        set_run_id(run_id)
+    elif not get_run_id():
+        new_run_id()
+
+    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                       encoding='utf-8', delay=True)
+    file_handler.setFormatter(JsonLinesFormatter())
+    handlers = [file_handler]
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(stream_handler)
+
+    if _listener is not None:
+        _listener.stop()
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _PreparedQueueHandler(log_queue)
+    # 샘플링/컨텍스트 필터는 큐에 넣기 전에 적용 (버려질 레코드는 포맷 비용 없음)
+    queue_handler.addFilter(SamplingFilter(sample_every))
+    queue_handler.addFilter(RunContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return get_run_id()
+
+
+def shutdown_logging():
+    """남은 레코드를 모두 쓰고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
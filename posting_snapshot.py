@@ -0,0 +1,391 @@
+"""
+채용공고 컬럼형 스냅샷 (Parquet / Arrow IPC, 수집일·소스별 파티션)
+
+행 단위 SQLite 나 utf-8-sig / cp949 CSV 를 분석할 때마다 다시 읽지 않도록, 소스별 원본 컬럼 그대로
+컬럼형 파일로 떠 둔다.
+
+    snapshots/source=jumpit/crawl_date=2025-01-31/part-db.arrow
+    snapshots/source=remember/crawl_date=2025-01-31/part-<파일 해시>.parquet
+
+- 파티션 : source (jumpit / remember / remember_sw / rallit) × crawl_date (crawled_at 의 날짜, 없으면 스냅샷 날짜)
+  remember 는 JD.py 실행 결과 CSV(한글 컬럼), remember_sw 는 분석용 remember_sw.csv(영문 컬럼) - 스키마가 달라 분리
+- DB 소스(점핏 job_postings, 랠릿 jobs)는 현재 상태 전체를 다시 써서 소스 파티션을 교체,
+  CSV 소스(리멤버 실행 결과)는 파일별 part 로 추가 (같은 파일을 다시 넣으면 덮어씀),
+  읽을 때 여러 실행에 걸친 같은 공고(공고ID)는 가장 최근 수집분만 남김
+- 값 종류가 적은 문자열 컬럼(지역/경력/회사명/직무 등)은 dictionary 인코딩 → 읽으면 pandas Categorical
+- 'arrow' (Arrow IPC, 비압축) 는 memory map 으로 필요한 컬럼만 복사 없이 읽음 (분석용 기본값)
+  'parquet' 는 압축되어 작고, 필요한 컬럼만 디코딩
+
+pyarrow 미설치 시 쓰기/읽기는 RuntimeError, load_postings 는 원본(SQLite/CSV)을 읽는다.
+
+사용법:
+    python posting_snapshot.py write [--jumpit jumpit_jobs.db] [--rallit job_dev_rallit_1.db]
+                                     [--remember 파일.csv ...] [--remember-sw remember_sw.csv]
+                                     [--format arrow|parquet] [--root snapshots]
+    python posting_snapshot.py stats [--root snapshots]
+"""
+import os
+import glob
+import sqlite3
+import hashlib
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = "snapshots"
+FORMAT_ARROW = 'arrow'
+FORMAT_PARQUET = 'parquet'
+EXTENSIONS = {FORMAT_ARROW: '.arrow', FORMAT_PARQUET: '.parquet'}
+
+SOURCE_JUMPIT = "jumpit"
+SOURCE_REMEMBER = "remember"
+SOURCE_REMEMBER_SW = "remember_sw"
+SOURCE_RALLIT = "rallit"
+
+# 실행마다 part 가 추가되는 소스의 공고 키 (같은 공고는 최신 수집분만 읽음)
+POSTING_KEYS = {SOURCE_REMEMBER: '공고ID'}
+
+# 수집 시각 컬럼 후보 (소스별 스키마가 달라서 있는 것을 사용)
+CRAWLED_AT_COLUMNS = ('crawled_at', 'crawledAt', 'updatedAt', 'createdAt')
+
+# 고유값 비율이 이 이하인 문자열 컬럼은 dictionary 인코딩
+DICTIONARY_MAX_RATIO = 0.5
+
+# CSV 인코딩 시도 순서 (크롤러는 utf-8-sig, 기존 분석 데이터는 cp949)
+CSV_ENCODINGS = ('utf-8-sig', 'cp949')
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("컬럼형 스냅샷에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+
+def _crawl_dates(df: pd.DataFrame, default: str) -> pd.Series:
+    """행별 수집일 (YYYY-MM-DD)"""
+    for column in CRAWLED_AT_COLUMNS:
+        if column in df.columns:
+            dates = df[column].astype(str).str.slice(0, 10)
+            return dates.where(dates.str.match(r'^\d{4}-\d{2}-\d{2}$'), default)
+    return pd.Series(default, index=df.index)
+
+
+def _dictionary_encode(df: pd.DataFrame) -> pd.DataFrame:
+    """값 종류가 적은 문자열 컬럼 → category (Arrow dictionary 로 저장됨)"""
+    rows = len(df)
+    if not rows:
+        return df
+    for column in df.columns:
+        series = df[column]
+        # pandas 3 부터는 문자열 컬럼이 object 가 아닌 str dtype
+        if not (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)):
+            continue
+        if series.nunique(dropna=True) <= rows * DICTIONARY_MAX_RATIO:
+            df[column] = series.astype('category')
+    return df
+
+
+def _to_table(df: pd.DataFrame):
+    # 문자열/숫자가 섞인 object 컬럼은 문자열로 통일 (Arrow 는 컬럼당 타입 하나)
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].map(lambda v: v if v is None or isinstance(v, str) else str(v))
+    return pa.Table.from_pandas(_dictionary_encode(df), preserve_index=False)
+
+
+def _write_file(table, path: str, fmt: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    if fmt == FORMAT_ARROW:
+        with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        pq.write_table(table, tmp_path, compression='zstd')
+    os.replace(tmp_path, path)  # 읽는 쪽이 쓰다 만 파일을 보지 않도록
+
+
+def _partition_dir(root: str, source: str, crawl_date: str) -> str:
+    return os.path.join(root, f"source={source}", f"crawl_date={crawl_date}")
+
+
+def write_snapshot(df: pd.DataFrame, source: str, root: str = DEFAULT_ROOT, fmt: str = FORMAT_ARROW,
+                   part: str = "db", replace_source: bool = False) -> int:
+    """
+    DataFrame 을 수집일별 파티션에 기록 → 기록한 행 수.
+    replace_source=True 면 해당 소스의 기존 파일(모든 날짜, 모든 형식)을 지우고 새로 씀 (DB 소스).
+    """
+    _require_pyarrow()
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"알 수 없는 스냅샷 형식: {fmt}")
+    if replace_source:
+        for path in glob.glob(os.path.join(root, f"source={source}", "crawl_date=*", "part-*")):
+            os.remove(path)
+
+    df = df.reset_index(drop=True)
+    dates = _crawl_dates(df, datetime.now().strftime('%Y-%m-%d'))
+    # 인코딩은 전체 기준으로 한 번만 → 같은 소스의 날짜 파티션끼리 스키마가 같음
+    full_table = _to_table(df)
+    written = 0
+    paths = set()
+    for crawl_date, index in df.groupby(dates).groups.items():
+        table = full_table.take(pa.array(index))
+        path = os.path.join(_partition_dir(root, source, crawl_date), f"part-{part}{EXTENSIONS[fmt]}")
+        _write_file(table, path, fmt)
+        paths.add(path)
+        written += table.num_rows
+    # 같은 part 의 이전 파일 제거 - 다른 형식이거나 수집일이 바뀌어 다른 날짜 파티션에 남은 파일도 중복 집계되지 않도록
+    for stale in glob.glob(os.path.join(root, f"source={source}", "crawl_date=*", f"part-{part}.*")):
+        if stale not in paths:
+            os.remove(stale)
+    logger.info(f"🧊 스냅샷 기록: {source} {written}개 ({fmt}, {root})")
+    return written
+
+
+def snapshot_sqlite(db_path: str, table: str, source: str, root: str = DEFAULT_ROOT,
+                    fmt: str = FORMAT_ARROW) -> int:
+    """SQLite 테이블 전체 → 소스 파티션 교체"""
+    conn = sqlite3.connect(db_path)
+    try:
+        df = pd.read_sql(f"SELECT * FROM {table}", conn)
+    finally:
+        conn.close()
+    return write_snapshot(df, source, root, fmt, part="db", replace_source=True)
+
+
+def read_csv_any(csv_path: str, encodings: Sequence[str] = CSV_ENCODINGS, **kwargs) -> pd.DataFrame:
+    """크롤러(utf-8-sig) / 기존 분석(cp949) CSV 모두 읽기"""
+    last_error = None
+    for encoding in encodings:
+        try:
+            return pd.read_csv(csv_path, encoding=encoding, **kwargs)
+        except UnicodeDecodeError as e:
+            last_error = e
+    raise last_error
+
+
+def snapshot_csv(csv_path: str, source: str = SOURCE_REMEMBER, root: str = DEFAULT_ROOT,
+                 fmt: str = FORMAT_ARROW) -> int:
+    """실행 결과 CSV → 파일별 part 로 추가 (같은 파일이면 수집일 파티션과 관계없이 덮어씀)"""
+    part = hashlib.sha256(os.path.abspath(csv_path).encode('utf-8')).hexdigest()[:12]
+    df = read_csv_any(csv_path, dtype=str, keep_default_na=False)
+    if not any(column in df.columns for column in CRAWLED_AT_COLUMNS):
+        # 리멤버 CSV 는 crawled_at 을 빼고 저장하므로 파일 수정 시각을 수집일로 사용
+        df['crawled_at'] = datetime.fromtimestamp(os.path.getmtime(csv_path)).strftime('%Y-%m-%d %H:%M:%S')
+    return write_snapshot(df, source, root, fmt, part=part)
+
+
+# ---------------------------------------------------------------------- 읽기
+
+def snapshot_files(root: str = DEFAULT_ROOT, source: Optional[str] = None,
+                   dates: Optional[Sequence[str]] = None, fmt: Optional[str] = None) -> List[str]:
+    pattern = os.path.join(root, f"source={source or '*'}", "crawl_date=*", "part-*")
+    extensions = (EXTENSIONS[fmt],) if fmt else tuple(EXTENSIONS.values())
+    files = sorted(path for path in glob.glob(pattern) if path.endswith(extensions))
+    if dates:
+        wanted = {f"crawl_date={d}" for d in dates}
+        files = [path for path in files if os.path.basename(os.path.dirname(path)) in wanted]
+    return files
+
+
+def partition_values(path: str) -> Dict[str, str]:
+    """파일 경로의 hive 파티션 값 ({'source': ..., 'crawl_date': ...})"""
+    partition = os.path.dirname(path)
+    pairs = (os.path.basename(os.path.dirname(partition)), os.path.basename(partition))
+    return dict(pair.split('=', 1) for pair in pairs)
+
+
+def _add_partition_columns(table, path: str):
+    # 파일 안에는 없는 파티션 값을 dictionary 컬럼으로 추가 (값 1개 + 인덱스, 문자열 복사 없음)
+    for name, value in partition_values(path).items():
+        if name not in table.column_names:
+            indices = pa.array(np.zeros(table.num_rows, dtype=np.int32))
+            table = table.append_column(name, pa.DictionaryArray.from_arrays(indices, pa.array([value])))
+    return table
+
+
+def _read_file(path: str, columns: Optional[Sequence[str]], partition_columns: bool = False):
+    if path.endswith(EXTENSIONS[FORMAT_ARROW]):
+        # memory map: 선택하지 않은 컬럼의 버퍼는 디스크에서 읽지도 않음 (복사 없음)
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    else:
+        # parquet: 필요한 컬럼 청크만 디코딩
+        if columns is not None:
+            available = pq.read_schema(path).names
+            columns_to_read = [c for c in columns if c in available]
+        else:
+            columns_to_read = None
+        table = pq.read_table(path, columns=columns_to_read, memory_map=True)
+    if partition_columns:
+        table = _add_partition_columns(table, path)
+    if columns is not None:
+        present = [c for c in columns if c in table.column_names]
+        table = table.select(present)
+        # 파일에 없는 컬럼은 null 로 채움 (파티션마다 스키마가 조금씩 다를 수 있음)
+        for column in columns:
+            if column not in present:
+                table = table.append_column(column, pa.nulls(table.num_rows, pa.string()))
+        table = table.select(list(columns))
+    return table
+
+
+def read_snapshot(root: str = DEFAULT_ROOT, source: Optional[str] = None,
+                  columns: Optional[Sequence[str]] = None, dates: Optional[Sequence[str]] = None,
+                  fmt: Optional[str] = None, partition_columns: bool = False):
+    """
+    스냅샷 → pyarrow.Table (파티션별 청크를 복사 없이 이어 붙임), 파일이 없으면 None.
+    fmt 로 형식을 한정하고, partition_columns=True 면 source / crawl_date 컬럼을 붙인다.
+    """
+    _require_pyarrow()
+    files = snapshot_files(root, source, dates, fmt)
+    if not files:
+        return None
+    tables = [_read_file(path, columns, partition_columns) for path in files]
+    if len(tables) == 1:
+        return tables[0]
+    return _concat(tables)
+
+
+def _concat(tables: List):
+    """파티션 테이블 이어 붙이기 (복사 없음). 파일마다 타입이 다른 컬럼은 dictionary 를 풀어서 맞춤"""
+    types: Dict[str, set] = {}
+    for table in tables:
+        for field in table.schema:
+            types.setdefault(field.name, set()).add(field.type)
+    mixed = {name for name, kinds in types.items() if len(kinds) > 1}
+    if mixed:
+        tables = [_decode_columns(table, mixed) for table in tables]
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except TypeError:  # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def _decode_columns(table, names: set):
+    for i, field in enumerate(table.schema):
+        if field.name in names and pa.types.is_dictionary(field.type):
+            decoded = table.column(i).cast(field.type.value_type)
+            table = table.set_column(i, field.name, decoded)
+    return table
+
+
+def read_snapshot_df(root: str = DEFAULT_ROOT, source: Optional[str] = None,
+                     columns: Optional[Sequence[str]] = None,
+                     dates: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+    """스냅샷 → DataFrame (dictionary 컬럼은 Categorical), 파일이 없으면 None"""
+    table = read_snapshot(root, source, columns, dates)
+    if table is None:
+        return None
+    return table.to_pandas(split_blocks=True)
+
+
+def snapshot_columns(root: str = DEFAULT_ROOT, source: Optional[str] = None) -> set:
+    """소스 스냅샷 파일들에 있는 컬럼 이름 (스키마만 읽음)"""
+    _require_pyarrow()
+    columns = set()
+    for path in snapshot_files(root, source):
+        if path.endswith(EXTENSIONS[FORMAT_ARROW]):
+            columns.update(pa.ipc.open_file(pa.memory_map(path, 'r')).schema.names)
+        else:
+            columns.update(pq.read_schema(path).names)
+    return columns
+
+
+def _latest_per_posting(df: pd.DataFrame, key: str, order_column: Optional[str]) -> pd.DataFrame:
+    """여러 실행 part 에 같은 공고가 있으면 가장 최근 수집분만 (키가 빈 행은 그대로)"""
+    has_key = df[key].notna() & (df[key].astype(str) != '')
+    keyed = df[has_key]
+    if order_column:
+        keyed = keyed.sort_values(order_column, kind='stable')
+    latest = keyed.drop_duplicates(key, keep='last')
+    return pd.concat([latest, df[~has_key]]).sort_index()
+
+
+def load_postings(source: str, columns: Sequence[str], fallback: Callable[[], pd.DataFrame],
+                  root: str = DEFAULT_ROOT) -> pd.DataFrame:
+    """
+    분석 스크립트용: 스냅샷에서 필요한 컬럼만 읽고, 스냅샷(또는 pyarrow)이 없거나
+    요청한 컬럼이 스냅샷에 없으면 (다른 스키마의 데이터) fallback() 으로 원본을 읽음.
+    Categorical 컬럼은 문자열 연산이 가능하도록 object 로 돌려서 반환 (원본과 같은 dtype).
+    """
+    if pa is not None:
+        df, key, order_column = None, None, None
+        try:
+            available = snapshot_columns(root, source)
+            missing = [column for column in columns if column not in available]
+            if available and missing:
+                logger.warning(f"⚠️ '{source}' 스냅샷에 없는 컬럼 {missing} - 원본 사용")
+            elif available:
+                key = POSTING_KEYS.get(source) if POSTING_KEYS.get(source) in available else None
+                order_column = next((c for c in CRAWLED_AT_COLUMNS if c in available), None)
+                extra = [c for c in (key, order_column) if key and c and c not in columns]
+                df = read_snapshot_df(root, source, list(columns) + extra)
+        except Exception as e:
+            logger.warning(f"⚠️ 스냅샷 읽기 실패 - 원본 사용: {e}")
+            df = None
+        if df is not None:
+            for column in df.columns:
+                if isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype(object)
+            if key:
+                df = _latest_per_posting(df, key, order_column)
+            return df[list(columns)].reset_index(drop=True)
+    return fallback()[list(columns)]
+
+
+def snapshot_stats(root: str = DEFAULT_ROOT) -> Dict:
+    stats: Dict[str, Dict] = {}
+    for path in snapshot_files(root):
+        partition = partition_values(path)
+        entry = stats.setdefault(partition['source'], {'files': 0, 'dates': set(), 'rows': 0, 'mb': 0.0})
+        entry['files'] += 1
+        entry['dates'].add(partition['crawl_date'])
+        entry['mb'] += os.path.getsize(path) / 1024 / 1024
+        if pa is not None:
+            if path.endswith(EXTENSIONS[FORMAT_ARROW]):
+                entry['rows'] += pa.ipc.open_file(pa.memory_map(path, 'r')).read_all().num_rows
+            else:
+                entry['rows'] += pq.ParquetFile(path).metadata.num_rows
+    return {source: {**entry, 'dates': len(entry['dates']), 'mb': round(entry['mb'], 2)}
+            for source, entry in stats.items()}
+
+
+def main():
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(description="채용공고 컬럼형 스냅샷")
+    parser.add_argument('command', choices=['write', 'stats'])
+    parser.add_argument('--root', default=DEFAULT_ROOT)
+    parser.add_argument('--format', default=FORMAT_ARROW, choices=list(EXTENSIONS))
+    parser.add_argument('--jumpit', default=None, help="점핏 DB (job_postings)")
+    parser.add_argument('--rallit', default=None, help="랠릿 DB (jobs)")
+    parser.add_argument('--remember', nargs='*', default=[], help="리멤버 결과 CSV")
+    parser.add_argument('--remember-sw', default=None, help="분석용 리멤버 CSV (remember_sw.csv)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.command == 'write':
+        if args.jumpit:
+            snapshot_sqlite(args.jumpit, 'job_postings', SOURCE_JUMPIT, args.root, args.format)
+        if args.rallit:
+            snapshot_sqlite(args.rallit, 'jobs', SOURCE_RALLIT, args.root, args.format)
+        for csv_path in args.remember:
+            snapshot_csv(csv_path, SOURCE_REMEMBER, args.root, args.format)
+        if args.remember_sw:
+            snapshot_csv(args.remember_sw, SOURCE_REMEMBER_SW, args.root, args.format)
+    print(json.dumps(snapshot_stats(args.root), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+검색 조건 실행 계획 최적화
+
+search_memberships (검색 조건 ↔ 공고 다대다) 수집 이력으로 검색 간 중복도를 추정하고,
+같은 공고 집합을 최소 요청으로 회수하는 검색 조건 부분집합(또는 전체 스캔 + 로컬 필터)을 고른다.
+- 비용: 검색별 예상 요청 수 = ceil(공고 수 / 페이지 크기)
+- 선택: 요청당 신규 공고 수가 가장 큰 검색부터 고르는 그리디 가중 집합 덮개
+"""
+import math
+import sqlite3
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 필터 없는 전체 스캔 검색 이름 (crawling_logs / search_memberships 기록용)
+BROAD_SCAN_NAME = "전체스캔"
+BROAD_SCAN_PARAMS = {"sort": "reg_dt"}
+
+# 전체 스캔 결과에서 로컬로 재현 가능한 API 필터 (파라미터 → JobPosting 필드 판정)
+# workFromHome / minSalary / minCareer 는 목록 응답에 판정 근거가 없어 API 검색을 유지한다.
+LOCAL_FILTERS = {
+    'jobCategory': lambda job, value: value in (job.get('job_category') or ''),
+    'techStack': lambda job, value: value in [t.strip() for t in (job.get('tech_stacks') or '').split(',')],
+    'location': lambda job, value: value in (job.get('location') or ''),
+    'newcomer': lambda job, value: ('신입환영' in (job.get('tags') or '')) == (value == 'true'),
+    'alwaysOpen': lambda job, value: ((job.get('deadline') or '') == '상시채용') == (value == 'true'),
+}
+# 결과 집합에 영향 없는 파라미터
+NON_FILTER_PARAMS = {'sort', 'highlight', 'page', 'limit'}
+
+
+@dataclass
+class QueryPlan:
+    """검색 실행 계획"""
+    selected: List[str] = field(default_factory=list)
+    dropped: Dict[str, str] = field(default_factory=dict)  # 제외 검색 → 주로 덮어주는 검색
+    strategy: str = "subset"  # subset | broad_scan | full
+    universe_size: int = 0
+    covered: int = 0
+    requests_before: int = 0
+    requests_after: int = 0
+    overlap: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    broad_scan_size: int = 0  # strategy == broad_scan 일 때 전체 스캔으로 받을 공고 수
+
+    @property
+    def coverage(self) -> float:
+        return self.covered / self.universe_size if self.universe_size else 1.0
+
+    @property
+    def requests_saved(self) -> int:
+        return self.requests_before - self.requests_after
+
+    def summary(self) -> str:
+        return (f"전략 {self.strategy}: 검색 {len(self.selected)}개 선택 / {len(self.dropped)}개 제외, "
+                f"커버리지 {self.coverage:.1%} ({self.covered}/{self.universe_size}), "
+                f"예상 요청 {self.requests_before} → {self.requests_after} (절감 {self.requests_saved})")
+
+
+def is_locally_filterable(params: Dict) -> bool:
+    filters = [key for key in params if key not in NON_FILTER_PARAMS]
+    return bool(filters) and all(key in LOCAL_FILTERS for key in filters)
+
+
+def local_match(params: Dict, job: Dict) -> bool:
+    """전체 스캔으로 받은 공고가 해당 검색 조건에 걸리는지 로컬 판정"""
+    return all(LOCAL_FILTERS[key](job, str(value))
+               for key, value in params.items() if key not in NON_FILTER_PARAMS)
+
+
+def local_memberships(search_params: Dict[str, Dict], jobs: List[Dict]) -> List[tuple]:
+    """전체 스캔 결과 → (검색명, 공고ID) 멤버십 (로컬 필터 가능한 검색만)"""
+    rows = []
+    filterable = {name: params for name, params in search_params.items() if is_locally_filterable(params)}
+    for job in jobs:
+        for name, params in filterable.items():
+            if local_match(params, job):
+                rows.append((name, job['position_id']))
+    return rows
+
+
+def load_memberships(db_name: str, since: Optional[str] = None) -> Dict[str, Set[str]]:
+    """search_memberships 테이블 → {검색명: 공고ID 집합}"""
+    conn = sqlite3.connect(db_name)
+    try:
+        if since:
+            rows = conn.execute(
+                "SELECT search_type, position_id FROM search_memberships WHERE last_seen_at >= ?", (since,)
+            )
+        else:
+            rows = conn.execute("SELECT search_type, position_id FROM search_memberships")
+        memberships: Dict[str, Set[str]] = {}
+        for search_type, position_id in rows:
+            memberships.setdefault(search_type, set()).add(position_id)
+        return memberships
+    finally:
+        conn.close()
+
+
+def overlap_matrix(memberships: Dict[str, Set[str]]) -> Dict[str, Dict[str, float]]:
+    """포함도: overlap[a][b] = |A∩B| / |A| (a 의 공고 중 b 에서도 나오는 비율)"""
+    # 공고 → 검색 역색인으로 교집합 크기를 계산 (검색 쌍 전수 집합 연산 회피)
+    by_position: Dict[str, List[str]] = {}
+    for search, positions in memberships.items():
+        for position_id in positions:
+            by_position.setdefault(position_id, []).append(search)
+
+    intersections: Dict[str, Dict[str, int]] = {s: {} for s in memberships}
+    for searches in by_position.values():
+        for a in searches:
+            row = intersections[a]
+            for b in searches:
+                if a != b:
+                    row[b] = row.get(b, 0) + 1
+
+    return {a: {b: round(n / len(memberships[a]), 3) for b, n in row.items()}
+            for a, row in intersections.items() if memberships[a]}
+
+
+def estimate_requests(size: int, page_limit: int, max_items: Optional[int] = None) -> int:
+    if max_items is not None:
+        size = min(size, max_items)
+    return max(1, math.ceil(size / page_limit))
+
+
+def plan_searches(search_params: Dict[str, Dict], memberships: Dict[str, Set[str]],
+                  page_limit: int = 20, max_items: Optional[int] = None,
+                  coverage_target: float = 1.0, broad_scan_size: Optional[int] = None,
+                  always_include: Optional[List[str]] = None) -> QueryPlan:
+    """
+    검색 조건 부분집합 선택.
+    - memberships 에 없는 검색(이력 없음)은 정보가 없으므로 항상 포함
+    - broad_scan_size: 필터 없는 전체 스캔의 공고 수를 알면
+      "전체 스캔 + 로컬 필터 + 로컬 필터 불가 검색" 비용과 비교
+    """
+    known = {s: memberships[s] for s in search_params if memberships.get(s)}
+    unknown = [s for s in search_params if s not in known]
+    always = [s for s in (always_include or []) if s in known]
+
+    universe: Set[str] = set().union(*known.values()) if known else set()
+    cost = {s: estimate_requests(len(p), page_limit, max_items) for s, p in known.items()}
+    unknown_cost = len(unknown) * estimate_requests(max_items or page_limit, page_limit, max_items)
+
+    plan = QueryPlan(universe_size=len(universe), overlap=overlap_matrix(known))
+    plan.requests_before = sum(cost.values()) + unknown_cost
+
+    covered: Set[str] = set()
+    selected: List[str] = []
+    for search in always:
+        selected.append(search)
+        covered |= known[search]
+
+    target = math.ceil(coverage_target * len(universe))
+    remaining = {s for s in known if s not in selected}
+    while len(covered) < target and remaining:
+        best = max(remaining, key=lambda s: (len(known[s] - covered) / cost[s], -cost[s], s))
+        gain = known[best] - covered
+        if not gain:
+            break
+        selected.append(best)
+        covered |= gain
+        remaining.discard(best)
+
+    # 중복 제거: 다른 선택 검색들이 이미 다 덮는 검색은 비싼 것부터 뺀다 (그리디 순서 보정)
+    for search in sorted(selected, key=lambda s: -cost[s]):
+        if search in always:
+            continue
+        others = [known[s] for s in selected if s != search]
+        if known[search] & covered <= (set().union(*others) if others else set()):
+            selected.remove(search)
+            remaining.add(search)
+
+    for search in remaining:
+        # 가장 많이 덮어준 선택 검색 기록 (리포트용)
+        cover = max(selected, key=lambda s: plan.overlap.get(search, {}).get(s, 0.0), default="")
+        plan.dropped[search] = cover
+
+    plan.selected = [s for s in search_params if s in selected or s in unknown]
+    plan.covered = len(covered)
+    plan.requests_after = sum(cost[s] for s in selected) + unknown_cost
+    plan.strategy = "subset" if plan.dropped else "full"
+
+    if broad_scan_size:
+        # 로컬 필터 가능한 검색은 전체 스캔 한 번으로 대체, 나머지는 API 검색 유지
+        filterable = [s for s in known if is_locally_filterable(search_params[s])]
+        kept = [s for s in known if s not in filterable]
+        broad_cost = (estimate_requests(broad_scan_size, page_limit)
+                      + sum(cost[s] for s in kept) + unknown_cost)
+        if broad_cost < plan.requests_after:
+            plan.strategy = "broad_scan"
+            plan.requests_after = broad_cost
+            plan.broad_scan_size = broad_scan_size
+            # 전체 스캔이 모든 공고를 돌려준다는 가정 (스캔 크기 ≥ 필터 검색 공고 수)
+            plan.covered = len(universe)
+            plan.dropped = {s: BROAD_SCAN_NAME for s in filterable}
+            plan.selected = [s for s in search_params if s in kept or s in unknown]
+
+    return plan
+
+
+def probe_broad_scan_size(crawler) -> int:
+    """필터 없는 전체 스캔의 공고 수 (limit=1 요청 한 번으로 totalCount 확인)"""
+    params = {"highlight": "false", "page": 1, "limit": 1, **BROAD_SCAN_PARAMS}
+    response_data = crawler.make_safe_request(crawler.base_api_url, params)
+    if not response_data:
+        return 0
+    _, total_count = crawler.extract_positions(response_data)
+    return total_count
+
+
+def plan_for_crawler(crawler, max_pages_per_search: int = 5, coverage_target: float = 1.0,
+                     since: Optional[str] = None, probe_broad_scan: bool = True) -> QueryPlan:
+    """JumpitCrawler 의 search_params / DB 이력 / 페이지 크기 캐시로 계획 수립"""
+    from jumpfit import DEFAULT_PAGE_LIMIT
+
+    memberships = load_memberships(crawler.db_name, since)
+    page_limit = crawler.get_page_limit(crawler.base_api_url) or DEFAULT_PAGE_LIMIT
+    broad_scan_size = probe_broad_scan_size(crawler) if probe_broad_scan and memberships else None
+    plan = plan_searches(crawler.search_params, memberships, page_limit=page_limit,
+                         max_items=max_pages_per_search * DEFAULT_PAGE_LIMIT,
+                         coverage_target=coverage_target, broad_scan_size=broad_scan_size)
+    logger.info(f"🧭 실행 계획: {plan.summary()}")
+    for search, cover in sorted(plan.dropped.items()):
+        if cover == BROAD_SCAN_NAME:
+            logger.info(f"   - '{search}' 제외 (전체 스캔 결과에서 로컬 필터)")
+        else:
+            logger.info(f"   - '{search}' 제외 (포함도 {plan.overlap.get(search, {}).get(cover, 0.0):.0%} ← '{cover}')")
+    return plan
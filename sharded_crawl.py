@@ -0,0 +1,258 @@
+"""
+다중 프로세스 샤딩 크롤링
+
+search_params 를 N개 샤드로 나눠 워커 프로세스가 각자 크롤링/파싱하고,
+파싱된 행은 큐를 통해 단일 DB 작성 프로세스로 스트리밍한다.
+(SQLite 는 동시 쓰기에 약하므로 쓰기는 한 프로세스에서만 수행)
+코디네이터는 샤드별 crawling_logs 와 계측값을 합쳐 실행 요약을 남긴다.
+
+주의: 각 워커는 자체 politeness 지연을 지키지만, 워커 수만큼 API 요청 빈도가 늘어난다.
+"""
+import os
+import queue
+import logging
+import multiprocessing as mp
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from log_setup import setup_logging, get_run_id, new_run_id
+
+logger = logging.getLogger(__name__)
+
+# 큐 메시지 종류
+MSG_ROWS = 'rows'
+MSG_SEARCH_DONE = 'search_done'
+MSG_WORKER_DONE = 'worker_done'
+
+# 작성 프로세스가 밀릴 때 워커를 멈추게 하는 큐 상한 (배치 단위)
+ROW_QUEUE_MAXSIZE = 256
+
+# 큐가 가득 찼을 때 작성 프로세스 생존 여부를 다시 확인하는 간격 (초)
+PUT_TIMEOUT = 5.0
+# 코디네이터가 워커/작성 프로세스 상태를 확인하는 간격 (초)
+JOIN_POLL_SECONDS = 1.0
+# 모든 워커 종료 후 작성 프로세스 결과를 기다리는 최대 시간 (초)
+RESULT_TIMEOUT = 600
+
+# 계측 리포트에서 샤드 간 합산할 항목
+SUMMED_REPORT_KEYS = ('requests', 'failed_requests', 'retries', 'rate_limited', 'bytes',
+                      'parsed_postings', 'parse_errors')
+
+
+class WriterGone(RuntimeError):
+    """DB 작성 프로세스가 종료되어 더 이상 행을 보낼 수 없음"""
+
+
+def _put(row_queue, message, writer_gone):
+    """큐 전송 - 가득 찬 상태에서 작성 프로세스가 죽었으면 무한 대기 대신 WriterGone"""
+    while True:
+        try:
+            row_queue.put(message, timeout=PUT_TIMEOUT)
+            return
+        except queue.Full:
+            if writer_gone.is_set():
+                raise WriterGone("DB 작성 프로세스 종료")
+
+
+def shard_search_params(search_params: Dict[str, Dict], num_shards: int) -> List[Dict[str, Dict]]:
+    """검색 조건을 라운드로빈으로 분배 (카테고리/기술/지역 검색이 샤드마다 섞이도록)"""
+    num_shards = max(1, min(num_shards, len(search_params)))
+    shards = [{} for _ in range(num_shards)]
+    for idx, (name, params) in enumerate(search_params.items()):
+        shards[idx % num_shards][name] = params
+    return shards
+
+
+def _crawl_worker(shard_idx: int, shard: Dict[str, Dict], db_name: str, max_pages: int,
+                  row_queue, run_id: str, writer_gone, page_budgets: Optional[Dict[str, int]] = None):
+    """워커: 샤드의 검색 조건을 크롤링하고 페이지 단위로 행을 큐에 전송"""
+    from jumpfit import JumpitCrawler
+
+    setup_logging(f"jumpit_crawler.shard{shard_idx}.jsonl", run_id=run_id)
+    crawler = JumpitCrawler(db_name, init_db=False)
+
+    for search_name, params in shard.items():
+        if writer_gone.is_set():
+            logger.error(f"❌ [shard {shard_idx}] DB 작성 프로세스 종료 - 남은 검색 중단")
+            return
+        search_start = datetime.now()
+        failed_before = crawler.metrics.get("failed_requests_total")
+        found = 0
+
+        def send_page(page_jobs, search_name=search_name):
+            _put(row_queue, (MSG_ROWS, search_name, [asdict(job) for job in page_jobs]), writer_gone)
+
+        try:
+            pages = (page_budgets or {}).get(search_name, max_pages)
+            found = len(crawler.crawl_search_type(search_name, params, pages, page_callback=send_page))
+        except WriterGone:
+            logger.error(f"❌ [shard {shard_idx}] DB 작성 프로세스 종료 - 크롤링 중단")
+            return
+        except Exception as e:
+            logger.error(f"❌ [shard {shard_idx}] '{search_name}' 크롤링 중 오류: {e}")
+
+        search_end = datetime.now()
+        try:
+            _put(row_queue, (MSG_SEARCH_DONE, search_name, {
+                'shard': shard_idx,
+                'total_found': found,
+                'failed_requests': int(crawler.metrics.get("failed_requests_total") - failed_before),
+                'start_time': search_start.strftime('%Y-%m-%d %H:%M:%S'),
+                'end_time': search_end.strftime('%Y-%m-%d %H:%M:%S'),
+                'duration': (search_end - search_start).total_seconds(),
+            }), writer_gone)
+        except WriterGone:
+            logger.error(f"❌ [shard {shard_idx}] DB 작성 프로세스 종료 - 크롤링 중단")
+            return
+
+    try:
+        _put(row_queue, (MSG_WORKER_DONE, shard_idx, crawler.metrics.report()), writer_gone)
+    except WriterGone:
+        logger.error(f"❌ [shard {shard_idx}] DB 작성 프로세스 종료 - 완료 신호 전송 불가")
+
+
+def _db_writer(db_name: str, row_queue, result_queue, num_workers: int, run_id: str):
+    """작성 프로세스: 모든 워커의 행을 받아 save_to_database 로 저장"""
+    from jumpfit import JumpitCrawler, JobPosting
+
+    setup_logging("jumpit_crawler.writer.jsonl", run_id=run_id)
+    crawler = JumpitCrawler(db_name, init_db=False)
+
+    saved_by_search: Dict[str, int] = {}
+    worker_reports = {}
+    search_logs = []
+
+    while len(worker_reports) < num_workers:
+        kind, key, payload = row_queue.get()
+        if kind == MSG_ROWS:
+            jobs = [JobPosting(**row) for row in payload]
+            with crawler.metrics.timed("db"):
+                saved_by_search[key] = saved_by_search.get(key, 0) + crawler.save_to_database(jobs)
+        elif kind == MSG_SEARCH_DONE:
+            # 같은 워커의 메시지는 FIFO 이므로 이 시점에 해당 검색의 행은 모두 저장됨
+            saved = saved_by_search.get(key, 0)
+            crawler.save_crawling_log(key, payload['total_found'], saved, payload['failed_requests'],
+                                      payload['start_time'], payload['end_time'], payload['duration'])
+            search_logs.append({'search_type': key, 'saved': saved, **payload})
+        elif kind == MSG_WORKER_DONE:
+            worker_reports[key] = payload
+
+    result_queue.put({
+        'search_logs': search_logs,
+        'worker_reports': worker_reports,
+        'db_seconds': crawler.metrics.stage_seconds.get('db', 0.0),
+    })
+
+
+def merge_reports(worker_reports: Dict[int, Dict]) -> Dict:
+    """샤드별 계측 리포트 합산"""
+    merged = {key: sum(r.get(key, 0) for r in worker_reports.values()) for key in SUMMED_REPORT_KEYS}
+    merged['seconds'] = {}
+    for report in worker_reports.values():
+        for stage, seconds in report.get('seconds', {}).items():
+            merged['seconds'][stage] = round(merged['seconds'].get(stage, 0.0) + seconds, 2)
+    return merged
+
+
+def run_sharded_crawling(crawler, max_pages_per_search: int = 5, num_workers: int = None,
+                         search_params: Optional[Dict[str, Dict]] = None,
+                         page_budgets: Optional[Dict[str, int]] = None) -> Dict:
+    """
+    코디네이터: 워커 N개 + DB 작성 프로세스 1개를 띄우고 결과를 합친다.
+    crawler 는 DB 초기화가 끝난 JumpitCrawler (설정/스키마 제공용).
+    search_params 미지정 시 crawler.search_params 전체, page_budgets 는 검색별 페이지 예산 재정의.
+    """
+    num_workers = num_workers or os.cpu_count() or 1
+    search_params = search_params if search_params is not None else crawler.search_params
+    shards = shard_search_params(search_params, num_workers)
+    num_workers = len(shards)
+    run_id = get_run_id() or new_run_id()
+
+    # spawn: macOS/Windows 와 동일한 동작, 부모의 로깅 스레드/DB 연결을 물려받지 않음
+    ctx = mp.get_context('spawn')
+    row_queue = ctx.Queue(maxsize=ROW_QUEUE_MAXSIZE)
+    result_queue = ctx.Queue()
+    # 작성 프로세스가 먼저 죽으면 코디네이터가 설정 → 워커는 큐 대기를 멈추고 종료
+    writer_gone = ctx.Event()
+
+    logger.info(f"🧩 샤딩 크롤링 시작: 워커 {num_workers}개, 검색 {len(search_params)}개")
+    overall_start = datetime.now()
+
+    writer = ctx.Process(target=_db_writer, name="jumpit-db-writer",
+                         args=(crawler.db_name, row_queue, result_queue, num_workers, run_id))
+    writer.start()
+    workers = []
+    for shard_idx, shard in enumerate(shards):
+        worker = ctx.Process(target=_crawl_worker, name=f"jumpit-shard-{shard_idx}",
+                             args=(shard_idx, shard, crawler.db_name, max_pages_per_search, row_queue, run_id,
+                                   writer_gone, page_budgets))
+        worker.start()
+        workers.append(worker)
+
+    pending = list(workers)
+    while pending:
+        for worker in list(pending):
+            worker.join(timeout=JOIN_POLL_SECONDS / len(pending))
+            if worker.is_alive():
+                continue
+            pending.remove(worker)
+            if worker.exitcode != 0 and writer.is_alive():
+                # 비정상 종료한 워커 대신 완료 신호를 보내 작성 프로세스가 멈추지 않도록 함
+                logger.error(f"❌ {worker.name} 비정상 종료 (exitcode={worker.exitcode})")
+                row_queue.put((MSG_WORKER_DONE, int(worker.name.rsplit('-', 1)[1]), {}))
+        if pending and not writer.is_alive() and writer.exitcode != 0:
+            # 정상 종료(0)는 모든 완료 신호를 받은 뒤이므로 남은 워커는 종료 중 → 그대로 join
+            logger.error(f"❌ DB 작성 프로세스 비정상 종료 (exitcode={writer.exitcode}) - 워커 {len(pending)}개 중단")
+            writer_gone.set()
+            for worker in pending:
+                worker.join(timeout=PUT_TIMEOUT * 2)
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+            pending = []
+
+    result = {'search_logs': [], 'worker_reports': {}, 'db_seconds': 0.0}
+    if not writer_gone.is_set():
+        # 결과를 기다리는 동안에도 작성 프로세스가 죽으면 바로 중단
+        waited = 0.0
+        while True:
+            try:
+                result = result_queue.get(timeout=JOIN_POLL_SECONDS)
+                break
+            except queue.Empty:
+                waited += JOIN_POLL_SECONDS
+                if not writer.is_alive() or waited >= RESULT_TIMEOUT:
+                    logger.error(f"❌ DB 작성 프로세스 응답 없음 (exitcode={writer.exitcode})")
+                    break
+    writer.join(timeout=JOIN_POLL_SECONDS)
+    if writer.is_alive():
+        writer.terminate()
+        writer.join()
+
+    overall_end = datetime.now()
+    duration = (overall_end - overall_start).total_seconds()
+    search_logs = result['search_logs']
+    merged = merge_reports(result['worker_reports'])
+    merged['seconds']['db'] = round(result['db_seconds'], 2)
+
+    total_found = sum(log['total_found'] for log in search_logs)
+    total_saved = sum(log['saved'] for log in search_logs)
+
+    # 샤드별 로그를 합친 실행 요약 행
+    crawler.save_crawling_log(
+        f"[sharded x{num_workers}] 전체", total_found, total_saved, merged['failed_requests'],
+        overall_start.strftime('%Y-%m-%d %H:%M:%S'), overall_end.strftime('%Y-%m-%d %H:%M:%S'), duration
+    )
+    logger.info(f"🎉 샤딩 크롤링 완료: {total_found}개 수집, {total_saved}개 저장, {duration:.1f}초")
+    logger.info(f"📈 요청 {merged['requests']}회, 실패 {merged['failed_requests']}회, "
+                f"DB {merged['seconds']['db']:.1f}초")
+
+    return {
+        'workers': num_workers,
+        'total_found': total_found,
+        'total_saved': total_saved,
+        'duration_seconds': duration,
+        'search_logs': search_logs,
+        'metrics': merged,
+    }
@@ -0,0 +1,440 @@
+"""
+스트리밍 단계 파이프라인 (fetch → parse → exclude → enrich → persist)
+
+전체 결과를 모았다가 마지막에 저장하는 대신, 단계 사이를 크기 제한 큐로 이어 항목 단위로 흘려보낸다.
+- 큐가 가득 차면 앞 단계가 기다림 (backpressure) → 메모리는 실행 길이와 무관하게 일정
+- 첫 항목이 모든 단계를 지나 저장되는 데 수 초 (마지막 단계 첫 출력 시각을 기록)
+- 단계마다 워커 수와 실행 방식 선택
+  · 'thread'  : 워커 스레드가 직접 실행 (네트워크/브라우저 대기, SQLite 쓰기)
+  · 'process' : 워커 스레드가 ProcessPoolExecutor 에 넘겨 실행 (HTML 파싱 등 CPU 작업, 함수는 pickle 가능해야 함)
+- 단계 함수가 None 을 반환하면 그 항목은 버림 (제외 필터), 예외는 기록 후 해당 항목만 버림
+
+크롤러별 파이프라인:
+    run_jumpit_pipeline   : 검색 페이지 요청+스트리밍 파싱 → DB 저장 (페이지 단위)
+    run_remember_pipeline : 목록 카드 → 상세 페이지 로드 → 필드 추출 → 제외 → 변경 감지 → CSV/웨어하우스 저장
+"""
+import csv
+import time
+import queue
+import random
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from log_setup import context_thread
+
+logger = logging.getLogger(__name__)
+
+THREAD = 'thread'
+PROCESS = 'process'
+
+# 단계 사이 큐 크기 (항목 수)
+DEFAULT_BUFFER = 32
+
+# 큐 종료 신호
+_END = object()
+
+
+@dataclass
+class StageStats:
+    name: str
+    mode: str
+    workers: int
+    items_in: int = 0
+    items_out: int = 0
+    dropped: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_backlog: int = 0  # 이 단계 입력 큐의 최대 적체
+    first_output_seconds: Optional[float] = None  # 파이프라인 시작 → 첫 출력
+
+    def summary(self) -> str:
+        first = f", 첫 출력 {self.first_output_seconds:.1f}초" if self.first_output_seconds is not None else ""
+        return (f"{self.name}({self.mode}×{self.workers}): 입력 {self.items_in}, 출력 {self.items_out}, "
+                f"버림 {self.dropped}, 오류 {self.errors}, 작업 {self.busy_seconds:.1f}초, "
+                f"최대 적체 {self.max_backlog}{first}")
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable
+    workers: int = 1
+    mode: str = THREAD
+    setup: Optional[Callable[[int], object]] = None     # 워커별 상태 생성 (thread 전용) → func(상태, 항목)
+    teardown: Optional[Callable[[object], None]] = None
+    initializer: Optional[Callable[[], None]] = None    # 프로세스 초기화 (process 전용)
+    stats: StageStats = field(init=False)
+
+    def __post_init__(self):
+        if self.mode not in (THREAD, PROCESS):
+            raise ValueError(f"알 수 없는 실행 방식: {self.mode}")
+        if self.mode == PROCESS and self.setup is not None:
+            raise ValueError("process 단계는 setup 대신 initializer 를 사용")
+        self.workers = max(1, self.workers)
+        self.stats = StageStats(self.name, self.mode, self.workers)
+
+
+class Pipeline:
+    """크기 제한 큐로 이어진 단계 파이프라인"""
+
+    def __init__(self, name: str, buffer_size: int = DEFAULT_BUFFER):
+        self.name = name
+        self.buffer_size = buffer_size
+        self.stages: List[Stage] = []
+
+    def stage(self, name: str, func: Callable, workers: int = 1, mode: str = THREAD,
+              setup: Optional[Callable[[int], object]] = None, teardown: Optional[Callable[[object], None]] = None,
+              initializer: Optional[Callable[[], None]] = None) -> 'Pipeline':
+        self.stages.append(Stage(name, func, workers, mode, setup, teardown, initializer))
+        return self
+
+    def run(self, source) -> List[StageStats]:
+        """
+        source 의 항목을 모든 단계에 흘려보내고 단계별 통계 반환 (마지막 단계 출력은 버림).
+        source 는 iterable 또는 emit 함수를 받아 항목을 넣는 생산자 함수 (콜백 방식 크롤러용)
+        """
+        if not self.stages:
+            raise ValueError("단계가 없습니다")
+        queues = [queue.Queue(maxsize=self.buffer_size) for _ in self.stages]
+        executors = {idx: ProcessPoolExecutor(max_workers=stage.workers, initializer=stage.initializer)
+                     for idx, stage in enumerate(self.stages) if stage.mode == PROCESS}
+        start = time.perf_counter()
+        threads = []
+        for idx, stage in enumerate(self.stages):
+            out_queue = queues[idx + 1] if idx + 1 < len(self.stages) else None
+            next_stage = self.stages[idx + 1] if idx + 1 < len(self.stages) else None
+            remaining = [stage.workers]  # 종료 신호를 받은 워커 수 (마지막 워커가 다음 단계에 전달)
+            lock = threading.Lock()
+            for worker_idx in range(stage.workers):
+                # run_id 등 로깅 컨텍스트를 워커 스레드로 전달
+                thread = context_thread(
+                    self._worker, name=f"{self.name}-{stage.name}-{worker_idx}",
+                    args=(stage, next_stage, worker_idx, queues[idx], out_queue, executors.get(idx),
+                          remaining, lock, start))
+                thread.start()
+                threads.append(thread)
+
+        first = self.stages[0]
+
+        def emit(item):
+            first.stats.max_backlog = max(first.stats.max_backlog, queues[0].qsize())
+            queues[0].put(item)  # 첫 단계 큐가 가득 차면 생산자도 대기
+
+        try:
+            if callable(source):
+                source(emit)
+            else:
+                for item in source:
+                    emit(item)
+        except Exception as e:
+            logger.error(f"❌ [{self.name}] 입력 생성 중 오류: {e}")
+        finally:
+            for _ in range(first.workers):
+                queues[0].put(_END)
+            for thread in threads:
+                thread.join()
+            for executor in executors.values():
+                executor.shutdown()
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"🧵 [{self.name}] 파이프라인 완료 - {elapsed:.1f}초")
+        for stage in self.stages:
+            logger.info(f"   {stage.stats.summary()}")
+        return [stage.stats for stage in self.stages]
+
+    @staticmethod
+    def _worker(stage: Stage, next_stage: Optional[Stage], worker_idx: int, in_queue: queue.Queue,
+                out_queue: Optional[queue.Queue], executor, remaining: List[int], lock: threading.Lock, start: float):
+        stats = stage.stats
+        state, ready = None, True
+        if stage.setup is not None:
+            try:
+                state = stage.setup(worker_idx)
+            except Exception as e:
+                # 종료 신호까지 큐는 계속 비워서 앞 단계가 막히지 않게 함
+                logger.error(f"❌ '{stage.name}' 워커 {worker_idx} 준비 실패: {e}")
+                ready = False
+
+        try:
+            while True:
+                item = in_queue.get()
+                if item is _END:
+                    break
+                with lock:
+                    stats.items_in += 1
+                if not ready:
+                    with lock:
+                        stats.errors += 1
+                    continue
+                busy_start = time.perf_counter()
+                try:
+                    if executor is not None:
+                        result = executor.submit(stage.func, item).result()
+                    elif stage.setup is not None:
+                        result = stage.func(state, item)
+                    else:
+                        result = stage.func(item)
+                except Exception as e:
+                    logger.warning(f"⚠️ '{stage.name}' 단계 오류: {e}")
+                    with lock:
+                        stats.errors += 1
+                    continue
+                finally:
+                    with lock:
+                        stats.busy_seconds += time.perf_counter() - busy_start
+
+                if result is None:
+                    with lock:
+                        stats.dropped += 1
+                    continue
+                with lock:
+                    stats.items_out += 1
+                    if stats.first_output_seconds is None:
+                        stats.first_output_seconds = time.perf_counter() - start
+                if out_queue is not None:
+                    next_stage.stats.max_backlog = max(next_stage.stats.max_backlog, out_queue.qsize())
+                    out_queue.put(result)  # 다음 단계 큐가 가득 차면 여기서 대기 (backpressure)
+        finally:
+            if stage.teardown is not None and ready:
+                try:
+                    stage.teardown(state)
+                except Exception as e:
+                    logger.warning(f"⚠️ '{stage.name}' 워커 {worker_idx} 정리 실패: {e}")
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last and out_queue is not None:
+                for _ in range(next_stage.workers):
+                    out_queue.put(_END)
+
+
+# ---------------------------------------------------------------------- 점핏
+
+MSG_ROWS = 'rows'
+MSG_SEARCH_DONE = 'search_done'
+
+
+def run_jumpit_pipeline(crawler, search_params: Dict[str, Dict], max_pages_per_search: int = 5,
+                        page_budgets: Optional[Dict[str, int]] = None, buffer_size: int = DEFAULT_BUFFER) -> Dict:
+    """
+    점핏: 검색 페이지 요청 + 스트리밍 파싱(생산자) → DB 저장 단계 (페이지 단위, SQLite 쓰기는 한 스레드)
+    페이지가 파싱되는 즉시 저장되고, 다음 페이지 요청/휴식은 저장과 겹쳐서 진행된다.
+    """
+    page_budgets = page_budgets or {}
+    saved_by_search: Counter = Counter()
+    totals = {'found': 0, 'saved': 0}
+
+    def fetch(emit):
+        names = list(search_params)
+        for idx, search_name in enumerate(names, 1):
+            logger.info(f"🔍 [{idx}/{len(names)}] '{search_name}' 검색 시작...")
+            search_start = datetime.now()
+            failed_before = crawler.metrics.get("failed_requests_total")
+            found = [0]
+
+            def send_page(page_jobs, search_name=search_name):
+                found[0] += len(page_jobs)
+                emit((MSG_ROWS, search_name, page_jobs))
+
+            try:
+                crawler.crawl_search_type(search_name, search_params[search_name],
+                                          page_budgets.get(search_name, max_pages_per_search),
+                                          page_callback=send_page, collect=False)
+            except Exception as e:
+                logger.error(f"❌ '{search_name}' 크롤링 중 오류: {e}")
+
+            search_end = datetime.now()
+            emit((MSG_SEARCH_DONE, search_name, {
+                'total_found': found[0],
+                'failed_requests': int(crawler.metrics.get("failed_requests_total") - failed_before),
+                'start_time': search_start.strftime('%Y-%m-%d %H:%M:%S'),
+                'end_time': search_end.strftime('%Y-%m-%d %H:%M:%S'),
+                'duration': (search_end - search_start).total_seconds(),
+            }))
+            if idx < len(names):
+                crawler.metrics.sleep(random.uniform(10, 20), "search_rest")
+
+    def persist(message):
+        kind, search_name, payload = message
+        if kind == MSG_ROWS:
+            with crawler.metrics.timed("db"):
+                saved = crawler.save_to_database(payload)
+            saved_by_search[search_name] += saved
+            totals['found'] += len(payload)
+            totals['saved'] += saved
+            return saved
+        # 같은 검색의 행은 모두 앞에서 저장됨 (단일 작성 스레드, FIFO)
+        crawler.save_crawling_log(search_name, payload['total_found'], saved_by_search[search_name],
+                                  payload['failed_requests'], payload['start_time'], payload['end_time'],
+                                  payload['duration'])
+        logger.info(f"✅ '{search_name}' 완료: {payload['total_found']}개 수집, {saved_by_search[search_name]}개 저장")
+        return search_name
+
+    pipeline = Pipeline("jumpit", buffer_size).stage("persist", persist)
+    stats = pipeline.run(fetch)
+    return {**totals, 'stages': stats}
+
+
+# ---------------------------------------------------------------------- 리멤버
+
+# 웨어하우스 적재 단위 (CSV 는 한 줄씩 바로 기록)
+WAREHOUSE_BATCH = 20
+
+
+def _extract_item(item: Dict, extractor=None) -> Optional[Dict]:
+    """
+    parse 단계: 상세 HTML → 필드 추출 (detail_archive 재추출 함수 재사용).
+    thread 모드는 워커별 추출기(extractor), process 모드는 initializer 로 만든 프로세스별 추출기를 쓴다.
+    """
+    if item.get('html') is None:
+        return item  # 재사용 / 기본 정보만 있는 항목은 그대로 통과
+    from detail_archive import _reextract_one, _reextract_with
+    job = item['job']
+    args = (job.get('공고ID', ''), job.get('link', ''), job, item['html'])
+    _, result, reason = _reextract_with(extractor, args) if extractor is not None else _reextract_one(args)
+    return {'job': job, 'card_hash': item['card_hash'], 'html': None, 'result': result, 'reason': reason}
+
+
+def run_remember_pipeline(crawler, jobs_per_category: int = 40, fetch_workers: int = 1,
+                          parse_mode: str = THREAD, parse_workers: int = 1, out: Optional[str] = None,
+                          warehouse_db: Optional[str] = None, buffer_size: int = DEFAULT_BUFFER) -> Dict:
+    """
+    리멤버: 목록 카드(생산자, crawler 의 드라이버) → fetch(상세 페이지, 워커별 브라우저) → parse(필드 추출)
+    → exclude(상세 제외 필터) → enrich(지문/변경 감지) → persist(CSV 한 줄씩 + 선택적으로 웨어하우스)
+    """
+    from enrichment import card_fingerprint
+    from detail_archive import _init_extractor
+    from detail_extraction import DetailExtractor
+    from category_parallel import PolitenessBudget
+
+    out = out or f"multi_job_category_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    category_counts: Counter = Counter()
+    workers: List = []
+    detail_loads: Counter = Counter()
+    lock = threading.Lock()
+    # fetch 워커들이 spawn_worker 로 물려받는 공유 politeness 예산 (목록 생산자도 같은 시간축 사용)
+    crawler.politeness = crawler.politeness or PolitenessBudget()
+
+    def listings(emit):
+        names = list(crawler.target_job_categories)
+        for idx, category_name in enumerate(names):
+            category_jobs = crawler.crawl_single_category(category_name, crawler.target_job_categories[category_name])
+            selected = category_jobs[:jobs_per_category]
+            logger.info(f"📊 '{category_name}': {len(selected)}개 선택 (전체 {len(category_jobs)}개 중)")
+            for job in selected:
+                emit(job)
+            if idx < len(names) - 1:
+                rest_time = random.uniform(30, 60)
+                logger.info(f"💤 다음 직무로 이동 전 휴식: {rest_time:.1f}초 (상세 수집은 계속 진행)")
+                time.sleep(rest_time)
+
+    def fetch_setup(worker_idx):
+        worker = crawler.spawn_worker(f"stream-{worker_idx}")
+        with lock:
+            workers.append(worker)
+        if not worker.setup_stealth_driver():
+            raise RuntimeError("드라이버 설정 실패")
+        return worker
+
+    def fetch(worker, job):
+        card_hash = card_fingerprint(job)
+        previous = worker.reuse_unchanged(job)
+        if previous is not None:
+            return {'job': job, 'card_hash': card_hash, 'html': None, 'result': previous, 'reused': True}
+        try:
+            html = worker.load_detail_page(job)
+        except Exception as e:
+            logger.debug(f"상세 페이지 처리 오류: {e}")
+            html = None
+        # 순차 모드와 같이 워커별로 상세 페이지 5개마다 중간 휴식
+        detail_loads[id(worker)] += 1
+        if detail_loads[id(worker)] % 5 == 0:
+            logger.info(f"💤 중간 휴식 중... ({detail_loads[id(worker)]}개 처리 완료)")
+            time.sleep(random.uniform(15, 25))
+        if html is None:
+            # 로드 실패 - 기본 정보만 저장
+            return {'job': job, 'card_hash': card_hash, 'html': None, 'result': worker.fallback_basic_job(job),
+                    'reason': '', 'reused': True}
+        return {'job': job, 'card_hash': card_hash, 'html': html}
+
+    def exclude(item):
+        if item.get('result') is None:
+            if item.get('reason', '').startswith("오류"):
+                # 추출 오류는 제외가 아님 - 기본 정보만 저장
+                logger.debug(f"상세 페이지 처리 오류: {item['reason']}")
+                basic_job = crawler.fallback_basic_job(item['job'])
+                return {**item, 'result': basic_job, 'reused': True} if basic_job is not None else None
+            if item.get('reason'):
+                logger.debug(f"상세 페이지에서 제외: {item['job'].get('공고명')} - {item['reason']}")
+                with lock:
+                    crawler.excluded_count += 1
+            return None
+        return item
+
+    def enrich(_, item):
+        if not item.get('reused'):
+            crawler.record_change(item['card_hash'], item['result'])
+        return item['result']
+
+    def close_archive(_):
+        if crawler.archive is not None:  # 보관소 연결은 이 스레드에서 열렸으므로 여기서 닫음
+            crawler.archive.close()
+            crawler.archive = None
+
+    warehouse = None
+    if warehouse_db:
+        from job_warehouse import JobWarehouse
+        warehouse = JobWarehouse(warehouse_db)
+
+    csv_file = open(out, 'w', newline='', encoding='utf-8-sig')
+    columns = [c for c in crawler.new_job_info('') if c not in ('link', 'crawled_at')] + ['필드출처', '내용해시']
+    writer = csv.DictWriter(csv_file, fieldnames=columns, extrasaction='ignore', restval='')
+    writer.writeheader()
+
+    def persist(batch, job):
+        writer.writerow(crawler.clean_job_row(job))
+        csv_file.flush()
+        category_counts[job.get('직무카테고리', '미분류')] += 1
+        if warehouse is not None:
+            batch.append(job)
+            if len(batch) >= WAREHOUSE_BATCH:
+                flush_warehouse(batch)
+        return job.get('공고ID') or True
+
+    def flush_warehouse(batch):
+        if warehouse is not None and batch:
+            warehouse.load_remember_jobs(batch)
+            batch.clear()
+
+    # parse 단계 추출기는 크롤러의 parser_backend 설정을 따름 (워커 스레드 / 프로세스마다 1개)
+    if parse_mode == PROCESS:
+        parse_func = _extract_item
+        parse_options = {'initializer': partial(_init_extractor, crawler.parser_backend)}
+    else:
+        parse_func = lambda extractor, item: _extract_item(item, extractor)
+        parse_options = {'setup': lambda _: DetailExtractor(crawler.parser_backend)}
+
+    pipeline = (Pipeline("remember", buffer_size)
+                .stage("fetch", fetch, workers=fetch_workers, setup=fetch_setup, teardown=lambda worker: worker.cleanup())
+                .stage("parse", parse_func, workers=parse_workers, mode=parse_mode, **parse_options)
+                .stage("exclude", exclude)
+                .stage("enrich", enrich, setup=lambda _: None, teardown=close_archive)
+                .stage("persist", persist, setup=lambda _: [], teardown=flush_warehouse))
+    try:
+        stats = pipeline.run(listings)
+    finally:
+        csv_file.close()
+        for worker in workers:
+            worker.cleanup()  # 준비 실패한 워커 (나머지는 fetch 단계 종료 시 정리됨)
+            crawler.merge_worker_stats(worker)
+
+    logger.info(f"📁 파일명: {out} (총 {sum(category_counts.values())}개)")
+    for category, count in category_counts.items():
+        logger.info(f"📊 {category}: {count}개")
+    return {'out': out, 'saved': sum(category_counts.values()), 'categories': dict(category_counts), 'stages': stats}
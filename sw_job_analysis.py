@@ -4,6 +4,8 @@ from collections import Counter
 import matplotlib.pyplot as plt
 import seaborn as sns
 import matplotlib.font_manager as fm
+from job_matcher import merge_job_sources
+from posting_snapshot import load_postings, SOURCE_RALLIT, SOURCE_REMEMBER_SW
 
 # 맥에서 한글 폰트 설정
 import platform
@@ -62,14 +64,18 @@ fm.fontManager.addfont('/System/Library/Fonts/AppleSDGothicNeo.ttc') if system =
 db_path = "job_dev_rallit_1.db"
 csv_path = "remember_sw.csv"
 
-# SQLite에서 jobs 테이블 불러오기
-conn = sqlite3.connect(db_path)
-job_df = pd.read_sql("SELECT title, jobSkillKeywords FROM jobs", conn)
-conn.close()
+def read_jobs_db():
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql("SELECT title, jobSkillKeywords FROM jobs", conn)
+    finally:
+        conn.close()
 
-# CSV 불러오기 (CP949 인코딩)
-csv_df = pd.read_csv(csv_path, encoding='cp949')
-csv_df = csv_df[['title', 'job_description', 'job_rank_category', 'job_role']]
+
+# 컬럼형 스냅샷(posting_snapshot.py write)이 있으면 필요한 컬럼만 읽고, 없으면 SQLite / CSV(CP949) 원본 사용
+job_df = load_postings(SOURCE_RALLIT, ['title', 'jobSkillKeywords'], read_jobs_db)
+csv_df = load_postings(SOURCE_REMEMBER_SW, ['title', 'job_description', 'job_rank_category', 'job_role'],
+                       lambda: pd.read_csv(csv_path, encoding='cp949'))
 csv_df = csv_df.rename(columns={
     "job_description": "description",
     "job_rank_category": "rank",
@@ -78,7 +84,8 @@ csv_df = csv_df.rename(columns={
 job_df = job_df.rename(columns={"jobSkillKeywords": "job_keywords"})
 
 # 병합 및 필터링 (소프트웨어 관련 공고 추출)
-combined_df = pd.merge(csv_df, job_df, on="title", how="outer")
+# 제목 정규화 + 퍼지 매칭으로 병합 (공백/기호 차이 허용, 중복 제목 행 증식 방지)
+combined_df = merge_job_sources(csv_df, job_df, on="title")
 sw_df = combined_df[combined_df['title'].str.contains("SW|소프트웨어|소프트|백엔드|프론트엔드|Frontend|Backend|개발", case=False, na=False)]
 
 # 결측치 처리
@@ -0,0 +1,380 @@
+"""
+분산 크롤링 작업 큐 (로컬 SQLite 브로커)
+
+- 생산자: 점핏 (search_name, page) 작업, 리멤버 카테고리 목록/상세 링크 작업을 등록
+- 소비자: 작업을 임대(lease)하고, 완료 시 ack, 실패 시 nack(백오프 후 재시도)
+- dedup_key UNIQUE 제약으로 같은 배치 안에서 중복 작업/중복 요청이 생기지 않음
+- 임대 만료된 작업(워커 다운)은 다른 워커가 다시 가져감
+
+단일 호스트 전용: 큐 DB 는 WAL 모드 SQLite 라 같은 머신의 여러 프로세스만 안전하게 공유한다
+(WAL 의 공유 메모리 인덱스는 NFS/SMB 같은 네트워크 파일시스템에서 동작하지 않음).
+여러 머신으로 나눌 때는 머신마다 별도 큐 DB 를 두고 검색 조건을 나눠 등록한다.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUE_JUMPIT_PAGES = 'jumpit_pages'
+QUEUE_REMEMBER_LISTINGS = 'remember_listings'
+QUEUE_REMEMBER_DETAILS = 'remember_details'
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def default_batch() -> str:
+    """중복 제거 단위 (기본: 하루 한 번 수집)"""
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+class WorkQueue:
+    """SQLite 기반 임대형 작업 큐"""
+
+    def __init__(self, db_path: str = "crawl_queue.db"):
+        self.db_path = db_path
+        self.init_database()
+
+    def connect(self) -> sqlite3.Connection:
+        # autocommit + busy timeout: 여러 프로세스가 동시에 접근해도 잠금 대기 후 진행
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def init_database(self):
+        conn = self.connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                queue TEXT NOT NULL,
+                dedup_key TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                available_at REAL NOT NULL,
+                last_error TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(queue, status, available_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_lease ON tasks(queue, status, lease_expires_at)")
+        conn.close()
+
+    # ------------------------------------------------------------------ 생산
+    def enqueue_many(self, queue: str, items: Iterable[tuple],
+                     max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """(dedup_key, payload) 목록 등록. 이미 있는 dedup_key 는 무시하고 신규 등록 수 반환"""
+        now = time.time()
+        rows = [(queue, key, json.dumps(payload, ensure_ascii=False), max_attempts, now)
+                for key, payload in items]
+        conn = self.connect()
+        try:
+            before = conn.total_changes
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany('''
+                INSERT OR IGNORE INTO tasks (queue, dedup_key, payload, max_attempts, available_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            conn.execute("COMMIT")
+            return conn.total_changes - before
+        finally:
+            conn.close()
+
+    def enqueue(self, queue: str, dedup_key: str, payload: Dict, **kwargs) -> bool:
+        return self.enqueue_many(queue, [(dedup_key, payload)], **kwargs) == 1
+
+    # ------------------------------------------------------------------ 소비
+    def lease(self, queue: str, worker_id: str,
+              lease_seconds: int = DEFAULT_LEASE_SECONDS) -> Optional[Dict]:
+        """대기 작업(또는 임대 만료 작업) 하나를 원자적으로 임대"""
+        now = time.time()
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            # 재시도 한도를 넘긴 만료 작업은 dead 처리
+            conn.execute('''
+                UPDATE tasks SET status = 'dead', last_error = 'lease expired', updated_at = CURRENT_TIMESTAMP
+                WHERE queue = ? AND status = 'leased' AND lease_expires_at < ? AND attempts >= max_attempts
+            ''', (queue, now))
+            row = conn.execute('''
+                UPDATE tasks
+                SET status = 'leased', attempts = attempts + 1, lease_owner = ?,
+                    lease_expires_at = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = (
+                    SELECT id FROM tasks
+                    WHERE queue = ?
+                      AND ((status = 'pending' AND available_at <= ?)
+                           OR (status = 'leased' AND lease_expires_at < ?))
+                    ORDER BY available_at, id
+                    LIMIT 1
+                )
+                RETURNING id, dedup_key, payload, attempts
+            ''', (worker_id, now + lease_seconds, queue, now, now)).fetchone()
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        if row is None:
+            return None
+        return {'id': row['id'], 'dedup_key': row['dedup_key'],
+                'payload': json.loads(row['payload']), 'attempts': row['attempts']}
+
+    def heartbeat(self, task_id: int, worker_id: str, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> bool:
+        """장시간 작업의 임대 연장"""
+        conn = self.connect()
+        try:
+            cursor = conn.execute('''
+                UPDATE tasks SET lease_expires_at = ?
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+            ''', (time.time() + lease_seconds, task_id, worker_id))
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def ack(self, task_id: int, worker_id: str) -> bool:
+        """완료 처리 (임대한 워커만 가능 - 만료 후 재임대된 작업은 무시)"""
+        conn = self.connect()
+        try:
+            cursor = conn.execute('''
+                UPDATE tasks SET status = 'done', lease_owner = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+            ''', (task_id, worker_id))
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def nack(self, task_id: int, worker_id: str, error: str = "", retry_delay: float = 60.0) -> bool:
+        """실패 처리: 재시도 가능하면 지수 백오프 후 pending, 아니면 dead"""
+        conn = self.connect()
+        try:
+            cursor = conn.execute('''
+                UPDATE tasks
+                SET status = CASE WHEN attempts >= max_attempts THEN 'dead' ELSE 'pending' END,
+                    available_at = ? + ? * (1 << (attempts - 1)),
+                    lease_owner = NULL, lease_expires_at = NULL,
+                    last_error = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND status = 'leased' AND lease_owner = ?
+            ''', (time.time(), retry_delay, error[:500], task_id, worker_id))
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def skip(self, queue: str, dedup_keys: List[str]) -> int:
+        """아직 대기 중인 작업을 건너뜀 처리 (예: 마지막 페이지 이후 페이지)"""
+        if not dedup_keys:
+            return 0
+        conn = self.connect()
+        try:
+            cursor = conn.executemany('''
+                UPDATE tasks SET status = 'skipped', updated_at = CURRENT_TIMESTAMP
+                WHERE queue = ? AND dedup_key = ? AND status = 'pending'
+            ''', [(queue, key) for key in dedup_keys])
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """큐별 상태 집계"""
+        conn = self.connect()
+        try:
+            result = {}
+            for row in conn.execute("SELECT queue, status, COUNT(*) AS n FROM tasks GROUP BY queue, status"):
+                result.setdefault(row['queue'], {})[row['status']] = row['n']
+            return result
+        finally:
+            conn.close()
+
+
+# ---------------------------------------------------------------------- 생산자
+def jumpit_page_key(batch: str, search_name: str, page: int) -> str:
+    return f"jumpit:{batch}:{search_name}:{page}"
+
+
+def enqueue_jumpit_pages(wq: WorkQueue, search_params: Dict[str, Dict], max_pages: int = 5,
+                         batch: Optional[str] = None, max_limit: Optional[int] = None) -> int:
+    """
+    점핏 (search_name, page) 작업 등록.
+    max_pages 는 기본 페이지 크기 기준 수집 예산, max_limit 은 확인된 최대 limit (crawler.get_page_limit).
+    페이지 번호는 limit 에 따라 의미가 달라지므로 limit 은 등록 시 정해 payload 에 고정한다.
+    """
+    from jumpfit import plan_page_limit
+
+    batch = batch or default_batch()
+    limit, pages = plan_page_limit(max_pages, max_limit)
+    items = [
+        (jumpit_page_key(batch, search_name, page),
+         {'search_name': search_name, 'params': params, 'page': page,
+          'batch': batch, 'max_pages': pages, 'limit': limit})
+        for search_name, params in search_params.items()
+        for page in range(1, pages + 1)
+    ]
+    count = wq.enqueue_many(QUEUE_JUMPIT_PAGES, items)
+    logger.info(f"📥 점핏 페이지 작업 {count}개 등록 (전체 {len(items)}개, limit {limit}, 배치 {batch})")
+    return count
+
+
+def enqueue_remember_listings(wq: WorkQueue, target_job_categories: Dict[str, str],
+                              batch: Optional[str] = None) -> int:
+    """리멤버 직무 카테고리 목록 작업 등록"""
+    batch = batch or default_batch()
+    items = [(f"remember_list:{batch}:{name}", {'category_name': name, 'category_url': url})
+             for name, url in target_job_categories.items()]
+    return wq.enqueue_many(QUEUE_REMEMBER_LISTINGS, items)
+
+
+def enqueue_remember_details(wq: WorkQueue, jobs: List[Dict], batch: Optional[str] = None) -> int:
+    """리멤버 상세 링크 작업 등록 (공고ID 기준 중복 제거)"""
+    batch = batch or default_batch()
+    items = [(f"remember_detail:{batch}:{job.get('공고ID') or job.get('link')}", job)
+             for job in jobs if job.get('link')]
+    count = wq.enqueue_many(QUEUE_REMEMBER_DETAILS, items)
+    logger.info(f"📥 리멤버 상세 작업 {count}개 등록 (전체 {len(items)}개)")
+    return count
+
+
+# ---------------------------------------------------------------------- 소비자
+def run_jumpit_consumer(wq: WorkQueue, db_name: str = "jumpit_jobs.db",
+                        worker_id: Optional[str] = None, idle_exit_seconds: float = 30.0) -> int:
+    """점핏 페이지 작업 소비: 요청 → 파싱 → 저장 → ack"""
+    from jumpfit import JumpitCrawler, DEFAULT_PAGE_LIMIT
+
+    worker_id = worker_id or default_worker_id()
+    crawler = JumpitCrawler(db_name)
+    processed = 0
+    idle_since = time.time()
+
+    while True:
+        task = wq.lease(QUEUE_JUMPIT_PAGES, worker_id)
+        if task is None:
+            if time.time() - idle_since > idle_exit_seconds:
+                break
+            time.sleep(2)
+            continue
+        idle_since = time.time()
+
+        payload = task['payload']
+        # limit 미기록 작업(이전 버전 등록분)은 기본 페이지 크기 - 같은 배치의 다른 페이지와 어긋나지 않도록
+        request_params = {"highlight": "false", "page": payload['page'],
+                          "limit": payload.get('limit', DEFAULT_PAGE_LIMIT)}
+        request_params.update(payload['params'])
+        try:
+            response_data = crawler.make_safe_request(crawler.base_api_url, request_params)
+            if response_data is None:
+                wq.nack(task['id'], worker_id, "request failed")
+                continue
+            jobs_list, total_count = crawler.extract_positions(response_data, payload['page'])
+            jobs = crawler.parse_positions(jobs_list, payload['search_name'])
+            # save_to_database 는 실패 시 예외 대신 0 을 반환 → 덜 저장됐으면 재시도 (ack 하면 페이지 유실)
+            saved = crawler.save_to_database(jobs)
+            if saved < len(jobs):
+                wq.nack(task['id'], worker_id, f"db save failed ({saved}/{len(jobs)})")
+                continue
+            wq.ack(task['id'], worker_id)
+            processed += 1
+
+            # 마지막 페이지를 알게 되면 그 이후 페이지 작업은 요청하지 않음
+            if not jobs_list:
+                last_page = payload['page'] - 1
+            elif total_count:
+                last_page = -(-total_count // request_params["limit"])
+            else:
+                last_page = payload['max_pages']
+            wq.skip(QUEUE_JUMPIT_PAGES, [
+                jumpit_page_key(payload['batch'], payload['search_name'], page)
+                for page in range(last_page + 1, payload['max_pages'] + 1)
+            ])
+        except Exception as e:
+            logger.error(f"❌ 작업 {task['dedup_key']} 실패: {e}")
+            wq.nack(task['id'], worker_id, str(e))
+
+    logger.info(f"✅ 점핏 소비자 종료: {processed}개 작업 처리 ({worker_id})")
+    return processed
+
+
+def run_remember_consumer(wq: WorkQueue, worker_id: Optional[str] = None,
+                          idle_exit_seconds: float = 60.0) -> int:
+    """리멤버 작업 소비: 카테고리 목록 → 상세 작업 생산, 상세 작업 → 상세 정보 수집"""
+    from JD import MultiJobCategoryCrawler
+
+    worker_id = worker_id or default_worker_id()
+    crawler = MultiJobCategoryCrawler()
+    if not crawler.setup_stealth_driver():
+        return 0
+
+    processed = 0
+    idle_since = time.time()
+    try:
+        while True:
+            # 목록 작업을 먼저 처리해 상세 작업을 빨리 채움
+            task = wq.lease(QUEUE_REMEMBER_LISTINGS, worker_id, lease_seconds=1800)
+            queue_name = QUEUE_REMEMBER_LISTINGS
+            if task is None:
+                task = wq.lease(QUEUE_REMEMBER_DETAILS, worker_id)
+                queue_name = QUEUE_REMEMBER_DETAILS
+            if task is None:
+                if time.time() - idle_since > idle_exit_seconds:
+                    break
+                time.sleep(5)
+                continue
+            idle_since = time.time()
+
+            payload = task['payload']
+            try:
+                if queue_name == QUEUE_REMEMBER_LISTINGS:
+                    jobs = crawler.crawl_single_category(payload['category_name'], payload['category_url'])
+                    enqueue_remember_details(wq, jobs)
+                else:
+                    crawler.job_data.extend(crawler.enhance_with_detailed_info([payload], max_detail=1))
+                wq.ack(task['id'], worker_id)
+                processed += 1
+            except Exception as e:
+                logger.error(f"❌ 작업 {task['dedup_key']} 실패: {e}")
+                wq.nack(task['id'], worker_id, str(e))
+
+        crawler.save_complete_results()
+    finally:
+        crawler.cleanup()
+
+    logger.info(f"✅ 리멤버 소비자 종료: {processed}개 작업 처리 ({worker_id})")
+    return processed
+
+
+def main():
+    """사용법: python work_queue.py [produce|jumpit|remember|stats] [큐 DB 경로]"""
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    wq = WorkQueue(sys.argv[2] if len(sys.argv) > 2 else "crawl_queue.db")
+
+    if command == "produce":
+        from jumpfit import JumpitCrawler
+        from JD import MultiJobCategoryCrawler
+        jumpit = JumpitCrawler(init_db=False)
+        enqueue_jumpit_pages(wq, jumpit.search_params, max_limit=jumpit.get_page_limit(jumpit.base_api_url))
+        enqueue_remember_listings(wq, MultiJobCategoryCrawler().target_job_categories)
+    elif command == "jumpit":
+        run_jumpit_consumer(wq)
+    elif command == "remember":
+        run_remember_consumer(wq)
+
+    for queue_name, counts in wq.stats().items():
+        print(f"📊 {queue_name}: {counts}")
+
+
+if __name__ == "__main__":
+    main()